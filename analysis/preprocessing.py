@@ -2,23 +2,56 @@
 Image preprocessing for sprout analysis
 """
 
-import os
 import cv2
+from functools import lru_cache
 import numpy as np
 import logging
+from typing import Optional
 
 from sproutcv.config import ImageProcessingConfig
 from sproutcv.exceptions import ImageLoadError, ProcessingError
+from sproutcv.io.image_io import read_image
 
 logger = logging.getLogger('sproutcv.preprocessing')
 
+_MORPH_SHAPES = {
+    'ELLIPSE': cv2.MORPH_ELLIPSE,
+    'RECT': cv2.MORPH_RECT,
+    'CROSS': cv2.MORPH_CROSS,
+}
 
-def preprocess_image(image_path: str) -> tuple:
+
+@lru_cache(maxsize=None)
+def _get_kernel(shape: str, kernel_size: tuple) -> np.ndarray:
+    """
+    Get a (cached) morphological structuring element
+    
+    Args:
+        shape: One of 'ELLIPSE', 'RECT' or 'CROSS'
+        kernel_size: (width, height) of the kernel
+    
+    Returns:
+        np.ndarray: Structuring element
+    
+    Raises:
+        ProcessingError: If shape is not a valid morphology shape
+    """
+    if shape not in _MORPH_SHAPES:
+        raise ProcessingError(
+            f"Invalid MORPHOLOGY_SHAPE: {shape}. Must be one of {set(_MORPH_SHAPES)}"
+        )
+    return cv2.getStructuringElement(_MORPH_SHAPES[shape], kernel_size)
+
+
+def preprocess_image(image_path: str,
+                     image: Optional[np.ndarray] = None) -> tuple:
     """
     Preprocess image for sprout detection
     
     Args:
         image_path: Path to input image
+        image: Optional already-decoded BGR image for image_path; if given,
+            the file is not read again
     
     Returns:
         tuple: (original_image, binary_image, grayscale_image)
@@ -30,31 +63,32 @@ def preprocess_image(image_path: str) -> tuple:
         ImageLoadError: If image doesn't exist or cannot be loaded
         ProcessingError: If preprocessing fails
     """
-    # Validate file exists
-    if not os.path.exists(image_path):
-        logger.error(f"Image not found: {image_path}")
-        raise ImageLoadError(f"Image not found: {image_path}")
-    
-    # Load image
-    logger.debug(f"Loading image: {image_path}")
-    image = cv2.imread(image_path)
-    
     if image is None:
-        logger.error(f"Failed to load image: {image_path}")
-        raise ImageLoadError(f"Failed to load image: {image_path}")
+        # Load image
+        logger.debug(f"Loading image: {image_path}")
+        image = read_image(image_path)
     
     if image.size == 0 or image.shape[0] == 0 or image.shape[1] == 0:
         logger.error(f"Image has invalid dimensions: {image_path}")
         raise ImageLoadError(f"Image has invalid dimensions: {image_path}")
     
     try:
-        # Apply mean shift filtering for noise reduction
-        logger.debug("Applying mean shift filtering")
-        shifted = cv2.pyrMeanShiftFiltering(
-            image,
-            sp=ImageProcessingConfig.MEAN_SHIFT_SP,
-            sr=ImageProcessingConfig.MEAN_SHIFT_SR
-        )
+        # Edge-preserving noise reduction
+        if ImageProcessingConfig.USE_FAST_DENOISE:
+            logger.debug("Applying bilateral filtering")
+            shifted = cv2.bilateralFilter(
+                image,
+                d=ImageProcessingConfig.BILATERAL_DIAMETER,
+                sigmaColor=ImageProcessingConfig.MEAN_SHIFT_SR,
+                sigmaSpace=ImageProcessingConfig.MEAN_SHIFT_SP
+            )
+        else:
+            logger.debug("Applying mean shift filtering")
+            shifted = cv2.pyrMeanShiftFiltering(
+                image,
+                sp=ImageProcessingConfig.MEAN_SHIFT_SP,
+                sr=ImageProcessingConfig.MEAN_SHIFT_SR
+            )
         
         # Convert to grayscale
         logger.debug("Converting to grayscale")
@@ -78,30 +112,25 @@ def preprocess_image(image_path: str) -> tuple:
         )
         
         # Morphological operations to clean up
-        kernel_size = ImageProcessingConfig.MORPHOLOGY_KERNEL_SIZE
-        
-        valid_shapes = {'ELLIPSE', 'RECT', 'CROSS'}
-        shape = ImageProcessingConfig.MORPHOLOGY_SHAPE
-
-        if shape not in valid_shapes:
-            raise ProcessingError(
-                f"Invalid MORPHOLOGY_SHAPE: {shape}. Must be one of {valid_shapes}"
-            )
-
-        if shape == 'ELLIPSE':
-            kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, kernel_size)
-        elif shape == 'RECT':
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, kernel_size)
-        else:  # CROSS
-            kernel = cv2.getStructuringElement(cv2.MORPH_CROSS, kernel_size)
+        kernel = _get_kernel(
+            ImageProcessingConfig.MORPHOLOGY_SHAPE,
+            tuple(ImageProcessingConfig.MORPHOLOGY_KERNEL_SIZE)
+        )
         
-        # Close gaps
+        # Close gaps (into a scratch buffer)
         logger.debug("Applying morphological closing")
-        cleaned = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        closed = np.empty_like(binary)
+        cv2.morphologyEx(
+            binary, cv2.MORPH_CLOSE, kernel,
+            dst=closed, borderType=cv2.BORDER_REPLICATE
+        )
         
-        # Remove small noise
+        # Remove small noise (back into the threshold buffer)
         logger.debug("Applying morphological opening")
-        cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_OPEN, kernel)
+        cleaned = cv2.morphologyEx(
+            closed, cv2.MORPH_OPEN, kernel,
+            dst=binary, borderType=cv2.BORDER_REPLICATE
+        )
         
         logger.info("Preprocessing completed successfully")
         return image, cleaned, gray
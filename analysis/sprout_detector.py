@@ -4,22 +4,52 @@ Enhanced sprout detection with separate overlay data export
 
 import cv2
 import numpy as np
-import networkx as nx
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from skimage.morphology import skeletonize
 from typing import Dict, Any, List, Tuple
 
-from sproutcv.config import ImageProcessingConfig, VisualizationConfig
+from sproutcv.config import ImageProcessingConfig, VisualizationConfig, GraphConfig
 from sproutcv.exceptions import ProcessingError
 from sproutcv.utils.graph_utils import (
-    build_graph_from_skeleton,
+    trace_skeleton_path,
     simplify_path,
-    reconnect_path,
-    find_farthest_nodes
+    path_length
+)
+from sproutcv.utils.skeleton_numba import (
+    longest_skeleton_path,
+    simplify_skeleton_path,
+    NUMBA_AVAILABLE
 )
 
 logger = logging.getLogger('sproutcv.detector')
 
+# cv2.ximgproc ships with opencv-contrib-python; fall back to skimage without it
+_HAS_XIMGPROC = hasattr(cv2, 'ximgproc')
+
+
+def skeletonize_mask(mask: np.ndarray) -> np.ndarray:
+    """
+    Skeletonize a binary mask
+    
+    Args:
+        mask: Binary uint8 mask (255 = foreground, 0 = background)
+    
+    Returns:
+        np.ndarray: uint8 skeleton image (255 = skeleton, 0 = background)
+    """
+    if _HAS_XIMGPROC:
+        return cv2.ximgproc.thinning(
+            mask,
+            thinningType=cv2.ximgproc.THINNING_ZHANGSUEN
+        )
+    # skeletonize casts non-zero to True itself; rescale its bool output in
+    # place through a uint8 view instead of astype + multiply temporaries
+    skeleton = skeletonize(mask).view(np.uint8)
+    skeleton *= 255
+    return skeleton
+
 
 def analyze_sprouts(image, cleaned, gray, mm_to_pixel_ratio):
     """
@@ -67,30 +97,59 @@ def analyze_sprouts(image, cleaned, gray, mm_to_pixel_ratio):
         # Enhanced: separate overlay data
         overlay_data = {
             'contours': [],
-            'skeleton_paths': [],
-            'skeleton_points': [],  # NEW: Store actual skeleton points
+            'skeleton_paths': [],  # Path arrays (float64, N x 2, y/x)
+            'skeleton_points': [],  # Skeleton pixel arrays (int32, N x 2, y/x)
             'labels': [],
             'contour_mask': np.zeros_like(gray)
         }
         
-        used_label_boxes = []
+        # Label boxes (x1, y1, x2, y2); row k belongs to sprout k + 1
+        n_contours = sum(len(row) for row in contour_groups)
+        used_label_boxes = np.empty((n_contours, 4), dtype=np.int32)
         sprout_index = 1
         
-        # Process each row of sprouts
-        for row in contour_groups:
-            # Sort left to right within row
-            row.sort(key=lambda x: x[1])  # Sort by cx
+        # Label text sizes keyed by label length (see _label_text_size)
+        label_sizes = {}
+        
+        # Rows are already sorted left to right by detect_and_group_contours
+        sprouts = [
+            (contour, cx, cy, i)
+            for row in contour_groups
+            for i, (contour, cx, cy) in enumerate(row)
+        ]
+        
+        # Skeletonize and trace all sprouts concurrently. Thread count
+        # follows OpenCV's, which pipeline workers pin to 1 when files are
+        # already processed in parallel. Each thread reuses its own
+        # scratch buffer for fill masks.
+        n_threads = max(1, min(cv2.getNumThreads(), len(sprouts)))
+        local = threading.local()
+        
+        def trace(contour):
+            scratch_mask = getattr(local, 'scratch_mask', None)
+            if scratch_mask is None:
+                scratch_mask = local.scratch_mask = np.zeros_like(gray)
+            return _process_sprout(contour, scratch_mask, h, w)
+        
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            futures = [executor.submit(trace, s[0]) for s in sprouts]
             
-            for i, (contour, cx, cy) in enumerate(row):
+            # Merge in sprout order; label placement depends on earlier labels
+            for (contour, cx, cy, i), future in zip(sprouts, futures):
+                try:
+                    traced = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to trace sprout at ({cx}, {cy}): {e}")
+                    traced = None
+                
                 try:
-                    # Analyze single sprout
                     result = analyze_single_sprout_enhanced(
-                        contour, cx, cy,
-                        gray, output_image, skeleton_image,
+                        contour, cx, cy, traced,
+                        output_image, skeleton_image,
                         mm_to_pixel_ratio, sprout_index,
                         font_scale, thickness,
                         used_label_boxes, i, h, w,
-                        overlay_data
+                        overlay_data, label_sizes
                     )
                     
                     if result:
@@ -101,6 +160,15 @@ def analyze_sprouts(image, cleaned, gray, mm_to_pixel_ratio):
                     logger.warning(f"Failed to process sprout at ({cx}, {cy}): {e}")
                     continue
         
+        # Draw all contours on the separate mask in one pass
+        cv2.drawContours(
+            overlay_data['contour_mask'],
+            overlay_data['contours'],
+            -1,
+            255,
+            2
+        )
+        
         logger.info(f"Successfully analyzed {len(sprout_data)} sprouts")
         return output_image, skeleton_image, sprout_data, overlay_data
         
@@ -118,7 +186,8 @@ def detect_and_group_contours(binary_image, image_height):
         image_height: Height of image for row tolerance
     
     Returns:
-        list: List of rows, each containing list of (contour, cx, cy) tuples
+        list: List of rows (top to bottom), each containing list of
+            (contour, cx, cy) tuples sorted left to right
     """
     contours, _ = cv2.findContours(
         binary_image,
@@ -128,71 +197,193 @@ def detect_and_group_contours(binary_image, image_height):
     
     # Filter and extract centroids
     valid_contours = []
+    min_aspect = ImageProcessingConfig.MIN_CONTOUR_ASPECT_RATIO
     
     for contour in contours:
         # Filter by minimum area
         if cv2.contourArea(contour) < ImageProcessingConfig.MIN_CONTOUR_AREA:
             continue
         
-        # Calculate centroid
-        M = cv2.moments(contour)
-        if M["m00"] == 0:
-            continue
+        # Optionally reject blob-like contours before the costly skeleton
+        # analysis
+        if min_aspect > 0:
+            rect_w, rect_h = cv2.minAreaRect(contour)[1]
+            if max(rect_w, rect_h) < min_aspect * max(min(rect_w, rect_h), 1.0):
+                continue
         
-        cx = int(M["m10"] / M["m00"])
-        cy = int(M["m01"] / M["m00"])
+        # Approximate centroid by the bounding box center (the area filter
+        # above already rules out degenerate contours)
+        x, y, w, h = cv2.boundingRect(contour)
+        cx = x + w // 2
+        cy = y + h // 2
         
         valid_contours.append((contour, cx, cy))
     
-    # Group into rows
-    row_tolerance = int(image_height * ImageProcessingConfig.ROW_TOLERANCE_RATIO)
+    if not valid_contours:
+        return []
+    
+    # Group into rows: sort by y; each row is anchored at its topmost
+    # centroid and takes every centroid less than the tolerance below it
+    row_tolerance = max(1, int(image_height * ImageProcessingConfig.ROW_TOLERANCE_RATIO))
+    
+    cxs = np.fromiter((cx for _, cx, _ in valid_contours), dtype=np.int32)
+    cys = np.fromiter((cy for _, _, cy in valid_contours), dtype=np.int32)
+    
+    y_order = np.argsort(cys, kind='stable')
+    sorted_cys = cys[y_order]
+    row_ids = np.empty(len(cys), dtype=np.int32)
+    start = 0
+    row = 0
+    while start < len(sorted_cys):
+        end = int(np.searchsorted(sorted_cys, sorted_cys[start] + row_tolerance))
+        row_ids[y_order[start:end]] = row
+        start = end
+        row += 1
+    
+    # Sort by (row, cx, cy) and split at row boundaries
+    order = np.lexsort((cys, cxs, row_ids))
+    splits = np.flatnonzero(np.diff(row_ids[order])) + 1
+    
+    rows = [
+        [valid_contours[j] for j in chunk]
+        for chunk in np.split(order, splits)
+    ]
+    
+    return rows
+
+
+def _process_sprout(contour, scratch_mask, img_h, img_w):
+    """
+    Skeletonize a single sprout and trace its longest path
+    
+    Only reads the contour and touches scratch_mask within the sprout's
+    bounding box, so sprouts can be processed concurrently as long as each
+    thread has its own scratch buffer.
+    
+    Args:
+        contour: OpenCV contour
+        scratch_mask: Zeroed image-sized uint8 buffer; the sprout's region
+            is used as its fill mask and zeroed again before returning
+        img_h, img_w: Image dimensions
+    
+    Returns:
+        tuple: (bbox, skeleton, skeleton_points, simplified_path, pixel_length)
+            - bbox (tuple): (x0, y0, x1, y1) region covered by skeleton
+            - skeleton (np.ndarray): uint8 skeleton of the bbox region
+            - skeleton_points (np.ndarray): int32 (N, 2) y/x image coordinates
+            - simplified_path (np.ndarray or None): float64 (N, 2) y/x image
+              coordinates, None if no path could be traced
+            - pixel_length (float or None): Path length in pixels
+    """
+    # Crop to the contour's bounding box (1px padding) so the mask,
+    # skeleton and graph only cover this sprout's region
+    bx, by, bw, bh = cv2.boundingRect(contour)
+    x0, y0 = max(bx - 1, 0), max(by - 1, 0)
+    x1, y1 = min(bx + bw + 1, img_w), min(by + bh + 1, img_h)
+    bbox = (x0, y0, x1, y1)
+    
+    # Create mask for this contour in the scratch buffer's ROI
+    mask = scratch_mask[y0:y1, x0:x1]
+    cv2.drawContours(mask, [contour], -1, 255, -1, offset=(-x0, -y0))
+    
+    # Skeletonize, then clear the ROI for the next sprout
+    try:
+        skeleton = skeletonize_mask(mask)
+    finally:
+        mask[:] = 0
     
-    # Sort by y-coordinate
-    valid_contours.sort(key=lambda x: x[2])
+    # Skeleton points for this sprout (image coordinates)
+    skeleton_points = np.argwhere(skeleton).astype(np.int32) + (y0, x0)
     
-    rows = []
-    for contour_data in valid_contours:
-        _, _, cy = contour_data
+    if NUMBA_AVAILABLE:
+        # Walk the skeleton pixels directly
+        path = longest_skeleton_path(skeleton)
         
-        # Try to add to existing row
-        added = False
-        for row in rows:
-            _, _, row_cy = row[0]
-            
-            if abs(row_cy - cy) < row_tolerance:
-                row.append(contour_data)
-                added = True
-                break
+        if len(path) < 2:
+            return bbox, skeleton, skeleton_points, None, None
+        
+        # Simplify and measure path
+        simplified_path = simplify_skeleton_path(
+            path, GraphConfig.PATH_SIMPLIFICATION_TOLERANCE
+        )
+        pixel_length = path_length(simplified_path)
+    else:
+        # Walk the skeleton's pixel graph as arrays
+        try:
+            path = trace_skeleton_path(skeleton)
+        except ValueError as e:
+            logger.debug(f"Graph analysis failed for sprout at ({x0}, {y0}): {e}")
+            return bbox, skeleton, skeleton_points, None, None
         
-        # Create new row if needed
-        if not added:
-            rows.append([contour_data])
+        if len(path) < 2:
+            return bbox, skeleton, skeleton_points, None, None
+        
+        # Simplify and measure path; simplified points are skeleton
+        # pixels, so chord lengths match the graph's edge weights
+        simplified_path = simplify_path(path)
+        pixel_length = path_length(simplified_path)
     
-    return rows
+    # Shift path from ROI back to image coordinates
+    simplified_path = np.asarray(simplified_path, dtype=np.float64) + (y0, x0)
+    
+    return bbox, skeleton, skeleton_points, simplified_path, pixel_length
+
+
+def _label_text_size(label_text, font_scale, thickness, cache):
+    """
+    Measure a sprout label, reusing earlier measurements of the same length
+    
+    Labels only differ in their digits, and all digits of the Hershey
+    simplex font share one advance width, so labels of equal length render
+    at exactly the same size for a given font scale and thickness.
+    
+    Args:
+        label_text: Label string ("<index>: <length> mm")
+        font_scale, thickness: Text rendering parameters (fixed per cache)
+        cache: Dictionary mapping label length to (width, height)
+    
+    Returns:
+        tuple: (text_width, text_height)
+    """
+    size = cache.get(len(label_text))
+    if size is None:
+        size, _ = cv2.getTextSize(
+            label_text,
+            cv2.FONT_HERSHEY_SIMPLEX,
+            font_scale,
+            thickness
+        )
+        cache[len(label_text)] = size
+    return size
 
 
 def analyze_single_sprout_enhanced(
-    contour, cx, cy, gray, output_image, skeleton_image,
+    contour, cx, cy, traced, output_image, skeleton_image,
     mm_to_pixel_ratio, index, font_scale, thickness,
     used_boxes, row_position, img_h, img_w,
-    overlay_data
+    overlay_data, label_sizes
 ):
     """
-    Analyze a single sprout and save overlay data
+    Draw and label a single traced sprout and save overlay data
+    
+    Must be called in sprout order, since label placement avoids the
+    labels of earlier sprouts.
     
     Args:
         contour: OpenCV contour
         cx, cy: Centroid coordinates
-        gray: Grayscale image
+        traced: Result of _process_sprout, or None if tracing failed
         output_image: Output image to draw on
         skeleton_image: Skeleton accumulator image
         mm_to_pixel_ratio: Pixel to mm conversion
         index: Sprout number
         font_scale, thickness: Text rendering parameters
-        used_boxes: List of used label bounding boxes
+        used_boxes: Preallocated (N, 4) int array of label bounding boxes;
+            rows before index - 1 are in use, row index - 1 is filled here
         row_position: Position in row (for label placement)
         img_h, img_w: Image dimensions
         overlay_data: Dictionary to store overlay information
+        label_sizes: Per-image text size cache for _label_text_size
     
     Returns:
         list or None: [index, pixel_length, mm_length] if successful, None otherwise
@@ -206,52 +397,27 @@ def analyze_single_sprout_enhanced(
         2
     )
     
-    # Draw contour on separate mask
-    cv2.drawContours(
-        overlay_data['contour_mask'],
-        [contour],
-        -1,
-        255,
-        2
-    )
-    
-    # Store contour data
+    # Store contour data (drawn onto the contour mask by analyze_sprouts)
     overlay_data['contours'].append(contour)
     
-    # Create mask for this contour
-    mask = np.zeros_like(gray)
-    cv2.drawContours(mask, [contour], -1, 255, -1)
+    if traced is None:
+        return None
     
-    # Skeletonize
-    skeleton = skeletonize(mask > 0).astype(np.uint8) * 255
-    skeleton_image[:] = cv2.bitwise_or(skeleton_image, skeleton)
+    (x0, y0, x1, y1), skeleton, skeleton_points, simplified_path, pixel_length = traced
+    
+    skeleton_roi = skeleton_image[y0:y1, x0:x1]
+    cv2.bitwise_or(skeleton_roi, skeleton, dst=skeleton_roi)
     
     # NEW: Store skeleton points for this sprout
-    skeleton_points = np.column_stack(np.where(skeleton > 0))
     overlay_data['skeleton_points'].append({
         'index': index,
-        'points': skeleton_points.tolist()
+        'points': skeleton_points
     })
     
-    # Build graph
-    G = build_graph_from_skeleton(skeleton)
-    
-    if len(G.nodes) < 2:
+    if simplified_path is None:
         return None
     
-    # Find endpoints and path
-    try:
-        n1, n2 = find_farthest_nodes(G)
-        path = nx.shortest_path(G, n1, n2)
-        
-        # Simplify and measure path
-        simplified_path = simplify_path(path)
-        pixel_length = reconnect_path(G, simplified_path)
-        mm_length = pixel_length * mm_to_pixel_ratio
-        
-    except (nx.NetworkXNoPath, nx.NetworkXError, ValueError) as e:
-        logger.debug(f"Graph analysis failed for sprout at ({cx}, {cy}): {e}")
-        return None
+    mm_length = pixel_length * mm_to_pixel_ratio
     
     # Store skeleton path
     overlay_data['skeleton_paths'].append({
@@ -276,13 +442,9 @@ def analyze_single_sprout_enhanced(
     label_text = f"{index}: {mm_length:.2f} mm"
     
     # Calculate label position
-    text_size, _ = cv2.getTextSize(
-        label_text,
-        cv2.FONT_HERSHEY_SIMPLEX,
-        font_scale,
-        thickness
+    text_width, text_height = _label_text_size(
+        label_text, font_scale, thickness, label_sizes
     )
-    text_width, text_height = text_size
     
     # Calculate position
     x = cx - text_width // 2
@@ -296,17 +458,16 @@ def analyze_single_sprout_enhanced(
     x = max(margin, min(x, img_w - text_width - margin))
     y = max(text_height + margin, min(y, img_h - margin))
     
-    # Avoid overlap (simplified)
+    # Avoid overlap (simplified), testing against all placed labels at once
+    placed = used_boxes[:index - 1]
     max_attempts = 12
     for attempt in range(max_attempts):
         box = (x, y - text_height, x + text_width, y)
         
-        overlaps = False
-        for used_box in used_boxes:
-            if not (box[2] < used_box[0] or box[0] > used_box[2] or
-                   box[3] < used_box[1] or box[1] > used_box[3]):
-                overlaps = True
-                break
+        overlaps = np.any(
+            (placed[:, 0] <= box[2]) & (placed[:, 2] >= box[0]) &
+            (placed[:, 1] <= box[3]) & (placed[:, 3] >= box[1])
+        )
         
         if not overlaps:
             break
@@ -319,7 +480,7 @@ def analyze_single_sprout_enhanced(
         
         y = max(text_height + margin, min(y, img_h - margin))
     
-    used_boxes.append((x, y - text_height, x + text_width, y))
+    used_boxes[index - 1] = (x, y - text_height, x + text_width, y)
     
     # Store label data
     overlay_data['labels'].append({
@@ -10,6 +10,8 @@ class ImageProcessingConfig:
     # Preprocessing
     MEAN_SHIFT_SP = 20  # Spatial window radius
     MEAN_SHIFT_SR = 40  # Color window radius
+    USE_FAST_DENOISE = True  # Bilateral filter instead of mean shift
+    BILATERAL_DIAMETER = 9  # Pixel neighborhood diameter for bilateral filter
     GAUSSIAN_BLUR_KERNEL = (5, 5)  # Gaussian blur kernel size
     GAUSSIAN_BLUR_SIGMA = 0  # Auto-calculate sigma
     
@@ -19,17 +21,41 @@ class ImageProcessingConfig:
     
     # Contour filtering
     MIN_CONTOUR_AREA = 300  # Minimum pixels for valid contour
+    # Opt-in pre-filter: skip contours whose min-area rect is less elongated
+    # than this (long/short side) before skeleton analysis. Curled sprouts
+    # can fall below any useful ratio, so it is off by default (0 = off)
+    MIN_CONTOUR_ASPECT_RATIO = 0
     
     # Row grouping
     ROW_TOLERANCE_RATIO = 0.08  # Fraction of image height for row grouping
 
 
+class PipelineConfig:
+    """Batch pipeline execution parameters"""
+    
+    # Worker processes for per-image analysis (None = os.cpu_count());
+    # 1 processes in-process while prefetching the next image
+    MAX_WORKERS = None
+    
+    # OpenCV threads per worker process (1 avoids oversubscription)
+    WORKER_CV_THREADS = 1
+    
+    # Leave out images whose results were already saved completely, so an
+    # interrupted run can be resumed; off so re-runs pick up new settings
+    SKIP_EXISTING_RESULTS = False
+
+
 class GraphConfig:
     """Graph analysis parameters"""
     
     # Path simplification
     PATH_SIMPLIFICATION_TOLERANCE = 2.0  # Pixels
     
+    # Path distances closer than this count as a tie when picking the
+    # farthest skeleton pixel; ties go to the first pixel in row-major
+    # order, however rounding in the summed edge weights falls
+    DISTANCE_TIE_TOLERANCE = 1e-6  # Pixels
+    
     # Skeleton connectivity (8-connected neighborhood)
     NEIGHBORS = [
         (-1, 0), (1, 0), (0, -1), (0, 1),  # 4-connected
@@ -70,6 +96,9 @@ class ValidationConfig:
     # File size limits (in MB)
     MAX_IMAGE_SIZE_MB = 50
     MAX_CSV_SIZE_MB = 10
+    
+    # Rows per chunk when streaming a CSV larger than MAX_CSV_SIZE_MB
+    CSV_CHUNK_ROWS = 100_000
 
 
 class OutputConfig:
@@ -82,6 +111,22 @@ class OutputConfig:
     # Output image format
     OUTPUT_IMAGE_FORMAT = ".jpg"
     OUTPUT_IMAGE_QUALITY = 95  # For JPEG (0-100)
+    # Annotated review images (measurements, skeletons). Same quality as
+    # other outputs by default; lower it (e.g. 85) to opt into smaller
+    # files. OpenCV already encodes JPEGs with 4:2:0 chroma subsampling
+    ANNOTATED_JPEG_QUALITY = OUTPUT_IMAGE_QUALITY
+    
+    # Binary masks are written as 1-bit PNGs; they decode to the same 0/255
+    # image and encode faster than 8-bit ones
+    MASK_PNG_BILEVEL = True
+    MASK_PNG_COMPRESSION = 1  # zlib level (0-9)
+    
+    # Also write skeletons_*.jpg, a lossy JPEG copy of mask_skeleton_*.png
+    # kept for older tools; the viewer reads the PNG mask
+    WRITE_SKELETON_IMAGE = True
+    
+    # Threads writing one image's result files in parallel
+    WRITE_THREADS = 4
 
 
 class ViewerConfig:
@@ -103,6 +148,12 @@ class ViewerConfig:
     DEFAULT_LABEL_BG_OPACITY = 0.7
     DEFAULT_USE_LABEL_BG = False
 
+    # Cache for scaled overlay pixmaps, shared through QPixmapCache (KB)
+    PIXMAP_CACHE_KB = 64 * 1024
+
+    # Recently viewed images kept loaded (images, metadata and measurements)
+    FILE_CACHE_SIZE = 8
+
 
 class LoggingConfig:
     """Logging configuration"""
@@ -117,4 +168,7 @@ class LoggingConfig:
     
     # Log file
     LOG_DIR = 'logs'
-    LOG_FILE = 'sproutcv.log'
\ No newline at end of file
+    LOG_FILE = 'sproutcv.log'
+    
+    # GUI log viewer: oldest lines are dropped beyond this many
+    GUI_MAX_LOG_LINES = 5000
\ No newline at end of file
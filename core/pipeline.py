@@ -4,25 +4,283 @@ Enhanced pipeline for SproutCV with support for new overlay system
 
 import os
 import logging
-from typing import Callable, Optional, Dict, Any
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, Optional, Dict, Any, Tuple, Iterator, List
 
+import numpy as np
 import pandas as pd
 
 from sproutcv.io.calibration import load_calibration_data, get_mm_to_pixel_ratio
-from sproutcv.io.image_io import move_image_to_folder, get_image_files
+from sproutcv.io.image_io import move_image_to_folder, get_image_files, read_image
 from sproutcv.analysis.preprocessing import preprocess_image
 from sproutcv.core.validator import validate_inputs
-from sproutcv.exceptions import ProcessingError, ValidationError
+from sproutcv.config import PipelineConfig
+from sproutcv.exceptions import (
+    ImageLoadError, ProcessingError, ProcessingCancelledError, ValidationError
+)
 
 logger = logging.getLogger('sproutcv.pipeline')
 
 
+# Calibration table of a worker process, sent once by _init_worker instead
+# of being pickled into every task
+_worker_calibration: Optional[pd.DataFrame] = None
+
+
+def _init_worker(calibration_data: Optional[pd.DataFrame] = None) -> None:
+    """Configure a pipeline worker process"""
+    global _worker_calibration
+    import cv2
+    cv2.setNumThreads(PipelineConfig.WORKER_CV_THREADS)
+    _worker_calibration = calibration_data
+
+
+def _process_one(
+    image_file: str,
+    parent_folder: str,
+    output_root: Optional[str],
+    calibration_data: Optional[pd.DataFrame],
+    image: Optional[np.ndarray] = None,
+) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Process a single image (runs in a worker process or in-process)
+    
+    Args:
+        image_file: Image filename inside parent_folder
+        parent_folder: Path to folder containing sprout images
+        output_root: Optional custom output root directory
+        calibration_data: DataFrame from load_calibration_data, or None in
+            a worker process to use the one passed to _init_worker
+        image: Optional already-decoded image (skips re-reading the file)
+    
+    Returns:
+        tuple: (name, sprout_count, error) where:
+            - name (str): Image name without extension
+            - sprout_count (int or None): Number of sprouts found,
+              None if the image was skipped for missing calibration
+            - error (str or None): Error message if processing failed
+    """
+    result, save_args = _analyze_one(
+        image_file, parent_folder, output_root, calibration_data, image=image
+    )
+    if save_args is None:
+        return result
+    return _save_one(image_file, result, save_args)
+
+
+def _analyze_one(
+    image_file: str,
+    parent_folder: str,
+    output_root: Optional[str],
+    calibration_data: Optional[pd.DataFrame],
+    image: Optional[np.ndarray] = None,
+) -> Tuple[Tuple[str, Optional[int], Optional[str]], Optional[tuple]]:
+    """
+    Analyze a single image without writing its results
+    
+    Takes the same arguments as _process_one.
+    
+    Returns:
+        tuple: (result, save_args) where result is as returned by
+            _process_one and save_args are the arguments for
+            save_results_with_overlays, or None if there is nothing to save
+    """
+    from sproutcv.analysis.sprout_detector import analyze_sprouts
+
+    name = os.path.splitext(image_file)[0]
+    if calibration_data is None:
+        calibration_data = _worker_calibration
+
+    try:
+        new_image_path, image_folder, name = move_image_to_folder(
+            parent_folder,
+            image_file,
+            output_root=output_root,
+        )
+
+        ratio = get_mm_to_pixel_ratio(calibration_data, name)
+
+        if ratio is None:
+            return (name, None, None), None
+
+        image, cleaned, gray = preprocess_image(new_image_path, image=image)
+
+        result = analyze_sprouts(image, cleaned, gray, ratio)
+        if len(result) == 4:
+            output_image, skeleton_image, sprout_data, overlay_data = result
+        else:
+            raise ProcessingError(
+                f"analyze_sprouts returned {len(result)} values, expected 4"
+            )
+
+        save_args = (
+            image_folder, name, image,
+            output_image, skeleton_image,
+            sprout_data, overlay_data
+        )
+        return (name, len(sprout_data), None), save_args
+
+    except Exception as e:
+        logger.error(f"Error processing {image_file}: {str(e)}")
+        return (name, None, str(e)), None
+
+
+def _save_one(
+    image_file: str,
+    result: Tuple[str, Optional[int], Optional[str]],
+    save_args: tuple,
+) -> Tuple[str, Optional[int], Optional[str]]:
+    """
+    Write the results of an image analyzed by _analyze_one
+    
+    Returns:
+        tuple: result, or (name, None, error) if writing failed
+    """
+    from sproutcv.io.results_writer import save_results_with_overlays
+
+    try:
+        save_results_with_overlays(*save_args)
+        return result
+    except Exception as e:
+        logger.error(f"Error processing {image_file}: {str(e)}")
+        return result[0], None, str(e)
+
+
+def _has_results(
+    image_file: str,
+    parent_folder: str,
+    output_root: Optional[str],
+) -> bool:
+    """Check whether an earlier run already saved this image's results"""
+    from sproutcv.io.results_writer import get_results_csv_path
+
+    name = os.path.splitext(image_file)[0]
+    image_folder = os.path.join(output_root or parent_folder, name)
+    return os.path.exists(get_results_csv_path(image_folder, name))
+
+
+def _prefetch_image(path: str) -> Optional[np.ndarray]:
+    """Decode an image for prefetching (None if it cannot be read)"""
+    try:
+        return read_image(path)
+    except ImageLoadError:
+        # preprocess_image retries and reports the error
+        return None
+
+
+def _iter_sequential(
+    image_files: List[str],
+    parent_folder: str,
+    output_root: Optional[str],
+    calibration_data: pd.DataFrame,
+) -> Iterator[Tuple[str, Tuple[str, Optional[int], Optional[str]]]]:
+    """
+    Process images in-process, overlapping disk I/O with analysis
+    
+    While one image is analyzed, the next is decoded and the results of
+    the previous one are written on background threads. A result is
+    yielded once its files are written, so the caller sees images in
+    order. The next save only starts after the caller resumes, so closing
+    the generator early leaves at most one image copied but not saved.
+    
+    Yields:
+        tuple: (image_file, result) with result as returned by _process_one
+    """
+    with ThreadPoolExecutor(max_workers=1) as prefetcher, \
+            ThreadPoolExecutor(max_workers=1) as saver:
+        pending = prefetcher.submit(
+            _prefetch_image, os.path.join(parent_folder, image_files[0])
+        )
+        saving = None
+
+        for i, image_file in enumerate(image_files):
+            image = pending.result()
+
+            if i + 1 < len(image_files):
+                pending = prefetcher.submit(
+                    _prefetch_image, os.path.join(parent_folder, image_files[i + 1])
+                )
+
+            result, save_args = _analyze_one(
+                image_file, parent_folder, output_root,
+                calibration_data, image=image
+            )
+
+            if saving is not None:
+                yield saving[0], saving[1].result()
+                saving = None
+
+            if save_args is None:
+                yield image_file, result
+            else:
+                saving = (
+                    image_file,
+                    saver.submit(_save_one, image_file, result, save_args)
+                )
+
+        if saving is not None:
+            yield saving[0], saving[1].result()
+
+
+def _iter_parallel(
+    image_files: List[str],
+    parent_folder: str,
+    output_root: Optional[str],
+    calibration_data: pd.DataFrame,
+    max_workers: int,
+) -> Iterator[Tuple[str, Tuple[str, Optional[int], Optional[str]]]]:
+    """
+    Process images in a pool of worker processes
+    
+    Yields:
+        tuple: (image_file, result) in completion order, with result as
+            returned by _process_one
+    """
+    # Start workers fresh rather than forking: the parent may already run
+    # numba's thread pool (compiled overlay kernels), which forked children
+    # inherit in a broken state and which can hang the parent at exit
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(calibration_data,),
+    ) as executor:
+        futures = {
+            executor.submit(
+                _process_one,
+                image_file,
+                parent_folder,
+                output_root,
+                None,
+            ): image_file
+            for image_file in image_files
+        }
+
+        try:
+            for future in as_completed(futures):
+                image_file = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker crashed before it could report back; key the
+                    # error by name like every other result
+                    name = os.path.splitext(image_file)[0]
+                    result = (name, None, str(e))
+                yield image_file, result
+        finally:
+            # If the caller stopped early, drop images not yet started
+            for future in futures:
+                future.cancel()
+
+
 def run_pipeline(
     parent_folder: str,
     csv_path: str,
     output_root: Optional[str] = None,
     log_callback: Optional[Callable[[str], None]] = None,
     progress_callback: Optional[Callable[[float], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
 ) -> None:
     """
     Run the complete sprout analysis pipeline
@@ -33,22 +291,24 @@ def run_pipeline(
         output_root: Optional custom output root directory
         log_callback: Optional function for logging messages
         progress_callback: Optional function for progress updates (0.0-1.0)
+        is_cancelled: Optional function checked after each image; when it
+            returns True, images not yet started are skipped
     
     Raises:
+        ProcessingCancelledError: If is_cancelled requested cancellation
         ProcessingError: If pipeline execution fails
         ValidationError: If inputs are invalid
     """
     log = log_callback or logger.info
-    
-    from sproutcv.analysis.sprout_detector import analyze_sprouts
-    from sproutcv.io.results_writer import save_results_with_overlays
 
     try:
         log("Loading calibration data...")
         calibration_data = load_calibration_data(csv_path)
         log(f"✓ Loaded calibration for {len(calibration_data)} images")
 
-        image_files = get_image_files(parent_folder)
+        # Always list the folder afresh; a cached listing could miss
+        # files added since on filesystems with coarse mtimes
+        image_files = get_image_files(parent_folder, use_cache=False)
         total = len(image_files)
 
         if total == 0:
@@ -56,57 +316,61 @@ def run_pipeline(
 
         log(f"Found {total} images to process")
 
+        if PipelineConfig.SKIP_EXISTING_RESULTS:
+            image_files = [
+                image_file for image_file in image_files
+                if not _has_results(image_file, parent_folder, output_root)
+            ]
+            if len(image_files) < total:
+                log(f"Skipping {total - len(image_files)} images with saved results")
+            total = len(image_files)
+
         processed = 0
         skipped = []
         errors = []
 
-        for i, image_file in enumerate(image_files):
-            try:
-                log(f"\nProcessing [{i+1}/{total}]: {image_file}")
+        max_workers = PipelineConfig.MAX_WORKERS or os.cpu_count() or 1
+        max_workers = min(max_workers, total)
 
-                new_image_path, image_folder, name = move_image_to_folder(
-                    parent_folder,
-                    image_file,
-                    output_root=output_root,
-                )
+        if total == 0:
+            results = iter(())
+        elif max_workers == 1:
+            log("Processing in-process")
+            results = _iter_sequential(
+                image_files, parent_folder, output_root, calibration_data
+            )
+        else:
+            log(f"Using {max_workers} worker processes")
+            results = _iter_parallel(
+                image_files, parent_folder, output_root, calibration_data,
+                max_workers
+            )
 
-                ratio = get_mm_to_pixel_ratio(calibration_data, name)
-
-                if ratio is None:
-                    log(f"⚠ Skipping {name} - no calibration data")
-                    skipped.append(name)
-                    continue
-
-                image, cleaned, gray = preprocess_image(new_image_path)
-
-                result = analyze_sprouts(image, cleaned, gray, ratio)
-                if len(result) == 4:
-                    output_image, skeleton_image, sprout_data, overlay_data = result
-                else:
-                    raise ProcessingError(
-                        f"analyze_sprouts returned {len(result)} values, expected 4"
-                    )
-                
-                save_results_with_overlays(
-                    image_folder, name, image,
-                    output_image, skeleton_image,
-                    sprout_data, overlay_data
-                )
+        for done, (image_file, (name, sprout_count, error)) in enumerate(results, 1):
+            log(f"\nProcessed [{done}/{total}]: {image_file}")
 
-                log(f"✓ Found {len(sprout_data)} sprouts")
+            if error is not None:
+                logger.error(f"Error processing {image_file}: {error}")
+                log(f"❌ Error processing {image_file}: {error}")
+                errors.append((image_file, error))
+            elif sprout_count is None:
+                log(f"⚠ Skipping {name} - no calibration data")
+                skipped.append(name)
+            else:
+                log(f"✓ Found {sprout_count} sprouts")
                 processed += 1
 
-            except Exception as e:
-                logger.error(f"Error processing {image_file}: {str(e)}")
-                log(f"❌ Error processing {image_file}: {str(e)}")
-                errors.append((image_file, str(e)))
+            if progress_callback:
+                try:
+                    progress_callback(done / total)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
 
-            finally:
-                if progress_callback:
-                    try:
-                        progress_callback((i + 1) / total)
-                    except Exception as e:
-                        logger.warning(f"Progress callback failed: {e}")
+            if is_cancelled is not None and done < total and is_cancelled():
+                results.close()
+                raise ProcessingCancelledError(
+                    f"Processing cancelled after {done} of {total} images"
+                )
 
         log("\n" + "="*50)
         log("PROCESSING SUMMARY")
@@ -132,6 +396,11 @@ def run_pipeline(
         log("\n✅ Pipeline completed successfully!")
         logger.info("Pipeline completed successfully")
 
+    except ProcessingCancelledError as e:
+        logger.info(str(e))
+        log(f"\n⚠ {e}")
+        raise
+
     except Exception as e:
         logger.error(f"Pipeline failed: {str(e)}")
         log(f"\n❌ Pipeline failed: {str(e)}")
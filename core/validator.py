@@ -3,16 +3,117 @@ Input validation for SproutCV pipeline
 """
 
 import os
+import stat
+import heapq
 import logging
-from typing import Callable, Optional, Dict, Any, List
+from collections import Counter
+from typing import Callable, Optional, Dict, Any, Iterator, List
+import numpy as np
 import pandas as pd
 
 from sproutcv.config import ValidationConfig
-from sproutcv.io.image_io import get_image_files
 from sproutcv.exceptions import ValidationError
+from sproutcv.io.calibration import _read_csv
 
 logger = logging.getLogger('sproutcv.validator')
 
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """
+    Stat a path, treating any OS error as "does not exist"
+    
+    Args:
+        path: Path to stat
+    
+    Returns:
+        os.stat_result or None: Stat result, or None if it cannot be stat'ed
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _check_calibration_values(
+    df: pd.DataFrame,
+    fatal_errors: List[str],
+    warnings: List[str]
+) -> None:
+    """
+    Check pixel/distance values of calibration rows column-wise
+    
+    Args:
+        df: Calibration rows with stripped column names
+        fatal_errors: List to append fatal messages to
+        warnings: List to append warning messages to
+    """
+    raw_pixel = df['pixel']
+    raw_distance = df['distance']
+    pixel = pd.to_numeric(raw_pixel, errors='coerce')
+    distance = pd.to_numeric(raw_distance, errors='coerce')
+    
+    missing = (raw_pixel.isna() | raw_distance.isna()).to_numpy()
+    non_numeric = ~missing & (pixel.isna() | distance.isna()).to_numpy()
+    non_positive = ((pixel <= 0) | (distance <= 0)).to_numpy()
+    unusual_pixel = ((pixel < 1) | (pixel > 10000)).to_numpy()
+    unusual_distance = ((distance < 0.1) | (distance > 1000)).to_numpy()
+    
+    flagged = (
+        missing | non_numeric | non_positive |
+        unusual_pixel | unusual_distance
+    )
+    
+    # Build messages only for offending rows, in row order, indexing plain
+    # arrays rather than going through pandas scalar access per row
+    names = df['file_name'].to_numpy()
+    raw_pixel_values = raw_pixel.to_numpy()
+    raw_distance_values = raw_distance.to_numpy()
+    pixel_values = pixel.to_numpy(dtype=np.float64)
+    distance_values = distance.to_numpy(dtype=np.float64)
+    for i in np.flatnonzero(flagged):
+        name = names[i]
+        
+        if missing[i]:
+            fatal_errors.append(
+                f"Missing pixel/distance value for '{name}'"
+            )
+            continue
+        
+        if non_numeric[i]:
+            fatal_errors.append(
+                f"Non-numeric calibration for '{name}': "
+                f"pixel={raw_pixel_values[i]}, distance={raw_distance_values[i]}"
+            )
+            continue
+        
+        pixel_value = float(pixel_values[i])
+        distance_value = float(distance_values[i])
+        
+        if non_positive[i]:
+            fatal_errors.append(
+                f"Non-positive calibration for '{name}': "
+                f"pixel={pixel_value}, distance={distance_value}"
+            )
+        
+        if unusual_pixel[i]:
+            warnings.append(
+                f"Unusual pixel value for '{name}': {pixel_value}"
+            )
+        
+        if unusual_distance[i]:
+            warnings.append(
+                f"Unusual distance value for '{name}': {distance_value}"
+            )
+
+
+def _read_csv_chunks(csv_path: str) -> Iterator[pd.DataFrame]:
+    """Stream an oversize CSV in chunks, parsing only the required columns"""
+    required_cols = ValidationConfig.REQUIRED_CSV_COLUMNS
+    return pd.read_csv(
+        csv_path,
+        chunksize=ValidationConfig.CSV_CHUNK_ROWS,
+        usecols=lambda c: c.strip() in required_cols
+    )
+
 
 def validate_inputs(
     parent_folder: str,
@@ -40,6 +141,12 @@ def validate_inputs(
     """
     log = log_callback or logger.info
     
+    # Config values used below, bound once
+    image_formats = ValidationConfig.SUPPORTED_IMAGE_FORMATS
+    max_image_mb = ValidationConfig.MAX_IMAGE_SIZE_MB
+    max_csv_mb = ValidationConfig.MAX_CSV_SIZE_MB
+    required_cols = ValidationConfig.REQUIRED_CSV_COLUMNS
+    
     fatal_errors = []
     warnings = []
     infos = []
@@ -48,37 +155,59 @@ def validate_inputs(
     # IMAGE FOLDER VALIDATION
     # ========================================
     
-    if not os.path.exists(parent_folder):
+    # Image names without extension, filled while scanning the folder
+    image_names = set()
+    
+    # One stat call answers both "exists" and "is a directory"
+    folder_stat = _stat_or_none(parent_folder)
+    
+    if folder_stat is None:
         fatal_errors.append(f"Image folder does not exist: {parent_folder}")
         images = []
-    elif not os.path.isdir(parent_folder):
+    elif not stat.S_ISDIR(folder_stat.st_mode):
         fatal_errors.append(f"Path is not a directory: {parent_folder}")
         images = []
     else:
         try:
-            images = get_image_files(parent_folder)
+            # Find images, read their sizes and collect name stems in one
+            # directory pass (same filter as get_image_files)
+            images = []
+            sizes = {}
+            with os.scandir(parent_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.lower().endswith(image_formats) and entry.is_file()):
+                        continue
+                    images.append(name)
+                    sizes[name] = entry.stat().st_size
+                    dot = name.rfind('.')
+                    image_names.add(name[:dot] if dot > 0 else name)
+            images.sort()
             
             if not images:
                 fatal_errors.append(
                     f"No images found in the selected folder. "
                     f"Please ensure the folder contains image files "
-                    f"({', '.join(ValidationConfig.SUPPORTED_IMAGE_FORMATS)})"
+                    f"({', '.join(image_formats)})"
                 )
             else:
                 infos.append(f"Found {len(images)} image(s) to process")
                 
                 # Check file sizes
-                large_files = []
-                for img in images:
-                    path = os.path.join(parent_folder, img)
-                    size_mb = os.path.getsize(path) / (1024 * 1024)
-                    if size_mb > ValidationConfig.MAX_IMAGE_SIZE_MB:
-                        large_files.append(f"{img} ({size_mb:.1f} MB)")
+                max_bytes = max_image_mb * 1024 * 1024
+                large_files = [
+                    img for img in images if sizes.get(img, 0) > max_bytes
+                ]
                 
                 if large_files:
+                    # Only the first 3 are shown, so only format those
+                    preview = ', '.join(
+                        f"{img} ({sizes[img] / (1024 * 1024):.1f} MB)"
+                        for img in large_files[:3]
+                    )
                     warnings.append(
-                        f"Large image files detected (>{ValidationConfig.MAX_IMAGE_SIZE_MB}MB): "
-                        f"{', '.join(large_files[:3])}"
+                        f"Large image files detected (>{max_image_mb}MB): "
+                        f"{preview}"
                         + ("..." if len(large_files) > 3 else "")
                     )
         
@@ -90,156 +219,175 @@ def validate_inputs(
     # CSV VALIDATION
     # ========================================
     
-    if not os.path.exists(csv_path):
+    csv_loaded = False
+    csv_names = set()
+    name_counts = Counter()
+    missing_name_count = 0  # NaN keys don't merge in a Counter
+    value_errors = []
+    value_warnings = []
+    large_csv = False
+    # Chunks whose values are checked after the name cross-checks
+    deferred_chunks = []
+    
+    csv_stat = _stat_or_none(csv_path)
+    
+    if csv_stat is None:
         fatal_errors.append(f"CSV file does not exist: {csv_path}")
-        df = None
-    elif not os.path.isfile(csv_path):
+    elif not stat.S_ISREG(csv_stat.st_mode):
         fatal_errors.append(f"Path is not a file: {csv_path}")
-        df = None
     else:
         try:
             # Check file size
-            size_mb = os.path.getsize(csv_path) / (1024 * 1024)
-            if size_mb > ValidationConfig.MAX_CSV_SIZE_MB:
+            size_mb = csv_stat.st_size / (1024 * 1024)
+            large_csv = size_mb > max_csv_mb
+            if large_csv:
                 warnings.append(f"Large CSV file: {size_mb:.1f} MB")
             
-            # Try to load CSV
-            df = pd.read_csv(csv_path)
-            infos.append("Calibration CSV loaded successfully")
-            
-            # Validate structure
-            df.columns = [c.strip() for c in df.columns]
-            found_cols = set(df.columns)
-            required_cols = ValidationConfig.REQUIRED_CSV_COLUMNS
+            # Try to load CSV, parsing only the columns validation uses.
+            # Values are left to pd.to_numeric below so a bad cell is
+            # reported per row instead of failing the whole read.
+            # Oversize files are streamed in chunks to bound memory use.
+            if large_csv:
+                chunks = _read_csv_chunks(csv_path)
+            else:
+                # Same reader as load_calibration_data, so validation
+                # accepts exactly the files the run does
+                chunks = [_read_csv(csv_path)]
             
-            if not required_cols.issubset(found_cols):
-                missing = required_cols - found_cols
-                fatal_errors.append(
-                    f"CSV missing required columns: {missing}. "
-                    f"Found: {list(df.columns)}"
+            csv_loaded = True
+            for chunk in chunks:
+                # Validate structure
+                chunk = chunk.rename(columns=str.strip)
+                missing = required_cols.difference(chunk.columns)
+                
+                if missing:
+                    fatal_errors.append(
+                        f"CSV missing required columns: {missing}. "
+                        f"Found: {list(chunk.columns)}"
+                    )
+                    csv_loaded = False
+                    break
+                
+                # CSV text columns are already object dtype; only numeric
+                # name columns need converting before stripping
+                names = chunk['file_name']
+                if names.dtype != object:
+                    names = names.astype(str)
+                csv_names.update(names.str.strip().fillna('nan'))
+                name_counts.update(
+                    chunk['file_name'].value_counts(sort=False).to_dict()
                 )
-                df = None
+                missing_name_count += int(chunk['file_name'].isna().sum())
+                
+                if verbose:
+                    _check_calibration_values(chunk, value_errors, value_warnings)
+                elif not large_csv:
+                    deferred_chunks.append(chunk)
+            
+            infos.append("Calibration CSV loaded successfully")
             
         except pd.errors.EmptyDataError:
             fatal_errors.append("CSV file is empty")
-            df = None
+            csv_loaded = False
         except pd.errors.ParserError as e:
             fatal_errors.append(f"CSV parse error: {str(e)}")
-            df = None
+            csv_loaded = False
         except PermissionError:
             fatal_errors.append(f"Permission denied reading CSV: {csv_path}")
-            df = None
+            csv_loaded = False
         except Exception as e:
             fatal_errors.append(f"Error loading CSV: {str(e)}")
-            df = None
+            csv_loaded = False
     
     # ========================================
     # CROSS-VALIDATION (CSV vs Images)
     # ========================================
     
-    if df is not None and images:
-        image_names = {os.path.splitext(f)[0] for f in images}
-        csv_names = set(df['file_name'].astype(str).str.strip())
+    if csv_loaded and images:
+        # Only the first 5 names (alphabetically) are shown, so pick them
+        # with a bounded heap rather than sorting the whole difference
         
         # Images without calibration
-        missing_in_csv = sorted(image_names - csv_names)
+        missing_in_csv = image_names - csv_names
         if missing_in_csv:
             fatal_errors.append(
                 f"Missing calibration for {len(missing_in_csv)} image(s): "
-                f"{missing_in_csv[:5]}"
+                f"{heapq.nsmallest(5, missing_in_csv)}"
                 + ("..." if len(missing_in_csv) > 5 else "")
             )
         
         # CSV rows without images
-        extra_in_csv = sorted(csv_names - image_names)
+        extra_in_csv = csv_names - image_names
         if extra_in_csv:
             warnings.append(
                 f"CSV has {len(extra_in_csv)} row(s) without matching images: "
-                f"{extra_in_csv[:5]}"
+                f"{heapq.nsmallest(5, extra_in_csv)}"
                 + ("..." if len(extra_in_csv) > 5 else "")
             )
         
-        # Check for duplicates
-        duplicates = df['file_name'][df['file_name'].duplicated()].tolist()
+        # Check for duplicates (each duplicated name reported once)
+        duplicates = [name for name, count in name_counts.items() if count > 1]
+        if missing_name_count > 1:
+            duplicates.append(np.nan)
         if duplicates:
             fatal_errors.append(
                 f"Duplicate calibration rows for: {duplicates}"
             )
         
-        # Validate calibration values
-        for idx, row in df.iterrows():
-            name = row['file_name']
-            
-            # Check for missing values
-            if pd.isna(row['pixel']) or pd.isna(row['distance']):
-                fatal_errors.append(
-                    f"Missing pixel/distance value for '{name}'"
-                )
-                continue
-            
-            # Check for valid numeric values
+        # Non-verbose callers only need to know whether the inputs are
+        # usable, so values are only checked while nothing is fatal yet.
+        # Oversize files were not kept in memory and are streamed again.
+        if not verbose and not fatal_errors:
             try:
-                pixel = float(row['pixel'])
-                distance = float(row['distance'])
-                
-                # Check for positive values
-                if pixel <= 0 or distance <= 0:
-                    fatal_errors.append(
-                        f"Non-positive calibration for '{name}': "
-                        f"pixel={pixel}, distance={distance}"
+                if large_csv:
+                    deferred_chunks = (
+                        chunk.rename(columns=str.strip)
+                        for chunk in _read_csv_chunks(csv_path)
                     )
-                
-                # Check for reasonable values
-                if pixel < 1 or pixel > 10000:
-                    warnings.append(
-                        f"Unusual pixel value for '{name}': {pixel}"
-                    )
-                
-                if distance < 0.1 or distance > 1000:
-                    warnings.append(
-                        f"Unusual distance value for '{name}': {distance}"
-                    )
-            
-            except (ValueError, TypeError):
-                fatal_errors.append(
-                    f"Non-numeric calibration for '{name}': "
-                    f"pixel={row['pixel']}, distance={row['distance']}"
-                )
+                for chunk in deferred_chunks:
+                    _check_calibration_values(chunk, value_errors, value_warnings)
+                    if value_errors:
+                        break
+            except Exception as e:
+                fatal_errors.append(f"Error loading CSV: {str(e)}")
+        
+        # Calibration value problems
+        fatal_errors.extend(value_errors)
+        warnings.extend(value_warnings)
     
     # ========================================
     # SUMMARY
     # ========================================
     
-    log("\n" + "="*50)
-    log("VALIDATION SUMMARY")
-    log("="*50)
+    # Each section goes out as one message so long reports cost a handful
+    # of log calls; the count lines stay separate to keep their colors
+    log("\n".join(["\n" + "="*50, "VALIDATION SUMMARY", "="*50]))
     log(f"❌ Fatal errors: {len(fatal_errors)}")
     log(f"⚠️  Warnings: {len(warnings)}")
     log(f"ℹ️  Info: {len(infos)}")
     
     if verbose:
-        if fatal_errors:
-            log("\n❌ FATAL ERRORS (must be fixed):")
-            for i, err in enumerate(fatal_errors, 1):
-                log(f"  {i}. {err}")
-        
-        if warnings:
-            log("\n⚠️  WARNINGS (review recommended):")
-            for i, warn in enumerate(warnings, 1):
-                log(f"  {i}. {warn}")
-        
-        if infos:
-            log("\nℹ️  INFORMATION:")
-            for i, info in enumerate(infos, 1):
-                log(f"  {i}. {info}")
-    
-    # Log to standard logger as well
-    if fatal_errors:
-        for err in fatal_errors:
-            logger.error(f"Validation error: {err}")
-    if warnings:
-        for warn in warnings:
-            logger.warning(f"Validation warning: {warn}")
+        sections = (
+            ("\n❌ FATAL ERRORS (must be fixed):", fatal_errors),
+            ("\n⚠️  WARNINGS (review recommended):", warnings),
+            ("\nℹ️  INFORMATION:", infos)
+        )
+        for title, messages in sections:
+            if messages:
+                lines = [title]
+                lines.extend(f"  {i}. {msg}" for i, msg in enumerate(messages, 1))
+                log("\n".join(lines))
+    
+    # Log to standard logger as well, one record per severity; the joined
+    # text is only built if the logger would actually emit it
+    if fatal_errors and logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "\n".join(f"Validation error: {err}" for err in fatal_errors)
+        )
+    if warnings and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "\n".join(f"Validation warning: {warn}" for warn in warnings)
+        )
     
     return {
         'fatal': fatal_errors,
@@ -23,6 +23,11 @@ class ProcessingError(SproutCVError):
     pass
 
 
+class ProcessingCancelledError(ProcessingError):
+    """Raised when processing is cancelled before all images are done"""
+    pass
+
+
 class ValidationError(SproutCVError):
     """Raised when input validation fails"""
     pass
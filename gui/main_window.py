@@ -4,22 +4,33 @@ Enhanced main application window for SproutCV with tabbed interface
 
 import os
 import sys
+import queue
 import logging
+from collections import deque
+from functools import partial
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QMessageBox,
     QGroupBox, QProgressBar, QTabWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QCoreApplication, QEvent, QThreadPool, QTimer
 
-from sproutcv.gui.widgets.file_selector import FileSelector
+from sproutcv.gui.widgets.file_selector import FileSelector, FOLDER_DIALOG_OPTIONS
 from sproutcv.gui.widgets.log_viewer import LogViewer
-from sproutcv.gui.widgets.results_viewer import ResultsViewer
-from sproutcv.gui.workers.pipeline_worker import PipelineWorker
+from sproutcv.gui.workers.results_scan_worker import ResultsScanWorker
 from sproutcv.config import LoggingConfig
 
 logger = logging.getLogger('sproutcv.gui')
 
+# Stylesheet for the whole window, parsed once when the window is built;
+# widgets are targeted by object name or the "role"/"state" properties
+STYLESHEET_PATH = os.path.join(os.path.dirname(__file__), 'style.qss')
+
+# How often the pipeline worker's log queue is drained (ms) and the most
+# messages moved to the log viewer per drain
+LOG_DRAIN_INTERVAL_MS = 50
+LOG_DRAIN_BATCH = 256
+
 
 class MainWindow(QMainWindow):
     """Enhanced main application window with tabbed interface"""
@@ -35,6 +46,20 @@ class MainWindow(QMainWindow):
         self.csv_file = None
         self.output_folder = None
         self.worker = None
+        self.scan_worker = None
+        self._last_progress = -1
+        self._actions_enabled = None  # Last state set on validate/process
+        
+        # Results viewer and log viewer are built when their tab is first
+        # shown; log messages are held until the log viewer exists
+        self.results_viewer = None
+        self.log_viewer = None
+        self._pending_log = deque(maxlen=LoggingConfig.GUI_MAX_LOG_LINES)
+        
+        # Moves messages from the running pipeline worker to the log
+        self._log_drain_timer = QTimer(self)
+        self._log_drain_timer.setInterval(LOG_DRAIN_INTERVAL_MS)
+        self._log_drain_timer.timeout.connect(self._drain_worker_log)
         
         self._setup_ui()
         self._setup_connections()
@@ -43,6 +68,9 @@ class MainWindow(QMainWindow):
     
     def _setup_ui(self):
         """Setup the user interface with tabs"""
+        with open(STYLESHEET_PATH, encoding='utf-8') as f:
+            self.setStyleSheet(f.read())
+        
         central = QWidget()
         self.setCentralWidget(central)
         main_layout = QVBoxLayout(central)
@@ -51,36 +79,13 @@ class MainWindow(QMainWindow):
         
         # Header
         header = QLabel("SproutCV - Sprout Length Measurement through Computer Vision")
-        header.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        header.setObjectName("headerLabel")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(header)
         
         # Create tab widget
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #ecf0f1;
-                border: 2px solid #bdc3c7;
-                border-bottom: none;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                padding: 10px 20px;
-                margin-right: 2px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 2px solid white;
-            }
-            QTabBar::tab:hover {
-                background-color: #d5dbdb;
-            }
-        """)
+        self.tab_widget.setObjectName("mainTabs")
         
         # Tab 1: Input & Control
         self.input_tab = self._create_input_tab()
@@ -115,30 +120,23 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.progress_bar.setMinimumHeight(30)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            QProgressBar::chunk {
-                background-color: #27ae60;
-                border-radius: 3px;
-            }
-        """)
-        layout.addWidget(self.progress_bar)
+        self.progress_bar.setObjectName("progressBar")
+        
+        # Cancel button, shown next to the progress bar during processing
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setVisible(False)
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.setMinimumHeight(30)
+        self.cancel_btn.setObjectName("cancelBtn")
+        
+        progress_row = QHBoxLayout()
+        progress_row.addWidget(self.progress_bar, stretch=1)
+        progress_row.addWidget(self.cancel_btn)
+        layout.addLayout(progress_row)
         
         # Status message
         self.status_label = QLabel("Ready to process images")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #ecf0f1;
-                border-radius: 5px;
-                font-size: 11px;
-            }
-        """)
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
         
@@ -148,66 +146,87 @@ class MainWindow(QMainWindow):
         return tab
     
     def _create_viewer_tab(self):
-        """Create results viewer tab"""
+        """Create results viewer tab (contents built by _get_results_viewer)"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setSpacing(10)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        # Results viewer
-        self.results_viewer = ResultsViewer()
-        layout.addWidget(self.results_viewer)
-        
         return tab
     
     def _create_log_tab(self):
-        """Create processing log tab"""
+        """Create processing log tab (contents built by _get_log_viewer)"""
         tab = QWidget()
         layout = QVBoxLayout(tab)
         layout.setSpacing(10)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        # Log viewer
-        log_group = QGroupBox("Processing Messages")
-        log_layout = QVBoxLayout()
-        self.log_viewer = LogViewer()
-        log_layout.addWidget(self.log_viewer)
-        log_group.setLayout(log_layout)
-        layout.addWidget(log_group)
+        return tab
+    
+    def _get_results_viewer(self):
+        """Return the results viewer, building it on first use"""
+        if self.results_viewer is None:
+            # Imported here so OpenCV/NumPy load after the window is shown
+            from sproutcv.gui.widgets.results_viewer import ResultsViewer
+            
+            self.results_viewer = ResultsViewer()
+            self.viewer_tab.layout().addWidget(self.results_viewer)
         
-        # Clear button
-        clear_btn = QPushButton("🗑️ Clear Log")
-        clear_btn.setMinimumHeight(35)
-        clear_btn.clicked.connect(self.log_viewer.clear)
-        layout.addWidget(clear_btn)
+        return self.results_viewer
+    
+    def _get_log_viewer(self):
+        """Return the log viewer, building it on first use"""
+        if self.log_viewer is None:
+            layout = self.log_tab.layout()
+            
+            # Log viewer
+            log_group = QGroupBox("Processing Messages")
+            log_layout = QVBoxLayout()
+            self.log_viewer = LogViewer()
+            log_layout.addWidget(self.log_viewer)
+            log_group.setLayout(log_layout)
+            layout.addWidget(log_group)
+            
+            # Clear button
+            clear_btn = QPushButton("🗑️ Clear Log")
+            clear_btn.setMinimumHeight(35)
+            clear_btn.clicked.connect(self.log_viewer.clear)
+            layout.addWidget(clear_btn)
+            
+            # Show messages logged before the tab was opened
+            while self._pending_log:
+                self.log_viewer.log(self._pending_log.popleft())
         
-        return tab
+        return self.log_viewer
+    
+    def _on_tab_changed(self, index):
+        """Build the viewer or log tab contents when first shown"""
+        tab = self.tab_widget.widget(index)
+        if tab is self.viewer_tab:
+            self._get_results_viewer()
+        elif tab is self.log_tab:
+            self._get_log_viewer()
+    
+    def _log(self, message):
+        """Log a message to the log viewer, or hold it until it is built"""
+        if self.log_viewer is None:
+            self._pending_log.append(message)
+        else:
+            self.log_viewer.log(message)
     
     def closeEvent(self, event):
         """Handle window close"""
-        if self.worker and self.worker.isRunning():
+        if self.worker and not self.worker.is_done():
             self.worker.cancel()
-            self.worker.wait(5000)  # Wait up to 5 seconds
+            QThreadPool.globalInstance().waitForDone(5000)  # Wait up to 5 seconds
+        self._stop_results_scan()
         logger.info("Application closing")
         event.accept()
     
     def _create_input_section(self):
         """Create input file selection section"""
         group = QGroupBox("Input Files")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setProperty("role", "section")
         layout = QVBoxLayout()
         
         # Image folder selector
@@ -242,20 +261,7 @@ class MainWindow(QMainWindow):
     def _create_control_section(self):
         """Create control buttons section"""
         group = QGroupBox("Actions")
-        group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #bdc3c7;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        group.setProperty("role", "section")
         layout = QVBoxLayout()
         
         # First row of buttons
@@ -265,40 +271,14 @@ class MainWindow(QMainWindow):
         self.validate_btn = QPushButton("Validate Inputs")
         self.validate_btn.setEnabled(False)
         self.validate_btn.setMinimumHeight(45)
-        self.validate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #95a5a6;
-            }
-        """)
+        self.validate_btn.setObjectName("validateBtn")
         row1.addWidget(self.validate_btn)
         
         # Process button
         self.process_btn = QPushButton("Process Images")
         self.process_btn.setEnabled(False)
         self.process_btn.setMinimumHeight(45)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-            QPushButton:disabled {
-                background-color: #95a5a6;
-            }
-        """)
+        self.process_btn.setObjectName("processBtn")
         row1.addWidget(self.process_btn)
         
         layout.addLayout(row1)
@@ -306,17 +286,7 @@ class MainWindow(QMainWindow):
         # Second row - Load results button
         self.load_results_btn = QPushButton("📂 Load Results Folder")
         self.load_results_btn.setMinimumHeight(40)
-        self.load_results_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-        """)
+        self.load_results_btn.setObjectName("loadResultsBtn")
         layout.addWidget(self.load_results_btn)
         
         group.setLayout(layout)
@@ -327,59 +297,80 @@ class MainWindow(QMainWindow):
         self.validate_btn.clicked.connect(self._validate_inputs)
         self.process_btn.clicked.connect(self._process_images)
         self.load_results_btn.clicked.connect(self._load_results_folder)
+        self.cancel_btn.clicked.connect(self._cancel_processing)
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
     
     def _on_image_folder_selected(self, folder):
         """Handle image folder selection"""
         self.image_folder = folder
-        self.log_viewer.log(f"✓ Image folder selected: {folder}")
-        self.status_label.setText(f"Image folder: {os.path.basename(folder)}")
-        self._update_button_states()
+        self._log(f"✓ Image folder selected: {folder}")
+        # Once both inputs are set the label shows "Ready to process" instead
+        if not self._update_button_states():
+            self.status_label.setText(f"Image folder: {os.path.basename(folder)}")
         logger.info(f"Image folder selected: {folder}")
     
     def _on_csv_selected(self, file):
         """Handle CSV file selection"""
         self.csv_file = file
-        self.log_viewer.log(f"✓ Calibration CSV selected: {file}")
-        self.status_label.setText(f"CSV file: {os.path.basename(file)}")
-        self._update_button_states()
+        self._log(f"✓ Calibration CSV selected: {file}")
+        if not self._update_button_states():
+            self.status_label.setText(f"CSV file: {os.path.basename(file)}")
         logger.info(f"Calibration CSV selected: {file}")
     
     def _on_output_folder_selected(self, folder):
         """Handle output folder selection"""
         self.output_folder = folder
         if folder:
-            self.log_viewer.log(f"✓ Output folder selected: {folder}")
+            self._log(f"✓ Output folder selected: {folder}")
             logger.info(f"Output folder selected: {folder}")
         else:
-            self.log_viewer.log("ℹ Using default output location")
+            self._log("ℹ Using default output location")
     
     def _update_button_states(self):
-        """Update button enabled states based on inputs"""
+        """
+        Update button enabled states based on inputs
+        
+        Returns:
+            bool: True if both the image folder and the CSV are set
+        """
         has_image = self.image_selector.get_path() is not None
         has_csv = self.csv_selector.get_path() is not None
         has_inputs = has_image and has_csv
         
-        self.validate_btn.setEnabled(has_inputs)
-        self.process_btn.setEnabled(has_inputs)
+        if has_inputs != self._actions_enabled:
+            self._set_actions_enabled(has_inputs)
         
         if has_inputs:
-            self.status_label.setText("Ready to process")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    padding: 10px;
-                    background-color: #d5f4e6;
-                    border-radius: 5px;
-                    font-size: 11px;
-                    color: #27ae60;
-                    font-weight: bold;
-                }
-            """)
+            self._set_status("Ready to process", "ok")
+        
+        return has_inputs
+    
+    def _set_actions_enabled(self, enabled):
+        """Enable/disable the validate and process buttons"""
+        self._actions_enabled = enabled
+        self.validate_btn.setEnabled(enabled)
+        self.process_btn.setEnabled(enabled)
+    
+    def _set_status(self, text, state):
+        """
+        Show a status message styled for the given state
+        
+        Args:
+            text: Message to show
+            state: One of "ok", "busy" or "error", or "" for the default look
+        """
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            self.status_label.setProperty("state", state)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
     
     def _validate_inputs(self):
         """Run validation in dry-run mode"""
-        self.log_viewer.log("\n" + "="*50)
-        self.log_viewer.log("Starting validation...")
-        self.log_viewer.log("="*50)
+        self._log("\n" + "="*50)
+        self._log("Starting validation...")
+        self._log("="*50)
         
         # Switch to log tab
         self.tab_widget.setCurrentIndex(2)
@@ -399,42 +390,35 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
         
-        self.log_viewer.log("\n" + "="*50)
-        self.log_viewer.log("Starting image processing...")
-        self.log_viewer.log("="*50)
+        self._log("\n" + "="*50)
+        self._log("Starting image processing...")
+        self._log("="*50)
         
         # Switch to log tab
         self.tab_widget.setCurrentIndex(2)
         
         # Clear previous results
-        self.results_viewer.clear_images()
+        if self.results_viewer is not None:
+            self.results_viewer.clear_images()
         
         self._run_pipeline(dry_run=False)
     
     def _run_pipeline(self, dry_run=False, verbose=False):
-        """Execute the pipeline in a worker thread"""
+        """Execute the pipeline on the global thread pool"""
         # Disable controls during processing
         self._set_controls_enabled(False)
-        self.progress_bar.setVisible(not dry_run)
+        self._set_progress_visible(not dry_run)
         self.progress_bar.setValue(0)
+        self._last_progress = 0
         
         if dry_run:
-            self.status_label.setText("Validating inputs...")
+            self._set_status("Validating inputs...", "busy")
         else:
-            self.status_label.setText("Processing images...")
-        
-        self.status_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #fff3cd;
-                border-radius: 5px;
-                font-size: 11px;
-                color: #856404;
-                font-weight: bold;
-            }
-        """)
-        
-        # Create and configure worker
+            self._set_status("Processing images...", "busy")
+        
+        # Create and configure worker; the pipeline is imported on first run
+        from sproutcv.gui.workers.pipeline_worker import PipelineWorker
+        
         self.worker = PipelineWorker(
             folder=self.image_folder,
             csv_path=self.csv_file,
@@ -443,56 +427,84 @@ class MainWindow(QMainWindow):
             verbose=verbose
         )
         
-        # Connect signals
-        self.worker.log_signal.connect(self.log_viewer.log)
-        self.worker.progress_signal.connect(self._update_progress)
-        self.worker.finished_signal.connect(
-            lambda: self._on_processing_finished(dry_run)
+        # Connect signals; queued so the slots always run on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        signals = self.worker.signals
+        signals.progress_signal.connect(self._update_progress, queued)
+        signals.finished_signal.connect(
+            partial(self._on_processing_finished, dry_run), queued
         )
-        self.worker.error_signal.connect(self._on_processing_error)
+        signals.cancelled_signal.connect(self._on_processing_cancelled, queued)
+        signals.error_signal.connect(self._on_processing_error, queued)
         
         # Start processing
-        self.worker.start()
+        QThreadPool.globalInstance().start(self.worker)
+        self._log_drain_timer.start()
         logger.info(f"Started {'validation' if dry_run else 'processing'}")
     
+    def _drain_worker_log(self, limit=LOG_DRAIN_BATCH):
+        """
+        Move queued pipeline log messages to the log viewer
+        
+        Args:
+            limit: Most messages to move, or None to empty the queue
+        """
+        log_queue = self.worker.log_queue
+        drained = 0
+        while limit is None or drained < limit:
+            try:
+                message = log_queue.get_nowait()
+            except queue.Empty:
+                return
+            self._log(message)
+            drained += 1
+    
+    def _stop_log_drain(self):
+        """Stop draining the worker log after moving what is left"""
+        self._log_drain_timer.stop()
+        self._drain_worker_log(limit=None)
+    
+    def _set_progress_visible(self, visible):
+        """Show/hide the progress bar and its cancel button"""
+        self.progress_bar.setVisible(visible)
+        self.cancel_btn.setVisible(visible)
+        self.cancel_btn.setEnabled(visible)
+    
+    def _cancel_processing(self):
+        """Ask the running pipeline to stop after the current image"""
+        if self.worker is None or self.worker.is_done():
+            return
+        
+        self.worker.cancel()
+        self.cancel_btn.setEnabled(False)
+        self._log("\n⚠ Cancelling after the current image...")
+        self._set_status("Cancelling...", "busy")
+        logger.info("Processing cancellation requested")
+    
     def _update_progress(self, value):
-        """Update progress bar"""
-        self.progress_bar.setValue(int(value * 100))
+        """Update progress bar, skipping values that round to the same percent"""
+        percent = int(value * 100)
+        if percent == self._last_progress:
+            return
+        self._last_progress = percent
+        self.progress_bar.setValue(percent)
     
     def _on_processing_finished(self, was_dry_run):
         """Handle successful completion"""
+        self._stop_log_drain()
+        
         if not was_dry_run:
-            self.log_viewer.log("\n✅ Processing completed successfully!")
+            self._log("\n✅ Processing completed successfully!")
             self._auto_load_results()
-            self.status_label.setText("Processing complete!")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    padding: 10px;
-                    background-color: #d5f4e6;
-                    border-radius: 5px;
-                    font-size: 11px;
-                    color: #27ae60;
-                    font-weight: bold;
-                }
-            """)
+            self._set_status("Processing complete!", "ok")
             # Switch to viewer tab
             self.tab_widget.setCurrentIndex(1)
         else:
-            self.log_viewer.log("\n✅ Validation completed successfully!")
-            self.status_label.setText("Validation passed!")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    padding: 10px;
-                    background-color: #d5f4e6;
-                    border-radius: 5px;
-                    font-size: 11px;
-                    color: #27ae60;
-                    font-weight: bold;
-                }
-            """)
+            self._log("\n✅ Validation completed successfully!")
+            self._set_status("Validation passed!", "ok")
         
         self._set_controls_enabled(True)
-        self.progress_bar.setVisible(False)
+        self._set_progress_visible(False)
         
         if not was_dry_run:
             QMessageBox.information(
@@ -503,23 +515,25 @@ class MainWindow(QMainWindow):
         
         logger.info(f"{'Validation' if was_dry_run else 'Processing'} completed successfully")
     
+    def _on_processing_cancelled(self):
+        """Handle processing stopped by the cancel button"""
+        self._stop_log_drain()
+        
+        self._set_controls_enabled(True)
+        self._set_progress_visible(False)
+        self._set_status("Processing cancelled", "")
+        
+        logger.info("Processing cancelled")
+    
     def _on_processing_error(self, error_msg):
         """Handle processing errors"""
-        self.log_viewer.log(f"\n❌ ERROR: {error_msg}")
+        self._stop_log_drain()
+        
+        self._log(f"\n❌ ERROR: {error_msg}")
         self._set_controls_enabled(True)
-        self.progress_bar.setVisible(False)
+        self._set_progress_visible(False)
         
-        self.status_label.setText("Processing failed!")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                padding: 10px;
-                background-color: #f8d7da;
-                border-radius: 5px;
-                font-size: 11px;
-                color: #721c24;
-                font-weight: bold;
-            }
-        """)
+        self._set_status("Processing failed!", "error")
         
         # Switch to log tab to show error
         self.tab_widget.setCurrentIndex(2)
@@ -541,83 +555,113 @@ class MainWindow(QMainWindow):
             base_folder = self.image_folder
         
         # Find all subfolders (each image creates its own folder)
-        try:
-            items = os.listdir(base_folder)
-            for item in items:
-                item_path = os.path.join(base_folder, item)
-                if os.path.isdir(item_path):
-                    # Check if it contains output files
-                    files = os.listdir(item_path)
-                    has_skeleton = any(f.startswith("skeletons_") for f in files)
-                    has_measurement = any(f.startswith("length_measurement_") for f in files)
-                    
-                    if has_skeleton and has_measurement:
-                        self.results_viewer.add_processed_image(item, item_path)
-            
-            self.log_viewer.log(f"📊 Loaded {len(self.results_viewer.processed_images)} results into viewer")
-            logger.info(f"Auto-loaded {len(self.results_viewer.processed_images)} results")
-            
-        except Exception as e:
-            self.log_viewer.log(f"⚠️ Could not auto-load results: {str(e)}")
-            logger.warning(f"Auto-load failed: {str(e)}")
+        self._start_results_scan(
+            base_folder,
+            self._on_auto_load_finished,
+            self._on_auto_load_error
+        )
+    
+    def _on_auto_load_finished(self, count):
+        """Handle completion of the scan started after processing"""
+        total = len(self._get_results_viewer().processed_images)
+        self._log(f"📊 Loaded {total} results into viewer")
+        logger.info(f"Auto-loaded {total} results")
+    
+    def _on_auto_load_error(self, error_msg):
+        """Handle a failed scan started after processing"""
+        self._log(f"⚠️ Could not auto-load results: {error_msg}")
+        logger.warning(f"Auto-load failed: {error_msg}")
     
     def _load_results_folder(self):
         """Manually load a folder containing processed results"""
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Results Folder",
-            self.image_folder if self.image_folder else ""
+            dir=self.image_folder if self.image_folder else "",
+            options=FOLDER_DIALOG_OPTIONS
         )
         
         if not folder:
             return
         
-        self.results_viewer.clear_images()
+        # Stop any running scan first so its results don't end up in
+        # the cleared viewer
+        self._stop_results_scan()
+        self._get_results_viewer().clear_images()
         
         # Find all subfolders
-        try:
-            items = os.listdir(folder)
-            count = 0
-            
-            for item in items:
-                item_path = os.path.join(folder, item)
-                if os.path.isdir(item_path):
-                    # Check if it contains output files
-                    files = os.listdir(item_path)
-                    has_skeleton = any(f.startswith("skeletons_") for f in files)
-                    has_measurement = any(f.startswith("length_measurement_") for f in files)
-                    
-                    if has_skeleton and has_measurement:
-                        self.results_viewer.add_processed_image(item, item_path)
-                        count += 1
-            
-            if count > 0:
-                self.log_viewer.log(f"✓ Loaded {count} processed images from {folder}")
-                # Switch to viewer tab
-                self.tab_widget.setCurrentIndex(1)
-                QMessageBox.information(
-                    self,
-                    'Results Loaded',
-                    f'Successfully loaded {count} processed images.'
-                )
-                logger.info(f"Manually loaded {count} results from {folder}")
-            else:
-                self.log_viewer.log(f"⚠️ No processed images found in {folder}")
-                QMessageBox.warning(
-                    self,
-                    'No Results Found',
-                    'No processed images found in selected folder.'
-                )
-                logger.warning(f"No results found in {folder}")
-        
-        except Exception as e:
-            self.log_viewer.log(f"❌ Error loading results: {str(e)}")
-            QMessageBox.critical(
+        self._start_results_scan(
+            folder,
+            partial(self._on_results_folder_loaded, folder),
+            self._on_results_folder_error
+        )
+    
+    def _on_results_folder_loaded(self, folder, count):
+        """Handle completion of a manually started results scan"""
+        if count > 0:
+            self._log(f"✓ Loaded {count} processed images from {folder}")
+            # Switch to viewer tab
+            self.tab_widget.setCurrentIndex(1)
+            QMessageBox.information(
                 self,
-                'Error',
-                f'Failed to load results:\n\n{str(e)}'
+                'Results Loaded',
+                f'Successfully loaded {count} processed images.'
+            )
+            logger.info(f"Manually loaded {count} results from {folder}")
+        else:
+            self._log(f"⚠️ No processed images found in {folder}")
+            QMessageBox.warning(
+                self,
+                'No Results Found',
+                'No processed images found in selected folder.'
+            )
+            logger.warning(f"No results found in {folder}")
+    
+    def _on_results_folder_error(self, error_msg):
+        """Handle a failed manually started results scan"""
+        self._log(f"❌ Error loading results: {error_msg}")
+        QMessageBox.critical(
+            self,
+            'Error',
+            f'Failed to load results:\n\n{error_msg}'
+        )
+        logger.error(f"Error loading results: {error_msg}")
+    
+    def _start_results_scan(self, folder, on_finished, on_error):
+        """
+        Scan a folder for processed results on a worker thread
+        
+        Results are added to the viewer in one batch. Only one scan
+        runs at a time; a running scan is stopped before the new one starts.
+        
+        Args:
+            folder: Folder holding per-image result subfolders
+            on_finished: Called with the number of results found
+            on_error: Called with the error message if the scan fails
+        """
+        self._stop_results_scan()
+        
+        results_viewer = self._get_results_viewer()
+        
+        queued = Qt.ConnectionType.QueuedConnection
+        self.scan_worker = ResultsScanWorker(folder)
+        self.scan_worker.results_found.connect(
+            results_viewer.add_processed_images, queued
+        )
+        self.scan_worker.finished_signal.connect(on_finished, queued)
+        self.scan_worker.error_signal.connect(on_error, queued)
+        self.scan_worker.start()
+    
+    def _stop_results_scan(self):
+        """Cancel a running results scan and wait for it to exit"""
+        if self.scan_worker and self.scan_worker.isRunning():
+            self.scan_worker.blockSignals(True)
+            self.scan_worker.cancel()
+            self.scan_worker.wait()
+            # Deliver results it queued before stopping
+            QCoreApplication.sendPostedEvents(
+                self.results_viewer, QEvent.Type.MetaCall
             )
-            logger.error(f"Error loading results: {str(e)}")
     
     def _set_controls_enabled(self, enabled):
         """Enable/disable controls during processing"""
@@ -628,7 +672,6 @@ class MainWindow(QMainWindow):
         if enabled:        
             self._update_button_states()
         else:
-            self.validate_btn.setEnabled(False)
-            self.process_btn.setEnabled(False)
+            self._set_actions_enabled(False)
         
         self.load_results_btn.setEnabled(enabled)
\ No newline at end of file
@@ -2,8 +2,24 @@
 GUI widgets for SproutCV
 """
 
-from .file_selector import FileSelector
-from .log_viewer import LogViewer
-from .results_viewer import ResultsViewer
+import importlib
 
 __all__ = ['FileSelector', 'LogViewer', 'ResultsViewer']
+
+# Submodule providing each exported name; imported on first access so
+# importing one widget doesn't load the dependencies of the others
+_SUBMODULES = {
+    'FileSelector': '.file_selector',
+    'LogViewer': '.log_viewer',
+    'ResultsViewer': '.results_viewer',
+}
+
+
+def __getattr__(name):
+    """Import exported widgets on first access (PEP 562)"""
+    if name in _SUBMODULES:
+        module = importlib.import_module(_SUBMODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,23 @@
 File/Folder selection widget with drag-and-drop support
 """
 
+import os
+import stat
+
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout,
     QLabel, QPushButton, QFileDialog
 )
 from PySide6.QtCore import Qt, Signal
 
+# Skip the per-entry icon lookups and file operations that make dialogs
+# slow to open on folders with many files
+DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseCustomDirectoryIcons
+    | QFileDialog.Option.ReadOnly
+)
+FOLDER_DIALOG_OPTIONS = DIALOG_OPTIONS | QFileDialog.Option.ShowDirsOnly
+
 
 class FileSelector(QWidget):
     """Widget for selecting files or folders"""
@@ -67,14 +78,16 @@ class FileSelector(QWidget):
         if self.is_folder:
             path = QFileDialog.getExistingDirectory(
                 self,
-                "Select Folder"
+                "Select Folder",
+                options=FOLDER_DIALOG_OPTIONS
             )
         else:
             path, _ = QFileDialog.getOpenFileName(
                 self,
                 "Select File",
                 "",
-                self.file_filter
+                self.file_filter,
+                options=DIALOG_OPTIONS
             )
         
         if path:
@@ -108,14 +121,22 @@ class FileSelector(QWidget):
             event.acceptProposedAction()
     
     def dropEvent(self, event):
-        """Handle drop event"""
-        urls = event.mimeData().urls()
-        if urls:
-            path = urls[0].toLocalFile()
+        """Handle drop event, taking the first dropped path of the right type"""
+        is_wanted = stat.S_ISDIR if self.is_folder else stat.S_ISREG
+        
+        for url in event.mimeData().urls():
+            path = url.toLocalFile()
+            if not path:
+                continue
             
-            # Validate that it's the right type
-            import os
-            if self.is_folder and os.path.isdir(path):
-                self._set_path(path)
-            elif not self.is_folder and os.path.isfile(path):
+            # Validate that it's the right type (one stat per candidate)
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                continue
+            if is_wanted(mode):
                 self._set_path(path)
+                event.acceptProposedAction()
+                return
+        
+        event.ignore()
@@ -3,7 +3,37 @@ Log viewer widget for displaying processing messages
 """
 
 from PySide6.QtWidgets import QTextEdit
-from PySide6.QtGui import QTextCursor, QFont
+from PySide6.QtGui import QTextCursor, QFont, QTextCharFormat, QColor
+from PySide6.QtCore import QTimer
+
+from sproutcv.config import LoggingConfig
+
+
+# Message color by leading symbol, looked up with the first character
+SYMBOL_COLORS = {
+    "✅": "#2ecc71",  # Green
+    "✓": "#2ecc71",
+    "❌": "#e74c3c",  # Red
+    "⚠": "#f39c12",  # Orange
+    "ℹ": "#3498db",  # Blue
+}
+# Message color by leading word, checked in order
+PREFIX_COLORS = (
+    ("ERROR", "#e74c3c"),
+    ("WARNING", "#f39c12"),
+    ("INFO", "#3498db"),
+)
+DEFAULT_COLOR = "#ecf0f1"  # Default white
+
+# Delay before pending messages are written, coalescing bursts (ms)
+FLUSH_INTERVAL_MS = 30
+
+
+def _char_format(color):
+    """Create a char format with the given foreground color"""
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    return fmt
 
 
 class LogViewer(QTextEdit):
@@ -15,6 +45,9 @@ class LogViewer(QTextEdit):
         self.setReadOnly(True)
         self.setFont(QFont("Courier New", 9))
         
+        # Bound the document; Qt drops the oldest blocks past the limit
+        self.set_history_limit(LoggingConfig.GUI_MAX_LOG_LINES)
+        
         # Styling
         self.setStyleSheet("""
             QTextEdit {
@@ -25,26 +58,66 @@ class LogViewer(QTextEdit):
                 padding: 10px;
             }
         """)
+        
+        # Messages waiting for the next flush
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        
+        # One char format per color, reused for every message
+        colors = {DEFAULT_COLOR, *SYMBOL_COLORS.values()}
+        colors.update(color for _, color in PREFIX_COLORS)
+        self._formats = {color: _char_format(color) for color in colors}
+        
+        # Whether the document has any blocks written by _flush yet
+        self._has_text = False
+    
+    def set_history_limit(self, max_lines):
+        """Keep at most max_lines lines in the log (0 = unlimited)"""
+        self.document().setMaximumBlockCount(max_lines)
     
     def log(self, message):
-        """Add a log message with auto-scroll"""
-        # Color code based on message type
-        if message.startswith("✅") or message.startswith("✓"):
-            color = "#2ecc71"  # Green
-        elif message.startswith("❌") or message.startswith("ERROR"):
-            color = "#e74c3c"  # Red
-        elif message.startswith("⚠") or message.startswith("WARNING"):
-            color = "#f39c12"  # Orange
-        elif message.startswith("ℹ") or message.startswith("INFO"):
-            color = "#3498db"  # Blue
-        else:
-            color = "#ecf0f1"  # Default white
-        
-        # Append with color
-        self.setTextColor(color)
-        self.append(message)
+        """Queue a log message; queued messages are written together"""
+        self._pending.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def clear(self):
+        """Clear the log, including messages not yet written"""
+        self._pending.clear()
+        self._flush_timer.stop()
+        self._has_text = False
+        super().clear()
+    
+    def _format_for(self, message):
+        """Get the char format for a message based on its prefix"""
+        color = SYMBOL_COLORS.get(message[:1])
+        if color is None:
+            color = DEFAULT_COLOR
+            for prefix, prefix_color in PREFIX_COLORS:
+                if message.startswith(prefix):
+                    color = prefix_color
+                    break
+        return self._formats[color]
+    
+    def _flush(self):
+        """Write all pending messages in one edit and scroll to the end"""
+        if not self._pending:
+            return
+        
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for message in self._pending:
+            if self._has_text:
+                cursor.insertBlock()
+            self._has_text = True
+            cursor.insertText(message, self._format_for(message))
+        cursor.endEditBlock()
+        self._pending.clear()
         
         # Auto-scroll to bottom
-        cursor = self.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
         self.setTextCursor(cursor)
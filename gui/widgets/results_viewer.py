@@ -6,19 +6,112 @@ Properly handles separate skeleton, contour, and label overlays
 import os
 import cv2
 import json
+import logging
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QComboBox, QCheckBox, QPushButton, QSpinBox, QDoubleSpinBox,
     QColorDialog, QGroupBox, QScrollArea, QTabWidget,
     QSizePolicy, QFileDialog
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QImage, QPixmap, QColor
+from PySide6.QtCore import Qt, QSize, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QColor
 from typing import Dict, Any, List, Tuple
 
 from sproutcv.config import ViewerConfig
+from sproutcv.exceptions import ImageLoadError
+from sproutcv.gui.workers.render_worker import RenderWorker
+from sproutcv.io.image_io import read_image
+from sproutcv.utils.overlay_numba import paint_lut
 
+logger = logging.getLogger('sproutcv.results_viewer')
+
+# Delay before a redraw after overlay toggles, coalescing bursts (ms)
+RENDER_DELAY_MS = 30
+
+
+@lru_cache(maxsize=None)
+def _dilation_kernel(thickness):
+    """Get a (cached) square structuring element for growing lines"""
+    return cv2.getStructuringElement(cv2.MORPH_RECT, (thickness, thickness))
+
+
+@lru_cache(maxsize=128)
+def _color_stylesheet(r, g, b):
+    """Stylesheet for a color swatch button"""
+    return f"background-color: rgb({r}, {g}, {b}); border: 1px solid #000;"
+
+
+def _halve_image(image, times):
+    """Halve an image's size the given number of times with INTER_AREA"""
+    for _ in range(times):
+        h = image.shape[0] // 2
+        w = image.shape[1] // 2
+        # Crop to even sizes so OpenCV takes its fast 2x2 box path
+        image = cv2.resize(image[:h * 2, :w * 2], (w, h), interpolation=cv2.INTER_AREA)
+    return image
+
+
+def _halve_mask(mask, times):
+    """Halve a boolean mask's size the given number of times, keeping any set pixel"""
+    for _ in range(times):
+        h = mask.shape[0] // 2 * 2
+        w = mask.shape[1] // 2 * 2
+        mask = (mask[0:h:2, 0:w:2] | mask[1:h:2, 0:w:2]
+                | mask[0:h:2, 1:w:2] | mask[1:h:2, 1:w:2])
+    return mask
+
+
+class _RenderRequest:
+    """
+    Snapshot of the images and overlay settings one render draws from
+    
+    Taken on the GUI thread, so a render running on the worker thread is
+    not affected by later setting changes or image loads.
+    """
+    
+    def __init__(self, viewer, level=0):
+        """
+        Capture the viewer's current images and overlay settings
+        
+        Args:
+            viewer: ResultsViewer to snapshot
+            level: Number of times to halve the image before compositing
+        """
+        self.token = viewer._image_token
+        self.level = level
+        
+        self.original_image = viewer.original_image
+        self.skeleton_mask = viewer.skeleton_mask
+        self.contour_mask = viewer.contour_mask
+        self.overlay_metadata = viewer.overlay_metadata
+        
+        self.show_skeleton = viewer.show_skeleton
+        self.skeleton_color = viewer.skeleton_color
+        self.skeleton_thickness = viewer.skeleton_thickness
+        self.show_contours = viewer.show_contours
+        self.contour_color = viewer.contour_color
+        self.contour_thickness = viewer.contour_thickness
+        self.show_labels = viewer.show_labels
+        self.label_color = viewer.label_color
+        self.label_font_scale = viewer.label_font_scale
+        self.label_thickness = viewer.label_thickness
+        self.use_label_bg = viewer.use_label_bg
+        self.label_bg_color = viewer.label_bg_color
+        self.label_bg_opacity = viewer.label_bg_opacity
+        
+        # Identifies the loaded images, render size and every setting
+        self.key = (
+            self.token, level,
+            self.show_skeleton, self.skeleton_color, self.skeleton_thickness,
+            self.show_contours, self.contour_color, self.contour_thickness,
+            self.show_labels, self.label_color, self.label_font_scale,
+            self.label_thickness, self.use_label_bg, self.label_bg_color,
+            self.label_bg_opacity,
+        )
 
 
 class ResultsViewer(QWidget):
@@ -29,6 +122,7 @@ class ResultsViewer(QWidget):
         
         # State
         self.processed_images = []  # List of (name, folder_path) tuples
+        self._folders_by_name = {}  # First folder added for each name
         self.current_image_name = None
         self.current_folder = None
         
@@ -38,6 +132,30 @@ class ResultsViewer(QWidget):
         self.contour_mask = None
         self.overlay_metadata = None  # JSON data with paths and labels
         
+        # Render caches; _image_token changes whenever images are (re)loaded
+        self._image_token = 0
+        self._layer_cache = {}  # layer -> (key, dilated mask or packed index)
+        self._rendered = None  # (key, composited BGR image)
+        self._render_buffer = None  # Reused target for compositing
+        self._rgb_buffer = None  # Reused RGB copy of the displayed image
+        self._rgb_qimage = None  # QImage viewing _rgb_buffer
+        self._file_cache = {}  # (folder, name) -> loaded files, oldest first
+        QPixmapCache.setCacheLimit(ViewerConfig.PIXMAP_CACHE_KB)
+        
+        # Overlays are composited on a single pool thread; _render_lock
+        # guards the caches above while a render or export uses them
+        self._render_lock = threading.Lock()
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(1)
+        self._render_worker = None  # Render in progress
+        self._render_pending = False  # Redraw again once it finishes
+        
+        # Pending redraw for quick toggles
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(RENDER_DELAY_MS)
+        self._render_timer.timeout.connect(self._update_display)
+        
         # Overlay settings
         self.show_skeleton = True
         self.show_contours = True
@@ -67,6 +185,7 @@ class ResultsViewer(QWidget):
         selector_layout.addWidget(QLabel("<b>Select Image:</b>"))
         
         self.image_combo = QComboBox()
+        self.image_combo.view().setUniformItemSizes(True)
         self.image_combo.currentTextChanged.connect(self._on_image_selected)
         selector_layout.addWidget(self.image_combo, stretch=1)
         
@@ -104,17 +223,17 @@ class ResultsViewer(QWidget):
         
         self.skeleton_check = QCheckBox("Show Skeleton")
         self.skeleton_check.setChecked(self.show_skeleton)
-        self.skeleton_check.stateChanged.connect(self._update_display)
+        self.skeleton_check.stateChanged.connect(self._schedule_update)
         quick_controls.addWidget(self.skeleton_check)
         
         self.contour_check = QCheckBox("Show Contours")
         self.contour_check.setChecked(self.show_contours)
-        self.contour_check.stateChanged.connect(self._update_display)
+        self.contour_check.stateChanged.connect(self._schedule_update)
         quick_controls.addWidget(self.contour_check)
         
         self.labels_check = QCheckBox("Show Labels")
         self.labels_check.setChecked(self.show_labels)
-        self.labels_check.stateChanged.connect(self._update_display)
+        self.labels_check.stateChanged.connect(self._schedule_update)
         quick_controls.addWidget(self.labels_check)
         
         quick_controls.addStretch()
@@ -381,9 +500,10 @@ class ResultsViewer(QWidget):
             # It's a QColor
             r, g, b = bgr_color.red(), bgr_color.green(), bgr_color.blue()
         
-        button.setStyleSheet(
-            f"background-color: rgb({r}, {g}, {b}); border: 1px solid #000;"
-        )
+        # Setting a stylesheet re-polishes the button, even an identical one
+        stylesheet = _color_stylesheet(r, g, b)
+        if button.styleSheet() != stylesheet:
+            button.setStyleSheet(stylesheet)
     
     def _pick_color(self, color_type):
         """Open color picker dialog"""
@@ -422,16 +542,35 @@ class ResultsViewer(QWidget):
     def add_processed_image(self, image_name, folder_path):
         """Add a processed image to the viewer"""
         self.processed_images.append((image_name, folder_path))
+        self._folders_by_name.setdefault(image_name, folder_path)
         self.image_combo.addItem(image_name)
     
+    def add_processed_images(self, items):
+        """
+        Add several processed images to the viewer at once
+        
+        The combo box gets all names in a single insert, so it is laid
+        out once rather than once per image.
+        
+        Args:
+            items: List of (image_name, folder_path) tuples
+        """
+        self.processed_images.extend(items)
+        for name, path in items:
+            self._folders_by_name.setdefault(name, path)
+        self.image_combo.addItems([name for name, _ in items])
+    
     def clear_images(self):
         """Clear all loaded images"""
         self.processed_images.clear()
+        self._folders_by_name.clear()
         self.image_combo.clear()
         self.original_image = None
         self.skeleton_mask = None
         self.contour_mask = None
         self.overlay_metadata = None
+        self._file_cache.clear()
+        self._invalidate_render_cache()
         self.image_label.setText("No image loaded")
         self.data_display.setText("No data loaded")
         self.status_label.setText("Ready")
@@ -442,11 +581,7 @@ class ResultsViewer(QWidget):
             return
         
         # Find folder for selected image
-        folder = None
-        for name, path in self.processed_images:
-            if name == image_name:
-                folder = path
-                break
+        folder = self._folders_by_name.get(image_name)
         
         if not folder:
             return
@@ -467,6 +602,7 @@ class ResultsViewer(QWidget):
         self.skeleton_mask = None
         self.contour_mask = None
         self.overlay_metadata = None
+        self._invalidate_render_cache()
 
         if not self.current_folder or not self.current_image_name:
             return
@@ -476,6 +612,14 @@ class ResultsViewer(QWidget):
         # ✅ Sanitize base folder path
         self.current_folder = os.path.abspath(self.current_folder)
 
+        # List the folder once instead of probing each candidate file;
+        # names are matched case-insensitively (IMG.JPG, mask_*.PNG, ...)
+        try:
+            with os.scandir(self.current_folder) as it:
+                names = {entry.name.lower(): entry.name for entry in it}
+        except OSError:
+            names = {}
+
         # Load original image (multi-extension)
         extensions = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
         original_path = None
@@ -491,70 +635,155 @@ class ResultsViewer(QWidget):
                 self.status_label.setText("⚠️ Invalid file path detected")
                 return
 
-            if os.path.exists(potential_path):
-                original_path = potential_path
+            filename = names.get(os.path.basename(potential_path).lower())
+            if filename is not None:
+                original_path = os.path.join(self.current_folder, filename)
                 break
 
         if not original_path:
             self.status_label.setText("⚠️ Original image not found")
             return
 
+        def existing(filename):
+            """Full path of a file in the folder, or None if it's missing"""
+            filename = names.get(filename.lower())
+            if filename is not None:
+                return os.path.join(self.current_folder, filename)
+            return None
+
+        # Mask PNGs are preferred over the older JPEG skeleton overlays
+        skeleton_path = (
+            existing(f"mask_skeleton_{self.current_image_name}.png")
+            or existing(f"skeletons_{self.current_image_name}.jpg")
+        )
+        contour_path = existing(f"mask_contour_{self.current_image_name}.png")
+        metadata_path = existing(f"overlay_data_{self.current_image_name}.json")
+        
+        # Reuse the previous load if none of the files changed since
+        signature = self._file_signature(
+            original_path, skeleton_path, contour_path, metadata_path
+        )
+        entry = self._cache_entry(self.current_folder, self.current_image_name)
+        cached = entry.get('images')
+        if cached is not None and cached[0] == signature:
+            (self.original_image, self.skeleton_mask,
+             self.contour_mask, self.overlay_metadata) = cached[1]
+            self.status_label.setText("✓ Images loaded")
+            return
+
         try:
             # ✅ Size validation before loading
             size_mb = os.path.getsize(original_path) / (1024 * 1024)
             if size_mb > 100:  # 100 MB safety limit
                 self.status_label.setText(f"⚠️ Image too large: {size_mb:.1f} MB")
                 return
-
-            self.original_image = cv2.imread(original_path)
-
-            if self.original_image is None:
-                self.status_label.setText("⚠️ Failed to read image (cv2.imread returned None)")
-                return
-
-            self.status_label.setText(f"Loaded original: {os.path.basename(original_path)}")
-
         except Exception as e:
             self.status_label.setText(f"⚠️ Failed to load image: {e}")
             return
 
-        # Load skeleton mask
-        skeleton_mask_path = os.path.join(
-            self.current_folder,
-            f"mask_skeleton_{self.current_image_name}.png"
-        )
-        if os.path.exists(skeleton_mask_path):
-            self.skeleton_mask = cv2.imread(skeleton_mask_path, cv2.IMREAD_GRAYSCALE)
-        else:
-            skeleton_path = os.path.join(
-                self.current_folder,
-                f"skeletons_{self.current_image_name}.jpg"
+        # Decode the image, masks and metadata in parallel; OpenCV
+        # releases the GIL while decoding
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            original_future = executor.submit(read_image, original_path)
+            skeleton_future = (
+                executor.submit(self._read_mask, skeleton_path)
+                if skeleton_path else None
+            )
+            contour_future = (
+                executor.submit(self._read_mask, contour_path)
+                if contour_path else None
+            )
+            metadata_future = (
+                executor.submit(self._read_metadata, metadata_path)
+                if metadata_path else None
             )
-            if os.path.exists(skeleton_path):
-                self.skeleton_mask = cv2.imread(skeleton_path, cv2.IMREAD_GRAYSCALE)
-
-        # Load contour mask
-        contour_mask_path = os.path.join(
-            self.current_folder,
-            f"mask_contour_{self.current_image_name}.png"
-        )
-        if os.path.exists(contour_mask_path):
-            self.contour_mask = cv2.imread(contour_mask_path, cv2.IMREAD_GRAYSCALE)
 
-        # Load overlay metadata (JSON)
-        metadata_path = os.path.join(
-            self.current_folder,
-            f"overlay_data_{self.current_image_name}.json"
-        )
-        if os.path.exists(metadata_path):
             try:
-                with open(metadata_path, 'r') as f:
-                    self.overlay_metadata = json.load(f)
+                self.original_image = original_future.result()
+                self.status_label.setText(f"Loaded original: {os.path.basename(original_path)}")
+
+            except ImageLoadError as e:
+                self.status_label.setText(f"⚠️ {e}")
+                return
             except Exception as e:
-                print(f"Warning: Could not load overlay metadata: {e}")
+                self.status_label.setText(f"⚠️ Failed to load image: {e}")
+                return
 
+            if skeleton_future is not None:
+                self.skeleton_mask = skeleton_future.result()
+            if contour_future is not None:
+                self.contour_mask = contour_future.result()
+            if metadata_future is not None:
+                self.overlay_metadata = metadata_future.result()
+
+        entry['images'] = (signature, (
+            self.original_image, self.skeleton_mask,
+            self.contour_mask, self.overlay_metadata
+        ))
         self.status_label.setText("✓ Images loaded")
 
+    @staticmethod
+    def _read_mask(mask_path):
+        """Load a grayscale overlay mask, or None if it can't be read"""
+        try:
+            return read_image(mask_path, cv2.IMREAD_GRAYSCALE)
+        except ImageLoadError:
+            return None
+
+    @staticmethod
+    def _read_metadata(metadata_path):
+        """Load overlay metadata (JSON), or None if it can't be read"""
+        try:
+            with open(metadata_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load overlay metadata: {e}")
+            return None
+
+    def _file_signature(self, *paths):
+        """
+        Get the modification time of each path, to tell when files change
+        
+        Args:
+            *paths: File paths to check (None for files known to be missing)
+            
+        Returns:
+            tuple: st_mtime_ns per path, None for paths that don't exist
+        """
+        signature = []
+        for path in paths:
+            if path is None:
+                signature.append(None)
+                continue
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _cache_entry(self, folder, name):
+        """
+        Get the cached files of an image, marking it as most recently used
+        
+        Only the last ViewerConfig.FILE_CACHE_SIZE images are kept.
+        
+        Args:
+            folder: Results folder of the image
+            name: Image name
+            
+        Returns:
+            dict: Cache slots for the image ('images', 'measurements')
+        """
+        key = (folder, name)
+        entry = self._file_cache.pop(key, None)
+        if entry is None:
+            entry = {}
+        self._file_cache[key] = entry
+        
+        while len(self._file_cache) > ViewerConfig.FILE_CACHE_SIZE:
+            del self._file_cache[next(iter(self._file_cache))]
+        return entry
+
 
     
     def _load_measurement_data(self):
@@ -567,35 +796,56 @@ class ResultsViewer(QWidget):
             f"sprout_lengths_{self.current_image_name}.csv"
         )
         
-        if os.path.exists(csv_path):
+        signature = self._file_signature(csv_path)
+        if signature[0] is not None:
+            entry = self._cache_entry(self.current_folder, self.current_image_name)
+            cached = entry.get('measurements')
+            if cached is not None and cached[0] == signature:
+                self.data_display.setText(cached[1])
+                self.data_display.setTextFormat(Qt.TextFormat.RichText)
+                return
+            
             try:
                 import pandas as pd
                 df = pd.read_csv(csv_path)
                 
                 # Format data for display
-                html = "<table style='width:100%; border-collapse: collapse;'>"
-                html += "<tr style='background-color: #3498db; color: white;'>"
-                html += "<th style='padding: 8px; border: 1px solid #ddd;'>Sprout #</th>"
-                html += "<th style='padding: 8px; border: 1px solid #ddd;'>Pixels</th>"
-                html += "<th style='padding: 8px; border: 1px solid #ddd;'>Millimeters</th>"
-                html += "</tr>"
-                
-                for _, row in df.iterrows():
-                    html += "<tr style='background-color: white;'>"
-                    html += f"<td style='padding: 8px; border: 1px solid #ddd; text-align: center;'>{int(row['Sprout Number'])}</td>"
-                    html += f"<td style='padding: 8px; border: 1px solid #ddd; text-align: right;'>{row['Pixels']:.2f}</td>"
-                    html += f"<td style='padding: 8px; border: 1px solid #ddd; text-align: right;'>{row['Millimeters']:.2f}</td>"
-                    html += "</tr>"
+                header = (
+                    "<table style='width:100%; border-collapse: collapse;'>"
+                    "<tr style='background-color: #3498db; color: white;'>"
+                    "<th style='padding: 8px; border: 1px solid #ddd;'>Sprout #</th>"
+                    "<th style='padding: 8px; border: 1px solid #ddd;'>Pixels</th>"
+                    "<th style='padding: 8px; border: 1px solid #ddd;'>Millimeters</th>"
+                    "</tr>"
+                )
                 
-                html += "</table>"
+                # Format whole columns, then join the rows in one pass
+                rows = [
+                    "<tr style='background-color: white;'>"
+                    f"<td style='padding: 8px; border: 1px solid #ddd; text-align: center;'>{int(number)}</td>"
+                    f"<td style='padding: 8px; border: 1px solid #ddd; text-align: right;'>{pixels:.2f}</td>"
+                    f"<td style='padding: 8px; border: 1px solid #ddd; text-align: right;'>{millimeters:.2f}</td>"
+                    "</tr>"
+                    for number, pixels, millimeters in zip(
+                        df['Sprout Number'].tolist(),
+                        df['Pixels'].tolist(),
+                        df['Millimeters'].tolist()
+                    )
+                ]
                 
                 # Add summary statistics
-                html += f"<p style='margin-top: 15px;'><b>Summary:</b></p>"
-                html += f"<p>Total Sprouts: {len(df)}</p>"
-                html += f"<p>Average Length: {df['Millimeters'].mean():.2f} mm</p>"
-                html += f"<p>Min Length: {df['Millimeters'].min():.2f} mm</p>"
-                html += f"<p>Max Length: {df['Millimeters'].max():.2f} mm</p>"
+                stats = df['Millimeters'].agg(['mean', 'min', 'max'])
+                summary = (
+                    f"<p style='margin-top: 15px;'><b>Summary:</b></p>"
+                    f"<p>Total Sprouts: {len(df)}</p>"
+                    f"<p>Average Length: {stats['mean']:.2f} mm</p>"
+                    f"<p>Min Length: {stats['min']:.2f} mm</p>"
+                    f"<p>Max Length: {stats['max']:.2f} mm</p>"
+                )
                 
+                html = "".join([header, *rows, "</table>", summary])
+                
+                entry['measurements'] = (signature, html)
                 self.data_display.setText(html)
                 self.data_display.setTextFormat(Qt.TextFormat.RichText)
                 
@@ -604,12 +854,20 @@ class ResultsViewer(QWidget):
         else:
             self.data_display.setText("No measurement data found")
     
+    def _schedule_update(self):
+        """Redraw shortly, so a burst of toggles renders only once"""
+        self._render_timer.start()
+    
     def _update_display(self):
         """Render and display the image with current overlay settings"""
+        self._render_timer.stop()
         if self.original_image is None:
             return
         
-        self.status_label.setText("Rendering...")
+        if self._render_worker is not None:
+            # Redraw with the latest settings once the current render is in
+            self._render_pending = True
+            return
         
         # Get current settings
         self.show_skeleton = self.skeleton_check.isChecked()
@@ -623,73 +881,298 @@ class ResultsViewer(QWidget):
         self.use_label_bg = self.label_bg_check.isChecked()
         self.label_bg_opacity = self.label_bg_opacity_spin.value()
         
-        # Start with original image
-        display_image = self.original_image.copy()
+        # Composite at the smallest size that still covers the view
+        label_size = self.image_label.size()
+        request = _RenderRequest(self, self._display_level())
         
-        # Apply skeleton overlay
-        if self.show_skeleton and self.skeleton_mask is not None:
-            display_image = self._apply_skeleton_overlay(display_image)
+        cached = QPixmapCache.find(self._pixmap_cache_key(request, label_size))
+        if cached is not None:
+            self.image_label.setPixmap(cached)
+            self.status_label.setText("✓ Rendered")
+            return
         
-        # Apply contour overlay
-        if self.show_contours and self.contour_mask is not None:
-            display_image = self._apply_contour_overlay(display_image)
+        self.status_label.setText("Rendering...")
         
-        # Apply label overlay
-        if self.show_labels and self.overlay_metadata is not None:
-            display_image = self._apply_label_overlay(display_image)
+        # Composite and scale on the render thread
+        worker = RenderWorker(self._render_frame, request, label_size)
+        worker.signals.finished_signal.connect(
+            self._on_render_finished, Qt.ConnectionType.QueuedConnection
+        )
+        worker.signals.error_signal.connect(
+            self._on_render_error, Qt.ConnectionType.QueuedConnection
+        )
+        self._render_worker = worker
+        self._render_pool.start(worker)
+    
+    def _on_render_finished(self, result):
+        """Show a finished render, then start any redraw queued meanwhile"""
+        request, cache_key, image = result
+        self._render_worker = None
+        
+        # Renders of images that were replaced since are dropped
+        if request.token == self._image_token:
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(cache_key, pixmap)
+            self.image_label.setPixmap(pixmap)
+            self.status_label.setText("✓ Rendered")
+        
+        if self._render_pending:
+            self._render_pending = False
+            self._update_display()
+    
+    def _on_render_error(self, error_msg):
+        """Report a failed render"""
+        self._render_worker = None
+        self.status_label.setText(f"⚠️ Render failed: {error_msg}")
         
-        # Convert to QPixmap and display
-        self._display_cv_image(display_image)
-        self.status_label.setText("✓ Rendered")
+        if self._render_pending:
+            self._render_pending = False
+            self._update_display()
     
-    def _apply_skeleton_overlay(self, image):
-        """Apply skeleton overlay with custom color and thickness"""
-        result = image.copy()
+    def _display_level(self):
+        """
+        Get how many times the image can be halved and still cover the view
+        
+        Returns:
+            int: Number of halvings, 0 to render at full resolution
+        """
+        h, w = self.original_image.shape[:2]
+        fit = QSize(w, h).scaled(self.image_label.size(), Qt.AspectRatioMode.KeepAspectRatio)
+        level = 0
+        while not fit.isEmpty() and w // 2 >= fit.width() and h // 2 >= fit.height():
+            w //= 2
+            h //= 2
+            level += 1
+        return level
+    
+    def _pixmap_cache_key(self, request, label_size):
+        """QPixmapCache key for a render scaled to the given label size"""
+        return f"sproutcv.viewer:{request.key}:{label_size.width()}x{label_size.height()}"
+    
+    def _render_view(self, request):
+        """
+        Composite the overlays onto the original image
         
-        # Create colored skeleton
-        mask = self.skeleton_mask > 0
+        The result is kept until the images or any overlay setting change,
+        so repeated redraws and exports reuse it. Callers hold _render_lock.
         
-        if self.skeleton_thickness > 1:
-            # Dilate mask for thickness
-            kernel = np.ones((self.skeleton_thickness, self.skeleton_thickness), np.uint8)
-            mask = cv2.dilate(mask.astype(np.uint8), kernel).astype(bool)
+        Args:
+            request: _RenderRequest with the images and settings to draw
+            
+        Returns:
+            np.ndarray: BGR image with the enabled overlays
+        """
+        if self._rendered is not None and self._rendered[0] == request.key:
+            return self._rendered[1]
         
-        # Apply color
-        result[mask] = self.skeleton_color
+        base_image = self._base_image(request)
         
-        return result
-    
-    def _apply_contour_overlay(self, image):
-        """Apply contour overlay with custom color and thickness"""
-        result = image.copy()
+        # Nothing to draw: show the (halved) original as is, without a copy
+        if not self._has_overlays(request):
+            self._rendered = (request.key, base_image)
+            return base_image
+        
+        # Start with original image, copied into the reused buffer
+        if (self._render_buffer is None
+                or self._render_buffer.shape != base_image.shape):
+            self._render_buffer = np.empty_like(base_image)
+        display_image = self._render_buffer
+        np.copyto(display_image, base_image)
         
-        # Create colored contour
-        mask = self.contour_mask > 0
+        # Apply skeleton and contour overlays
+        self._apply_mask_overlays(display_image, request)
         
-        if self.contour_thickness > 1:
-            # Dilate mask for thickness
-            kernel = np.ones((self.contour_thickness, self.contour_thickness), np.uint8)
-            mask = cv2.dilate(mask.astype(np.uint8), kernel).astype(bool)
+        # Apply label overlay
+        if request.show_labels and request.overlay_metadata is not None:
+            self._apply_label_overlay(display_image, request)
         
-        # Apply color
-        result[mask] = self.contour_color
+        self._rendered = (request.key, display_image)
+        return display_image
+    
+    def _has_overlays(self, request):
+        """Check whether any enabled overlay has something to draw"""
+        return (
+            (request.show_skeleton and request.skeleton_mask is not None)
+            or (request.show_contours and request.contour_mask is not None)
+            or (request.show_labels and request.overlay_metadata is not None)
+        )
+    
+    def _invalidate_render_cache(self):
+        """Drop cached layers and composites after the images change"""
+        self._image_token += 1
+        self._layer_cache.clear()
+        self._rendered = None
+    
+    def _base_image(self, request):
+        """
+        Get the original image halved request.level times, cached per image
         
+        Args:
+            request: _RenderRequest with the original image and level
+            
+        Returns:
+            np.ndarray: BGR image
+        """
+        if request.level == 0:
+            return request.original_image
+        
+        key = (request.token, request.level)
+        cached = self._layer_cache.get('original')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        result = _halve_image(request.original_image, request.level)
+        self._layer_cache['original'] = (key, result)
         return result
     
-    def _apply_label_overlay(self, image):
-        """Apply label overlay with custom settings"""
-        result = image.copy()
+    def _base_rgb_image(self, request):
+        """
+        Get the (halved) original as an RGB QImage, cached per image
         
-        if 'labels' not in self.overlay_metadata:
-            return result
+        Lets views without overlays skip the color conversion.
+        
+        Args:
+            request: _RenderRequest with the original image and level
+            
+        Returns:
+            QImage: RGB888 image viewing a cached RGB array
+        """
+        key = (request.token, request.level)
+        cached = self._layer_cache.get('rgb')
+        if cached is not None and cached[0] == key:
+            return cached[1][1]
+        
+        rgb = cv2.cvtColor(self._base_image(request), cv2.COLOR_BGR2RGB)
+        h, w, ch = rgb.shape
+        qimage = QImage(rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
+        # The array is cached with the QImage, which doesn't own its pixels
+        self._layer_cache['rgb'] = (key, (rgb, qimage))
+        return qimage
+    
+    def _dilated_mask(self, request, layer, mask, thickness):
+        """
+        Get the boolean mask of a layer grown to the given line thickness
+        
+        Cached per layer, so toggling or recoloring other overlays doesn't
+        dilate the mask again.
+        
+        Args:
+            request: _RenderRequest the mask belongs to
+            layer: Layer name used as cache slot ('skeleton' or 'contour')
+            mask: Grayscale mask (non-zero = layer pixel)
+            thickness: Line thickness in pixels
+            
+        Returns:
+            np.ndarray: Boolean mask
+        """
+        key = (request.token, thickness)
+        cached = self._layer_cache.get(layer)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        result = mask > 0
+        
+        if thickness > 1:
+            # Dilate mask for thickness; OpenCV runs full rectangular
+            # kernels as separate row and column passes
+            # bool and uint8 0/1 share a layout, so view instead of converting
+            result = cv2.dilate(result.view(np.uint8), _dilation_kernel(thickness)).view(bool)
+        
+        self._layer_cache[layer] = (key, result)
+        return result
+    
+    def _overlay_index(self, request):
+        """
+        Get the skeleton and contour layers packed into one index image
+        
+        Bit 0 marks dilated skeleton pixels and bit 1 dilated contour
+        pixels. Visibility and colors are not part of it, so it is only
+        rebuilt when the images, a line thickness or the level change.
+        Lines are dilated at full resolution and kept at least one pixel
+        wide when halved.
+        
+        Args:
+            request: _RenderRequest with the masks, thicknesses and level
+        
+        Returns:
+            np.ndarray: uint8 index image with values 0-3
+        """
+        level = request.level
+        key = (request.token, level, request.skeleton_thickness, request.contour_thickness)
+        cached = self._layer_cache.get('packed')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        index = np.zeros(self._base_image(request).shape[:2], dtype=np.uint8)
+        if request.skeleton_mask is not None:
+            skeleton = self._dilated_mask(
+                request, 'skeleton', request.skeleton_mask, request.skeleton_thickness
+            )
+            index |= _halve_mask(skeleton, level).view(np.uint8)
+        if request.contour_mask is not None:
+            contour = self._dilated_mask(
+                request, 'contour', request.contour_mask, request.contour_thickness
+            )
+            index |= _halve_mask(contour, level).view(np.uint8) << 1
         
-        for label_info in self.overlay_metadata['labels']:
+        self._layer_cache['packed'] = (key, index)
+        return index
+    
+    def _apply_mask_overlays(self, image, request):
+        """Apply the skeleton and contour overlays in one pass (in place)"""
+        show_skeleton = request.show_skeleton and request.skeleton_mask is not None
+        show_contours = request.show_contours and request.contour_mask is not None
+        if not (show_skeleton or show_contours):
+            return
+        
+        # Color per index value; contours are drawn over the skeleton
+        lut = np.zeros((4, 3), dtype=np.uint8)
+        enabled = np.zeros(4, dtype=np.bool_)
+        if show_skeleton:
+            lut[1] = lut[3] = request.skeleton_color
+            enabled[1] = enabled[3] = True
+        if show_contours:
+            lut[2] = lut[3] = request.contour_color
+            enabled[2] = enabled[3] = True
+        
+        paint_lut(image, self._overlay_index(request), lut, enabled)
+    
+    def _label_geometry(self, request):
+        """
+        Get each label's text, anchor and background rectangle
+        
+        Text sizes only depend on the label text, font scale and thickness,
+        so they are measured once per loaded image, font setting and level.
+        
+        Args:
+            request: _RenderRequest with the labels, font settings and level;
+                positions and font are scaled to the level
+        
+        Returns:
+            tuple: (font_scale, thickness, outline_thickness, labels), where
+                labels is a list of (text, (x, y), top_left, bottom_right)
+                tuples with the rectangle corners padded around the text
+        """
+        level = request.level
+        key = (request.token, level, request.label_font_scale, request.label_thickness)
+        cached = self._layer_cache.get('labels')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        scale = 0.5 ** level
+        font_scale = request.label_font_scale * scale
+        thickness = max(1, round(request.label_thickness * scale))
+        # The outline is 2 px wider at full size and always stays visible
+        outline_thickness = max(thickness + 1, round((request.label_thickness + 2) * scale))
+        padding = max(1, round(4 * scale))
+        
+        labels = []
+        for label_info in request.overlay_metadata.get('labels', []):
             text = label_info['text']
             x, y = label_info['position']
-            
-            # Use custom font scale and thickness
-            font_scale = self.label_font_scale
-            thickness = self.label_thickness
+            if level:
+                x = int(x * scale)
+                y = int(y * scale)
             
             # Calculate text size
             (text_width, text_height), baseline = cv2.getTextSize(
@@ -699,72 +1182,120 @@ class ResultsViewer(QWidget):
                 thickness
             )
             
+            labels.append((
+                text,
+                (x, y),
+                (x - padding, y - text_height - padding),
+                (x + text_width + padding, y + baseline + padding)
+            ))
+        
+        geometry = (font_scale, thickness, outline_thickness, labels)
+        self._layer_cache['labels'] = (key, geometry)
+        return geometry
+    
+    def _apply_label_overlay(self, image, request):
+        """Apply label overlay with custom settings (in place)"""
+        # Use custom font scale and thickness, scaled to the level
+        font_scale, thickness, outline_thickness, labels = self._label_geometry(request)
+        
+        for text, position, top_left, bottom_right in labels:
             # Draw background if enabled
-            if self.use_label_bg:
-                # Create semi-transparent background
-                overlay = result.copy()
-                padding = 4
-                cv2.rectangle(
-                    overlay,
-                    (x - padding, y - text_height - padding),
-                    (x + text_width + padding, y + baseline + padding),
-                    self.label_bg_color,
-                    -1
-                )
-                # Blend with opacity
-                cv2.addWeighted(overlay, self.label_bg_opacity, result, 1 - self.label_bg_opacity, 0, result)
+            if request.use_label_bg:
+                # Blend the semi-transparent background over its own region
+                # only (rectangle corners inclusive, clipped to the image)
+                x1 = max(top_left[0], 0)
+                y1 = max(top_left[1], 0)
+                x2 = min(bottom_right[0] + 1, image.shape[1])
+                y2 = min(bottom_right[1] + 1, image.shape[0])
+                if x1 < x2 and y1 < y2:
+                    roi = image[y1:y2, x1:x2]
+                    background = np.empty_like(roi)
+                    background[:] = request.label_bg_color
+                    cv2.addWeighted(background, request.label_bg_opacity, roi, 1 - request.label_bg_opacity, 0, dst=roi)
             
             # Draw text outline (black)
             cv2.putText(
-                result,
+                image,
                 text,
-                (x, y),
+                position,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 font_scale,
                 (0, 0, 0),  # Black outline
-                thickness + 2,
+                outline_thickness,
                 cv2.LINE_AA
             )
             
             # Draw text
             cv2.putText(
-                result,
+                image,
                 text,
-                (x, y),
+                position,
                 cv2.FONT_HERSHEY_SIMPLEX,
                 font_scale,
-                self.label_color,
+                request.label_color,
                 thickness,
                 cv2.LINE_AA
             )
-        
-        return result
     
-    def _display_cv_image(self, cv_image):
-        """Convert OpenCV image to QPixmap and display"""
-        # Convert BGR to RGB
-        rgb_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB)
+    def _render_frame(self, request, label_size):
+        """
+        Render a view and scale it for display (runs on the render thread)
         
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        
-        qt_image = QImage(
-            rgb_image.data, 
-            w, h, 
-            bytes_per_line, 
-            QImage.Format.Format_RGB888
-        )
-        
-        pixmap = QPixmap.fromImage(qt_image)
-        
-        # Scale to fit while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            self.image_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        Args:
+            request: _RenderRequest with the images and settings to draw
+            label_size: Size of the image label to fit the view into
+            
+        Returns:
+            tuple: (request, pixmap cache key, scaled QImage)
+        """
+        with self._render_lock:
+            cv_image = self._render_view(request)
+            
+            # Halve much larger images first with INTER_AREA (a fast 2x2
+            # box filter), so smooth scaling only finishes a small image
+            h, w = cv_image.shape[:2]
+            fit = QSize(w, h).scaled(label_size, Qt.AspectRatioMode.KeepAspectRatio)
+            halved = False
+            while not fit.isEmpty() and w // 2 >= fit.width() and h // 2 >= fit.height():
+                w //= 2
+                h //= 2
+                cv_image = cv2.resize(
+                    cv_image[:h * 2, :w * 2],
+                    (w, h),
+                    interpolation=cv2.INTER_AREA
+                )
+                halved = True
+            
+            if not halved and not self._has_overlays(request):
+                # Plain original: reuse its cached RGB conversion
+                rgb_qimage = self._base_rgb_image(request)
+            else:
+                # Convert BGR to RGB into the reused buffer; the QImage views it
+                if self._rgb_buffer is None or self._rgb_buffer.shape != cv_image.shape:
+                    h, w, ch = cv_image.shape
+                    self._rgb_buffer = np.empty_like(cv_image)
+                    self._rgb_qimage = QImage(
+                        self._rgb_buffer.data, 
+                        w, h, 
+                        ch * w, 
+                        QImage.Format.Format_RGB888
+                    )
+                cv2.cvtColor(cv_image, cv2.COLOR_BGR2RGB, dst=self._rgb_buffer)
+                rgb_qimage = self._rgb_qimage
+            
+            # Scale to fit while maintaining aspect ratio
+            scaled_image = rgb_qimage.scaled(
+                label_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            # An unscaled result still shares the source pixels; detach it
+            # so the buffer can be overwritten (or the cached original
+            # dropped) before it is displayed
+            if scaled_image.size() == rgb_qimage.size():
+                scaled_image = rgb_qimage.copy()
         
-        self.image_label.setPixmap(scaled_pixmap)
+        return request, self._pixmap_cache_key(request, label_size), scaled_image
     
     def _refresh_current_image(self):
         """Refresh the current image"""
@@ -786,19 +1317,11 @@ class ResultsViewer(QWidget):
         )
         
         if file_path:
-            # Render current view
-            display_image = self.original_image.copy()
-            
-            if self.show_skeleton and self.skeleton_mask is not None:
-                display_image = self._apply_skeleton_overlay(display_image)
-            
-            if self.show_contours and self.contour_mask is not None:
-                display_image = self._apply_contour_overlay(display_image)
-            
-            if self.show_labels and self.overlay_metadata is not None:
-                display_image = self._apply_label_overlay(display_image)
-            
-            cv2.imwrite(file_path, display_image)
+            # Render current view at full resolution
+            with self._render_lock:
+                display_image = self._render_view(_RenderRequest(self))
+                
+                cv2.imwrite(file_path, display_image)
             self.status_label.setText(f"✓ Exported to {os.path.basename(file_path)}")
     
     def _reset_to_defaults(self):
@@ -2,6 +2,24 @@
 Worker threads for SproutCV
 """
 
-from .pipeline_worker import PipelineWorker
+import importlib
 
-__all__ = ['PipelineWorker']
+__all__ = ['PipelineWorker', 'RenderWorker', 'ResultsScanWorker']
+
+# Submodule providing each exported name; imported on first access so
+# importing one worker doesn't load the dependencies of the others
+_SUBMODULES = {
+    'PipelineWorker': '.pipeline_worker',
+    'RenderWorker': '.render_worker',
+    'ResultsScanWorker': '.results_scan_worker',
+}
+
+
+def __getattr__(name):
+    """Import exported workers on first access (PEP 562)"""
+    if name in _SUBMODULES:
+        module = importlib.import_module(_SUBMODULES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
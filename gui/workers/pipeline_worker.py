@@ -1,27 +1,50 @@
 """
-QThread worker for running the processing pipeline
+Thread pool worker for running the processing pipeline
 """
 
-from PySide6.QtCore import QThread, Signal
+import queue
+import threading
+import time
+
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from sproutcv.core.pipeline import run_pipeline, dry_run_pipeline
+from sproutcv.exceptions import ProcessingCancelledError
+
+# Least time between two progress signals (s); the final 1.0 always goes out
+PROGRESS_INTERVAL_S = 0.05
 
 
-class PipelineWorker(QThread):
+class PipelineSignals(QObject):
     """
-    Worker thread for running the sprout analysis pipeline
+    Signals emitted by a PipelineWorker
+    
+    QRunnable is not a QObject, so the worker carries its signals on this
+    object, which lives on the thread that created the worker.
+    
+    Log messages don't go through a signal; they are put on the worker's
+    log_queue for the GUI to drain in batches.
     
     Signals:
-        log_signal: Emitted with log messages (str)
         progress_signal: Emitted with progress value 0.0-1.0 (float)
         finished_signal: Emitted when processing completes successfully
+        cancelled_signal: Emitted when processing stops after cancel()
         error_signal: Emitted with error message if processing fails (str)
     """
     
-    log_signal = Signal(str)
     progress_signal = Signal(float)
     finished_signal = Signal()
+    cancelled_signal = Signal()
     error_signal = Signal(str)
+
+
+class PipelineWorker(QRunnable):
+    """
+    Runnable that executes the sprout analysis pipeline on a pool thread
+    
+    Start it with QThreadPool.start(); connect to the signals on
+    worker.signals beforehand and drain worker.log_queue for log messages.
+    """
     
     def __init__(self, folder, csv_path, output_root=None, 
                  dry_run=False, verbose=False):
@@ -36,7 +59,14 @@ class PipelineWorker(QThread):
             verbose: If True, show detailed validation messages
         """
         super().__init__()
-        self._is_cancelled = False
+        # The caller keeps a reference; don't let the pool delete it
+        self.setAutoDelete(False)
+        
+        self.signals = PipelineSignals()
+        self.log_queue = queue.SimpleQueue()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        self._last_progress_time = None
 
         self.folder = folder
         self.csv_path = csv_path
@@ -45,22 +75,36 @@ class PipelineWorker(QThread):
         self.verbose = verbose
     
     def cancel(self):
-        """Request cancellation of processing"""
-        self._is_cancelled = True    
+        """Request cancellation; processing stops after the current image"""
+        self._cancelled.set()
+    
+    def is_done(self):
+        """Check whether run() has returned"""
+        return self._done.is_set()
+    
+    def _emit_progress(self, value):
+        """Emit progress at most every PROGRESS_INTERVAL_S (pool thread)"""
+        now = time.monotonic()
+        last = self._last_progress_time
+        if value < 1.0 and last is not None and now - last < PROGRESS_INTERVAL_S:
+            return
+        self._last_progress_time = now
+        self.signals.progress_signal.emit(value)
     
     def run(self):
-        """Execute the pipeline (runs in separate thread)"""
+        """Execute the pipeline (runs on a pool thread)"""
+        signals = self.signals
         try:
             if self.dry_run:
                 # Check cancellation periodically
-                if self._is_cancelled:
+                if self._cancelled.is_set():
                     return
                 
                 # Validation only
                 dry_run_pipeline(
                     parent_folder=self.folder,
                     csv_path=self.csv_path,
-                    log_callback=self.log_signal.emit,
+                    log_callback=self.log_queue.put,
                     verbose=self.verbose
                 )
             else:
@@ -69,11 +113,16 @@ class PipelineWorker(QThread):
                     parent_folder=self.folder,
                     csv_path=self.csv_path,
                     output_root=self.output_root,
-                    log_callback=self.log_signal.emit,
-                    progress_callback=self.progress_signal.emit
+                    log_callback=self.log_queue.put,
+                    progress_callback=self._emit_progress,
+                    is_cancelled=self._cancelled.is_set
                 )
             
-            self.finished_signal.emit()
+            signals.finished_signal.emit()
             
+        except ProcessingCancelledError:
+            signals.cancelled_signal.emit()
         except Exception as e:
-            self.error_signal.emit(str(e))
+            signals.error_signal.emit(str(e))
+        finally:
+            self._done.set()
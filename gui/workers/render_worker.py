@@ -0,0 +1,53 @@
+"""
+Thread pool worker for rendering results viewer overlays
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class RenderSignals(QObject):
+    """
+    Signals emitted by a RenderWorker
+    
+    Signals:
+        finished_signal: Emitted with the render function's result (object)
+        error_signal: Emitted with error message if rendering fails (str)
+    """
+    
+    finished_signal = Signal(object)
+    error_signal = Signal(str)
+
+
+class RenderWorker(QRunnable):
+    """
+    Runnable that calls a render function on a pool thread
+    
+    The render function must only use the arguments it is given (and
+    state guarded by its own lock), since the GUI keeps running while it
+    works. Connect to the signals on worker.signals before starting it.
+    """
+    
+    def __init__(self, render, *args):
+        """
+        Initialize the worker
+        
+        Args:
+            render: Function producing the result
+            *args: Arguments passed to render
+        """
+        super().__init__()
+        # The caller keeps a reference; don't let the pool delete it
+        self.setAutoDelete(False)
+        
+        self.signals = RenderSignals()
+        self.render = render
+        self.args = args
+    
+    def run(self):
+        """Call the render function (runs on a pool thread)"""
+        try:
+            result = self.render(*self.args)
+        except Exception as e:
+            self.signals.error_signal.emit(str(e))
+        else:
+            self.signals.finished_signal.emit(result)
@@ -0,0 +1,98 @@
+"""
+QThread worker for finding processed results on disk
+"""
+
+import os
+
+from PySide6.QtCore import QThread, Signal
+
+from sproutcv.config import OutputConfig
+from sproutcv.io.results_writer import get_results_csv_path
+
+
+def _is_result_dir(path):
+    """
+    Check whether a folder holds the results of one processed image
+    
+    Looks for the length measurement image and the sprout lengths CSV,
+    which are written for every image; the CSV is written last, so it
+    marks a complete result. Stops reading the folder as soon as both
+    have been seen.
+    
+    Args:
+        path: Folder to check
+        
+    Returns:
+        bool: True if both files are present
+    """
+    image_name = os.path.basename(os.path.normpath(path))
+    csv_name = os.path.basename(get_results_csv_path(path, image_name))
+    measurement_prefix = OutputConfig.MEASUREMENT_PREFIX
+    has_csv = has_measurement = False
+    
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if not has_csv and name == csv_name:
+                has_csv = True
+            elif not has_measurement and name.startswith(measurement_prefix):
+                has_measurement = True
+            if has_csv and has_measurement:
+                return True
+    
+    return False
+
+
+class ResultsScanWorker(QThread):
+    """
+    Worker thread that scans a folder for per-image result subfolders
+    
+    A subfolder counts as a result when it holds both a length
+    measurement image and its sprout lengths CSV.
+    
+    Signals:
+        results_found: Emitted once with all results as (name, path) tuples (list)
+        finished_signal: Emitted with the number of results found (int)
+        error_signal: Emitted with error message if the scan fails (str)
+    """
+    
+    results_found = Signal(list)
+    finished_signal = Signal(int)
+    error_signal = Signal(str)
+    
+    def __init__(self, folder):
+        """
+        Initialize the worker
+        
+        Args:
+            folder: Path to the folder holding result subfolders
+        """
+        super().__init__()
+        self._is_cancelled = False
+        
+        self.folder = folder
+    
+    def cancel(self):
+        """Request cancellation of the scan"""
+        self._is_cancelled = True
+    
+    def run(self):
+        """Scan the folder (runs in separate thread)"""
+        results = []
+        
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if self._is_cancelled:
+                        return
+                    
+                    if entry.is_dir(follow_symlinks=False) and _is_result_dir(entry.path):
+                        results.append((entry.name, entry.path))
+            
+            # Hand results over in one batch so the viewer updates once
+            if results:
+                self.results_found.emit(results)
+            self.finished_signal.emit(len(results))
+        
+        except Exception as e:
+            self.error_signal.emit(str(e))
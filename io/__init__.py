@@ -3,13 +3,15 @@ I/O module for file operations
 """
 
 from .calibration import load_calibration_data, get_mm_to_pixel_ratio
-from .image_io import get_image_files, move_image_to_folder
-from .results_writer import save_results_with_overlays
+from .image_io import get_image_files, move_image_to_folder, read_image
+from .results_writer import save_results_with_overlays, get_results_csv_path
 
 __all__ = [
     'load_calibration_data',
     'get_mm_to_pixel_ratio',
     'get_image_files',
     'move_image_to_folder',
-    'save_results'
+    'read_image',
+    'save_results',
+    'get_results_csv_path'
 ]
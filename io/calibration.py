@@ -5,13 +5,23 @@ Calibration data loading and validation
 import os
 import logging
 import pandas as pd
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from sproutcv.config import ValidationConfig
 from sproutcv.exceptions import CalibrationError, FileOperationError
 
 logger = logging.getLogger('sproutcv.calibration')
 
+# pyarrow is optional; without it CSVs are parsed with pandas' C engine
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# DataFrame.attrs key holding the {file_name: (pixel, distance)} lookup
+_LOOKUP_ATTR = 'calibration_lookup'
+
 
 def load_calibration_data(csv_path: str) -> pd.DataFrame:
     """
@@ -42,7 +52,7 @@ def load_calibration_data(csv_path: str) -> pd.DataFrame:
     try:
         # Load CSV
         logger.debug(f"Loading calibration CSV: {csv_path}")
-        df = pd.read_csv(csv_path)
+        df = _read_csv(csv_path)
         
         # Trim whitespace from column names
         df.columns = [c.strip() for c in df.columns]
@@ -62,6 +72,9 @@ def load_calibration_data(csv_path: str) -> pd.DataFrame:
         # Trim whitespace from file_name column
         df['file_name'] = df['file_name'].astype(str).str.strip()
         
+        # Index rows by file name once so per-image lookups are O(1)
+        df.attrs[_LOOKUP_ATTR] = _build_lookup(df)
+        
         logger.info(f"Loaded calibration for {len(df)} images")
         return df
     
@@ -78,6 +91,47 @@ def load_calibration_data(csv_path: str) -> pd.DataFrame:
         raise FileOperationError(f"Permission denied reading CSV: {csv_path}")
 
 
+def _read_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Read a calibration CSV, with the multithreaded pyarrow parser if present
+    
+    Only the required columns are parsed when the header has all of them;
+    otherwise everything is read so the caller can report what was found.
+    Files pyarrow rejects (empty, ragged rows, ...) are re-read with the C
+    engine, which decides how they are handled or reported.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    required = ValidationConfig.REQUIRED_CSV_COLUMNS
+    usecols = [c for c in header if c.strip() in required]
+    if len(usecols) < len(required):
+        usecols = None
+    
+    if _HAS_PYARROW:
+        try:
+            return pd.read_csv(csv_path, engine='pyarrow', usecols=usecols)
+        except ValueError as e:
+            # pandas re-raises pyarrow's ArrowInvalid as ParserError
+            logger.debug(f"pyarrow could not parse {csv_path}: {e}")
+    return pd.read_csv(csv_path, usecols=usecols)
+
+
+def _build_lookup(calibration_data: pd.DataFrame) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Map each file name to its raw (pixel, distance) values
+    
+    The first row wins for duplicated names, like a boolean-mask lookup
+    followed by iloc[0]. Values are validated when they are looked up.
+    """
+    lookup = {}
+    for name, pixel, distance in zip(
+        calibration_data['file_name'],
+        calibration_data['pixel'],
+        calibration_data['distance'],
+    ):
+        lookup.setdefault(name, (pixel, distance))
+    return lookup
+
+
 def get_mm_to_pixel_ratio(calibration_data: pd.DataFrame, 
                           image_name: str) -> Optional[float]:
     """
@@ -93,16 +147,20 @@ def get_mm_to_pixel_ratio(calibration_data: pd.DataFrame,
     Raises:
         CalibrationError: If calibration data is invalid
     """
-    # Find matching row
-    row = calibration_data[calibration_data['file_name'] == image_name]
-    
-    if row.empty:
+    # Find matching row; DataFrames not built by load_calibration_data
+    # get their lookup on first use
+    lookup = calibration_data.attrs.get(_LOOKUP_ATTR)
+    if lookup is None:
+        lookup = _build_lookup(calibration_data)
+        calibration_data.attrs[_LOOKUP_ATTR] = lookup
+    
+    values = lookup.get(image_name)
+    if values is None:
         logger.debug(f"No calibration found for image: {image_name}")
         return None
     
     # Get values
-    pixel = row.iloc[0]['pixel']
-    distance = row.iloc[0]['distance']
+    pixel, distance = values
     
     # Validate
     if pd.isna(pixel) or pd.isna(distance):
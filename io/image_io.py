@@ -5,20 +5,37 @@ Image file operations
 import os
 import shutil
 import logging
+import threading
+import time
 from typing import List, Tuple
 
+import cv2
+import numpy as np
+
 from sproutcv.config import ValidationConfig
-from sproutcv.exceptions import FileOperationError
+from sproutcv.exceptions import FileOperationError, ImageLoadError
 
 logger = logging.getLogger('sproutcv.image_io')
 
+# Recent folder listings, keyed by (absolute folder, folder mtime_ns)
+_LIST_CACHE_SIZE = 8
+_list_cache = {}  # oldest first
+_list_cache_lock = threading.Lock()
+
+# Folders modified less than this long before they are listed are not
+# cached: with coarse mtime resolution (FAT keeps 2 s, some SMB/NFS mounts
+# are no finer), a file added within the same tick leaves the mtime as is
+_LIST_CACHE_MIN_AGE_NS = 2_000_000_000
+
 
-def get_image_files(folder: str) -> List[str]:
+def get_image_files(folder: str, use_cache: bool = True) -> List[str]:
     """
     Get list of supported image files in folder
     
     Args:
         folder: Path to folder
+        use_cache: Reuse the last listing while the folder's mtime is
+            unchanged; pass False to always read the folder
     
     Returns:
         list: List of image filenames (strings)
@@ -26,28 +43,126 @@ def get_image_files(folder: str) -> List[str]:
     Raises:
         FileOperationError: If folder doesn't exist or is inaccessible
     """
-    if not os.path.exists(folder):
+    # Adding, removing or renaming an entry updates the folder's mtime, so
+    # an unchanged folder reuses its last listing. If stat fails, scandir
+    # below reports the error.
+    key = None
+    if use_cache:
+        try:
+            key = (os.path.abspath(folder), os.stat(folder).st_mtime_ns)
+        except OSError:
+            pass
+    
+    if key is not None:
+        with _list_cache_lock:
+            cached = _list_cache.pop(key, None)
+            if cached is not None:
+                _list_cache[key] = cached
+        if cached is not None:
+            logger.debug(f"Found {len(cached)} image files in {folder} (cached)")
+            return list(cached)
+    
+    # One directory pass; scandir reports missing folders and non-directories
+    # itself, and is_file() is answered from the directory entry
+    formats = ValidationConfig.SUPPORTED_IMAGE_FORMATS
+    try:
+        with os.scandir(folder) as entries:
+            image_files = [
+                entry.name for entry in entries
+                if entry.name.lower().endswith(formats) and entry.is_file()
+            ]
+    except FileNotFoundError:
         logger.error(f"Folder does not exist: {folder}")
         raise FileOperationError(f"Folder does not exist: {folder}")
-    
-    if not os.path.isdir(folder):
+    except NotADirectoryError:
         logger.error(f"Path is not a directory: {folder}")
         raise FileOperationError(f"Path is not a directory: {folder}")
-    
-    try:
-        all_files = os.listdir(folder)
     except PermissionError:
         logger.error(f"Permission denied accessing folder: {folder}")
         raise FileOperationError(f"Permission denied accessing folder: {folder}")
     
-    # Filter for supported image formats
-    image_files = [
-        f for f in all_files
-        if f.lower().endswith(ValidationConfig.SUPPORTED_IMAGE_FORMATS)
-    ]
+    image_files.sort()
+    if key is not None and time.time_ns() - key[1] >= _LIST_CACHE_MIN_AGE_NS:
+        with _list_cache_lock:
+            _list_cache[key] = image_files
+            while len(_list_cache) > _LIST_CACHE_SIZE:
+                del _list_cache[next(iter(_list_cache))]
     
     logger.debug(f"Found {len(image_files)} image files in {folder}")
-    return sorted(image_files)
+    return list(image_files)
+
+
+def read_image(image_path: str, flags: int = cv2.IMREAD_COLOR) -> np.ndarray:
+    """
+    Read an image file into memory and decode it
+    
+    Opens the file once and decodes the buffer with cv2.imdecode, instead
+    of an existence check followed by cv2.imread.
+    
+    Args:
+        image_path: Path to image file
+        flags: cv2.IMREAD_* decode flags
+    
+    Returns:
+        np.ndarray: Decoded image
+    
+    Raises:
+        ImageLoadError: If image doesn't exist, cannot be read or decoded
+    """
+    try:
+        with open(image_path, 'rb') as f:
+            buf = f.read()
+    except FileNotFoundError:
+        logger.error(f"Image not found: {image_path}")
+        raise ImageLoadError(f"Image not found: {image_path}")
+    except OSError as e:
+        logger.error(f"Cannot read image: {image_path}")
+        raise ImageLoadError(f"Cannot read image {image_path}: {str(e)}")
+    
+    if not buf:
+        logger.error(f"Image file is empty: {image_path}")
+        raise ImageLoadError(f"Image file is empty: {image_path}")
+    
+    image = cv2.imdecode(np.frombuffer(buf, np.uint8), flags)
+    
+    if image is None:
+        logger.error(f"Failed to load image: {image_path}")
+        raise ImageLoadError(f"Failed to load image: {image_path}")
+    
+    return image
+
+
+def _copy_file(source_path: str, dest_path: str) -> None:
+    """
+    Copy a file's contents, letting the filesystem share data blocks
+    
+    os.copy_file_range lets copy-on-write filesystems (Btrfs, XFS) clone
+    the extents instead of copying bytes, and copies in the kernel
+    elsewhere. Falls back to shutil.copyfile where the call is missing
+    or unsupported.
+    """
+    if hasattr(os, 'copy_file_range'):
+        # Opening the destination truncates it, so refuse to copy a file
+        # onto itself first, as shutil.copyfile does
+        if os.path.exists(dest_path) and os.path.samefile(source_path, dest_path):
+            raise shutil.SameFileError(
+                f"{source_path!r} and {dest_path!r} are the same file"
+            )
+        
+        with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+            try:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError:
+                # EXDEV, ENOSYS or EINVAL on older kernels and filesystems
+                pass
+    
+    shutil.copyfile(source_path, dest_path)
 
 
 def move_image_to_folder(parent_folder: str, 
@@ -61,7 +176,10 @@ def move_image_to_folder(parent_folder: str,
         parent_folder: Source folder containing image
         image_file: Image filename
         output_root: Optional custom output root directory
-        use_copy: If True, copy instead of move
+        use_copy: If True, copy instead of move. Only the file contents are
+            copied (with copy_file_range, which reflinks on copy-on-write
+            filesystems, or shutil.copyfile); timestamps and permission
+            bits are not
     
     Returns:
         tuple: (new_image_path, image_folder, image_name_no_ext) where:
@@ -102,7 +220,7 @@ def move_image_to_folder(parent_folder: str,
     # Copy or move
     try:
         if use_copy:
-            shutil.copy2(source_path, dest_path)
+            _copy_file(source_path, dest_path)
             logger.debug(f"Copied image to: {dest_path}")
         else:
             shutil.move(source_path, dest_path)
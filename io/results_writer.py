@@ -4,15 +4,21 @@ Enhanced results file writing with separate overlay data
 
 import os
 import cv2
-import pandas as pd
 import json
 import numpy as np
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 
 from sproutcv.config import OutputConfig
 from sproutcv.exceptions import FileOperationError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger('sproutcv.results_writer')
 
 
@@ -57,135 +63,196 @@ def save_results_with_overlays(
     if sprout_data and not all(isinstance(row, (list, tuple)) and len(row) == 3 for row in sprout_data):
         raise FileOperationError("All sprout_data rows must have 3 values [index, pixels, mm]")
 
-    # Save original image copy
+    # Build every output path up front; only the writes run in parallel
     original_path = os.path.join(image_folder, f"{image_name}.jpg")
-    try:
-        success = cv2.imwrite(
-            original_path,
-            original_image,
-            [cv2.IMWRITE_JPEG_QUALITY, OutputConfig.OUTPUT_IMAGE_QUALITY]
-        )
-        if not success:
-            raise FileOperationError(f"Failed to write original image: {original_path}")
-        logger.debug(f"Saved original image: {original_path}")
-    except Exception as e:
-        logger.error(f"Cannot write original image: {str(e)}")
-        raise FileOperationError(f"Cannot write original image: {str(e)}")
-
-    # Save skeleton-only mask
     skeleton_mask_path = os.path.join(
         image_folder,
         f"mask_skeleton_{image_name}.png"
     )
-    try:
-        success = cv2.imwrite(skeleton_mask_path, skeleton_image)
-        if not success:
-            raise FileOperationError(f"Failed to write skeleton mask: {skeleton_mask_path}")
-        logger.debug(f"Saved skeleton mask: {skeleton_mask_path}")
-    except Exception as e:
-        logger.error(f"Cannot write skeleton mask: {str(e)}")
-        raise FileOperationError(f"Cannot write skeleton mask: {str(e)}")
-
-    # Save contour-only mask
-    if 'contour_mask' in overlay_data:
-        contour_mask_path = os.path.join(
-            image_folder,
-            f"mask_contour_{image_name}.png"
-        )
-        try:
-            success = cv2.imwrite(contour_mask_path, overlay_data['contour_mask'])
-            if not success:
-                raise FileOperationError(f"Failed to write contour mask: {contour_mask_path}")
-            logger.debug(f"Saved contour mask: {contour_mask_path}")
-        except Exception as e:
-            logger.error(f"Cannot write contour mask: {str(e)}")
-            raise FileOperationError(f"Cannot write contour mask: {str(e)}")
-
-    # Save overlay metadata (contours, labels, skeleton paths)
+    contour_mask_path = os.path.join(
+        image_folder,
+        f"mask_contour_{image_name}.png"
+    )
     metadata_path = os.path.join(
         image_folder,
         f"overlay_data_{image_name}.json"
     )
+    # Traditional outputs, kept for backward compatibility
+    skeleton_viz_path = os.path.join(
+        image_folder,
+        f"{OutputConfig.SKELETON_PREFIX}{image_name}{OutputConfig.OUTPUT_IMAGE_FORMAT}"
+    )
+    measurement_path = os.path.join(
+        image_folder,
+        f"{OutputConfig.MEASUREMENT_PREFIX}{image_name}{OutputConfig.OUTPUT_IMAGE_FORMAT}"
+    )
+    csv_path = get_results_csv_path(image_folder, image_name)
+
+    jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, OutputConfig.OUTPUT_IMAGE_QUALITY]
+    annotated_params = [cv2.IMWRITE_JPEG_QUALITY, OutputConfig.ANNOTATED_JPEG_QUALITY]
+    mask_params = [
+        cv2.IMWRITE_PNG_COMPRESSION, OutputConfig.MASK_PNG_COMPRESSION,
+        cv2.IMWRITE_PNG_BILEVEL, int(OutputConfig.MASK_PNG_BILEVEL),
+    ]
+    writes = [
+        (_write_image, original_path, original_image, jpeg_params, "original image"),
+        (_write_image, skeleton_mask_path, skeleton_image, mask_params, "skeleton mask"),
+        (_write_metadata, metadata_path, overlay_data),
+        (_write_image, measurement_path, output_image, annotated_params, "measurement image"),
+    ]
+    if OutputConfig.WRITE_SKELETON_IMAGE:
+        writes.append(
+            (_write_image, skeleton_viz_path, skeleton_image, annotated_params, "skeleton image")
+        )
+    if 'contour_mask' in overlay_data:
+        writes.append(
+            (_write_image, contour_mask_path, overlay_data['contour_mask'], mask_params, "contour mask")
+        )
+
+    # The files are independent, and OpenCV's encoders and file writes
+    # release the GIL, so encoding and disk I/O overlap across threads
+    with ThreadPoolExecutor(max_workers=OutputConfig.WRITE_THREADS) as executor:
+        futures = [executor.submit(write, *args) for write, *args in writes]
+        for future in as_completed(futures):
+            future.result()
+    
+    # Written last, so an existing CSV means every other file was saved
+    _write_csv(csv_path, sprout_data)
+    
+    logger.info(f"Successfully saved all results for {image_name}")
+
+
+def get_results_csv_path(image_folder: str, image_name: str) -> str:
+    """
+    Get the path of an image's measurement CSV
+    
+    The CSV is the last file save_results_with_overlays writes, so it
+    exists only for images whose results were saved completely.
+    
+    Args:
+        image_folder: Output folder path
+        image_name: Image name without extension
+    
+    Returns:
+        str: Path of the sprout lengths CSV
+    """
+    return os.path.join(image_folder, f"{OutputConfig.CSV_PREFIX}{image_name}.csv")
+
+
+def _write_image(path: str, image, params: List[int], description: str) -> None:
+    """
+    Encode an image and write it to disk
+    
+    Args:
+        path: Output file path; its extension selects the encoder
+        image: Image to write
+        params: cv2.IMWRITE_* encoder parameters
+        description: What the image is, for log and error messages
+    
+    Raises:
+        FileOperationError: If encoding or writing fails
+    """
+    try:
+        success, buf = cv2.imencode(os.path.splitext(path)[1], image, params)
+        if not success:
+            raise FileOperationError(f"Failed to write {description}: {path}")
+        with open(path, 'wb') as f:
+            f.write(buf)
+        logger.debug(f"Saved {description}: {path}")
+    except Exception as e:
+        logger.error(f"Cannot write {description}: {str(e)}")
+        raise FileOperationError(f"Cannot write {description}: {str(e)}")
+
+
+def _write_metadata(metadata_path: str, overlay_data: Dict[str, Any]) -> None:
+    """
+    Save overlay metadata (contours, labels, skeleton paths) as JSON
+    
+    Args:
+        metadata_path: Output JSON path
+        overlay_data: Dictionary containing overlay information
+    
+    Raises:
+        FileOperationError: If writing fails
+    """
     try:
         serializable_data = {}
 
         if 'contours' in overlay_data:
             serializable_data['contours'] = [
                 {
-                    'points': contour.reshape(-1, 2).tolist() if isinstance(contour, np.ndarray) else contour,
+                    'points': _serializable_points(contour) if isinstance(contour, np.ndarray) else contour,
                     'index': idx
                 }
                 for idx, contour in enumerate(overlay_data['contours'])
             ]
 
         if 'skeleton_paths' in overlay_data:
-            serializable_data['skeleton_paths'] = overlay_data['skeleton_paths']
+            serializable_data['skeleton_paths'] = [
+                {'index': entry['index'], 'path': _serializable_points(entry['path'])}
+                for entry in overlay_data['skeleton_paths']
+            ]
         
         # NEW: Save skeleton points
         if 'skeleton_points' in overlay_data:
-            serializable_data['skeleton_points'] = overlay_data['skeleton_points']
+            serializable_data['skeleton_points'] = [
+                {'index': entry['index'], 'points': _serializable_points(entry['points'])}
+                for entry in overlay_data['skeleton_points']
+            ]
 
         if 'labels' in overlay_data:
             serializable_data['labels'] = overlay_data['labels']
 
-        with open(metadata_path, 'w') as f:
-            json.dump(serializable_data, f, indent=2)
+        # Written compact; the viewer and json.load don't need indentation
+        if ORJSON_AVAILABLE:
+            with open(metadata_path, 'wb') as f:
+                f.write(orjson.dumps(serializable_data, option=orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(metadata_path, 'w') as f:
+                json.dump(serializable_data, f, separators=(',', ':'))
         logger.debug(f"Saved overlay metadata: {metadata_path}")
 
     except Exception as e:
         logger.error(f"Cannot write overlay metadata: {str(e)}")
         raise FileOperationError(f"Cannot write overlay metadata: {str(e)}")
 
-    # Save traditional outputs for backward compatibility
 
-    skeleton_viz_path = os.path.join(
-        image_folder,
-        f"{OutputConfig.SKELETON_PREFIX}{image_name}{OutputConfig.OUTPUT_IMAGE_FORMAT}"
-    )
-    try:
-        success = cv2.imwrite(
-            skeleton_viz_path,
-            skeleton_image,
-            [cv2.IMWRITE_JPEG_QUALITY, OutputConfig.OUTPUT_IMAGE_QUALITY]
-        )
-        if not success:
-            raise FileOperationError(f"Failed to write skeleton image: {skeleton_viz_path}")
-        logger.debug(f"Saved skeleton visualization: {skeleton_viz_path}")
-    except Exception as e:
-        logger.error(f"Cannot write skeleton image: {str(e)}")
-        raise FileOperationError(f"Cannot write skeleton image: {str(e)}")
+def _serializable_points(points):
+    """
+    Prepare an array of points for the JSON encoder
 
-    measurement_path = os.path.join(
-        image_folder,
-        f"{OutputConfig.MEASUREMENT_PREFIX}{image_name}{OutputConfig.OUTPUT_IMAGE_FORMAT}"
-    )
-    try:
-        success = cv2.imwrite(
-            measurement_path,
-            output_image,
-            [cv2.IMWRITE_JPEG_QUALITY, OutputConfig.OUTPUT_IMAGE_QUALITY]
-        )
-        if not success:
-            raise FileOperationError(f"Failed to write measurement image: {measurement_path}")
-        logger.debug(f"Saved measurement image: {measurement_path}")
-    except Exception as e:
-        logger.error(f"Cannot write measurement image: {str(e)}")
-        raise FileOperationError(f"Cannot write measurement image: {str(e)}")
+    orjson serializes C-contiguous arrays directly, skipping the nested
+    list conversion the stdlib encoder needs.
+    """
+    points = np.asarray(points).reshape(-1, 2)
+    if ORJSON_AVAILABLE:
+        return np.ascontiguousarray(points)
+    return points.tolist()
 
-    # Save CSV
-    csv_path = os.path.join(
-        image_folder,
-        f"{OutputConfig.CSV_PREFIX}{image_name}.csv"
-    )
+
+def _write_csv(csv_path: str, sprout_data: List) -> None:
+    """
+    Save sprout measurements as CSV
+    
+    Args:
+        csv_path: Output CSV path
+        sprout_data: List of [index, pixels, mm] measurements
+    
+    Raises:
+        FileOperationError: If writing fails
+    """
     try:
-        df = pd.DataFrame(
-            sprout_data,
-            columns=["Sprout Number", "Pixels", "Millimeters"]
+        # Same text as DataFrame.to_csv: integer index, float lengths
+        # written with repr, platform line endings. The rows need no
+        # quoting, so the file is formatted in one string and written once.
+        newline = os.linesep
+        text = "Sprout Number,Pixels,Millimeters" + newline + "".join(
+            f"{index},{float(pixels)!r},{float(mm)!r}{newline}"
+            for index, pixels, mm in sprout_data
         )
-        df.to_csv(csv_path, index=False)
+        with open(csv_path, 'w', newline='') as f:
+            f.write(text)
         logger.debug(f"Saved CSV data: {csv_path}")
     except Exception as e:
         logger.error(f"Cannot write CSV file: {str(e)}")
         raise FileOperationError(f"Cannot write CSV file: {str(e)}")
-    
-    logger.info(f"Successfully saved all results for {image_name}")
\ No newline at end of file
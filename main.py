@@ -8,9 +8,7 @@ import sys
 import os
 import logging
 from pathlib import Path
-from PySide6.QtWidgets import QApplication
 
-from sproutcv.gui.main_window import MainWindow
 from sproutcv.config import LoggingConfig
 
 
@@ -49,6 +47,12 @@ def main():
     # Setup logging
     setup_logging()
     
+    # Qt and the GUI are imported once logging is set up, so anything they
+    # log on import is captured and setup_logging() stays importable on
+    # its own
+    from PySide6.QtWidgets import QApplication
+    from sproutcv.gui.main_window import MainWindow
+    
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("SproutCV")
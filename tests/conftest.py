@@ -0,0 +1,20 @@
+"""
+Pytest configuration
+
+The repository root is the sproutcv package itself, so register it under
+that name when it is not installed; its modules import each other as
+sproutcv.*.
+"""
+
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import sproutcv  # noqa: F401
+except ImportError:
+    package = types.ModuleType('sproutcv')
+    package.__path__ = [ROOT]
+    sys.modules['sproutcv'] = package
@@ -0,0 +1,69 @@
+"""
+Tests for calibration loading and lookup
+"""
+
+import pandas as pd
+import pytest
+
+from sproutcv.exceptions import CalibrationError
+from sproutcv.io.calibration import load_calibration_data, get_mm_to_pixel_ratio
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "calibration.csv"
+    path.write_text(text)
+    return str(path)
+
+
+def test_lookup_strips_names_and_columns(tmp_path):
+    csv_path = _write(
+        tmp_path,
+        " file_name , pixel , distance \n  img0 ,200,10\nimg1,100,5\n"
+    )
+    
+    data = load_calibration_data(csv_path)
+    
+    assert get_mm_to_pixel_ratio(data, "img0") == pytest.approx(0.05)
+    assert get_mm_to_pixel_ratio(data, "img1") == pytest.approx(0.05)
+    assert get_mm_to_pixel_ratio(data, "img2") is None
+
+
+def test_first_row_wins_for_duplicate_names(tmp_path):
+    csv_path = _write(tmp_path, "file_name,pixel,distance\nimg0,100,10\nimg0,100,20\n")
+    
+    data = load_calibration_data(csv_path)
+    
+    assert get_mm_to_pixel_ratio(data, "img0") == pytest.approx(0.1)
+
+
+def test_lookup_on_dataframe_not_from_loader():
+    data = pd.DataFrame({
+        'file_name': ['img0', 'img1'],
+        'pixel': [50, 40],
+        'distance': [5, 8],
+    })
+    
+    assert get_mm_to_pixel_ratio(data, "img1") == pytest.approx(0.2)
+
+
+@pytest.mark.parametrize("pixel, distance", [
+    ("", "10"),
+    ("abc", "10"),
+    ("0", "10"),
+    ("100", "-1"),
+])
+def test_invalid_values_raise(tmp_path, pixel, distance):
+    csv_path = _write(
+        tmp_path, f"file_name,pixel,distance\nimg0,{pixel},{distance}\n"
+    )
+    data = load_calibration_data(csv_path)
+    
+    with pytest.raises(CalibrationError):
+        get_mm_to_pixel_ratio(data, "img0")
+
+
+def test_missing_columns_raise(tmp_path):
+    csv_path = _write(tmp_path, "file_name,pixel\nimg0,100\n")
+    
+    with pytest.raises(CalibrationError):
+        load_calibration_data(csv_path)
@@ -0,0 +1,35 @@
+"""
+Tests for image file listing
+"""
+
+import os
+
+from sproutcv.io.image_io import get_image_files
+
+
+def _touch(path):
+    path.write_bytes(b"")
+
+
+def test_recently_modified_folder_is_not_cached(tmp_path):
+    _touch(tmp_path / "a.jpg")
+    assert get_image_files(str(tmp_path)) == ["a.jpg"]
+    
+    # Simulate a filesystem whose mtime did not move for the new file
+    mtime_ns = os.stat(tmp_path).st_mtime_ns
+    _touch(tmp_path / "b.jpg")
+    os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+    
+    assert get_image_files(str(tmp_path)) == ["a.jpg", "b.jpg"]
+
+
+def test_unchanged_old_folder_reuses_listing_unless_bypassed(tmp_path):
+    _touch(tmp_path / "a.jpg")
+    os.utime(tmp_path, ns=(0, 0))
+    assert get_image_files(str(tmp_path)) == ["a.jpg"]
+    
+    _touch(tmp_path / "b.png")
+    os.utime(tmp_path, ns=(0, 0))
+    
+    assert get_image_files(str(tmp_path)) == ["a.jpg"]
+    assert get_image_files(str(tmp_path), use_cache=False) == ["a.jpg", "b.png"]
@@ -0,0 +1,44 @@
+"""
+Tests for the results CSV writer
+"""
+
+import numpy as np
+import pandas as pd
+
+from sproutcv.io.results_writer import _write_csv
+
+
+def _to_csv_text(tmp_path, sprout_data):
+    """What the writer produced before: DataFrame.to_csv without index"""
+    path = tmp_path / "expected.csv"
+    pd.DataFrame(
+        sprout_data,
+        columns=["Sprout Number", "Pixels", "Millimeters"]
+    ).to_csv(path, index=False)
+    return path.read_bytes()
+
+
+def test_write_csv_matches_dataframe_to_csv(tmp_path):
+    sprout_data = [
+        [1, 158.04163056034264, 12.643330444827411],
+        [2, 100.0, 8.0],
+        [3, np.float64(0.1) + np.float64(0.2), np.float64(1e-7)],
+        [4, 12345678.901234, 1e16],
+    ]
+    path = tmp_path / "sprout_lengths.csv"
+    
+    _write_csv(str(path), sprout_data)
+    
+    assert path.read_bytes() == _to_csv_text(tmp_path, sprout_data)
+    pd.testing.assert_frame_equal(
+        pd.read_csv(path),
+        pd.DataFrame(sprout_data, columns=["Sprout Number", "Pixels", "Millimeters"])
+    )
+
+
+def test_write_csv_without_sprouts_writes_header_only(tmp_path):
+    path = tmp_path / "sprout_lengths.csv"
+    
+    _write_csv(str(path), [])
+    
+    assert path.read_bytes() == _to_csv_text(tmp_path, [])
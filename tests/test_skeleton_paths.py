@@ -0,0 +1,84 @@
+"""
+Tests for longest-path tracing through skeletons
+"""
+
+import numpy as np
+import pytest
+
+from sproutcv.utils.graph_utils import trace_skeleton_path
+from sproutcv.utils import skeleton_numba
+from sproutcv.utils.skeleton_numba import longest_skeleton_path
+
+
+requires_numba = pytest.mark.skipif(
+    not skeleton_numba.NUMBA_AVAILABLE, reason="numba not installed"
+)
+
+
+def _y_skeleton():
+    """One-pixel-wide Y: a stem with a short and a long diagonal branch"""
+    skel = np.zeros((40, 40), dtype=np.uint8)
+    skel[20:39, 20] = 255  # stem, straight down
+    for i in range(1, 6):
+        skel[20 - i, 20 - i] = 255  # short branch, up-left
+    for i in range(1, 15):
+        skel[20 - i, 20 + i] = 255  # long branch, up-right
+    return skel
+
+
+def test_trace_y_skeleton_spans_stem_and_long_branch():
+    path = trace_skeleton_path(_y_skeleton())
+    
+    ends = {tuple(path[0]), tuple(path[-1])}
+    assert ends == {(38, 20), (6, 34)}
+
+
+@requires_numba
+def test_numba_matches_graph_on_y_skeleton():
+    skel = _y_skeleton()
+    
+    np.testing.assert_array_equal(
+        longest_skeleton_path(skel), trace_skeleton_path(skel)
+    )
+
+
+@requires_numba
+def test_numba_matches_graph_when_hops_and_distance_disagree():
+    # The diagonal branch is fewer hops but longer in pixels than the
+    # straight one; both implementations must pick it by distance
+    skel = np.zeros((30, 40), dtype=np.uint8)
+    skel[2, 2:20] = 255  # trunk
+    skel[2:18, 20] = 255  # straight branch, 16 hops
+    for i in range(1, 13):
+        skel[2 + i, 20 + i] = 255  # diagonal branch, 12 hops, ~17 px
+    
+    path = longest_skeleton_path(skel)
+    
+    np.testing.assert_array_equal(path, trace_skeleton_path(skel))
+    assert {tuple(path[0]), tuple(path[-1])} == {(2, 2), (14, 32)}
+
+
+@requires_numba
+def test_numba_matches_graph_on_random_skeletons():
+    cv2 = pytest.importorskip('cv2')
+    skeletonize = pytest.importorskip('skimage.morphology').skeletonize
+    rng = np.random.default_rng(0)
+    
+    for _ in range(50):
+        image = np.zeros((60, 60), dtype=np.uint8)
+        points = rng.integers(0, 60, (rng.integers(2, 6), 2)).astype(np.int32)
+        cv2.polylines(image, [points], False, 255, int(rng.integers(1, 6)))
+        skel = skeletonize(image > 0).astype(np.uint8) * 255
+        
+        np.testing.assert_array_equal(
+            longest_skeleton_path(skel), trace_skeleton_path(skel)
+        )
+
+
+@requires_numba
+def test_numba_single_pixel_and_empty():
+    skel = np.zeros((5, 5), dtype=np.uint8)
+    assert longest_skeleton_path(skel).shape == (0, 2)
+    
+    skel[2, 3] = 255
+    np.testing.assert_array_equal(longest_skeleton_path(skel), [[2, 3]])
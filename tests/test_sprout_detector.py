@@ -0,0 +1,112 @@
+"""
+Tests for contour detection and row grouping
+"""
+
+import cv2
+import numpy as np
+
+from sproutcv.analysis.sprout_detector import detect_and_group_contours
+from sproutcv.config import ImageProcessingConfig
+
+
+def _draw_sprouts(shape, boxes):
+    """Binary image with a filled rectangle per (x, y, w, h) box"""
+    image = np.zeros(shape, dtype=np.uint8)
+    for x, y, w, h in boxes:
+        cv2.rectangle(image, (x, y), (x + w - 1, y + h - 1), 255, -1)
+    return image
+
+
+def _centroids(rows):
+    return [[(cx, cy) for _, cx, cy in row] for row in rows]
+
+
+def _group_reference(valid_contours, image_height):
+    """Row grouping as the original nested loop did it"""
+    row_tolerance = int(image_height * ImageProcessingConfig.ROW_TOLERANCE_RATIO)
+    rows = []
+    for contour_data in sorted(valid_contours, key=lambda c: c[2]):
+        for row in rows:
+            if abs(row[0][2] - contour_data[2]) < row_tolerance:
+                row.append(contour_data)
+                break
+        else:
+            rows.append([contour_data])
+    for row in rows:
+        row.sort(key=lambda c: c[1])
+    return rows
+
+
+def test_groups_rows_top_to_bottom_and_left_to_right():
+    # Two rows of three, drawn out of order, with some jitter in y
+    boxes = [
+        (300, 260, 12, 60), (40, 250, 12, 60), (170, 255, 12, 60),
+        (170, 42, 12, 60), (300, 40, 12, 60), (40, 45, 12, 60),
+    ]
+    image = _draw_sprouts((500, 400), boxes)
+    
+    rows = detect_and_group_contours(image, image.shape[0])
+    
+    assert _centroids(rows) == [
+        [(46, 75), (176, 72), (306, 70)],
+        [(46, 280), (176, 285), (306, 290)],
+    ]
+
+
+def test_slanted_row_is_split_at_the_tolerance_from_its_first_centroid():
+    # Each centroid is 15 px below the previous one, under the 40 px
+    # tolerance, but the row must not keep growing past its first centroid
+    height = 500
+    boxes = [(20 + 40 * i, 20 + 15 * i, 12, 60) for i in range(6)]
+    image = _draw_sprouts((height, 300), boxes)
+    
+    rows = detect_and_group_contours(image, height)
+    
+    assert [len(row) for row in rows] == [3, 3]
+    assert _centroids(rows) == _centroids(
+        _group_reference([c for row in rows for c in row], height)
+    )
+
+
+def test_matches_original_grouping_on_random_layouts():
+    rng = np.random.default_rng(0)
+    height = 500
+    
+    for _ in range(50):
+        boxes = [
+            (int(x), int(y), int(rng.integers(8, 20)), int(rng.integers(30, 60)))
+            for x, y in rng.integers(10, 430, (int(rng.integers(1, 20)), 2))
+        ]
+        image = _draw_sprouts((height, height), boxes)
+        
+        rows = detect_and_group_contours(image, height)
+        
+        assert _centroids(rows) == _centroids(
+            _group_reference([c for row in rows for c in row], height)
+        )
+
+
+def test_small_contours_are_dropped():
+    image = _draw_sprouts((200, 200), [(10, 10, 5, 5), (100, 50, 12, 60)])
+    
+    rows = detect_and_group_contours(image, image.shape[0])
+    
+    assert _centroids(rows) == [[(106, 80)]]
+
+
+def test_holes_are_not_separate_contours():
+    # A thick ring encloses a hole well above the area filter
+    image = np.zeros((300, 300), dtype=np.uint8)
+    cv2.circle(image, (150, 150), 80, 255, -1)
+    cv2.circle(image, (150, 150), 40, 0, -1)
+    
+    rows = detect_and_group_contours(image, image.shape[0])
+    
+    assert [len(row) for row in rows] == [1]
+    assert cv2.contourArea(rows[0][0][0]) > np.pi * 79 ** 2
+
+
+def test_empty_image_has_no_rows():
+    image = np.zeros((100, 100), dtype=np.uint8)
+    
+    assert detect_and_group_contours(image, image.shape[0]) == []
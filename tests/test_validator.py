@@ -0,0 +1,65 @@
+"""
+Tests for input validation
+"""
+
+import cv2
+import numpy as np
+
+from sproutcv.core.validator import validate_inputs
+
+
+def _make_inputs(tmp_path, image_names, csv_text):
+    """Image folder with blank JPEGs and a calibration CSV next to it"""
+    folder = tmp_path / "images"
+    folder.mkdir()
+    for name in image_names:
+        cv2.imwrite(str(folder / f"{name}.jpg"), np.zeros((8, 8, 3), np.uint8))
+    csv_path = tmp_path / "calibration.csv"
+    csv_path.write_text(csv_text)
+    return str(folder), str(csv_path)
+
+
+def test_short_row_is_reported_as_missing_value(tmp_path):
+    folder, csv_path = _make_inputs(
+        tmp_path,
+        ["img0", "img1", "img2"],
+        "file_name,pixel,distance\nimg0,100,10\nimg1,100,10\nimg2,200\n"
+    )
+    
+    report = validate_inputs(folder, csv_path, log_callback=lambda m: None)
+    
+    assert report['fatal'] == ["Missing pixel/distance value for 'img2'"]
+
+
+def test_name_checks_run_before_non_verbose_short_circuit(tmp_path):
+    folder, csv_path = _make_inputs(
+        tmp_path,
+        ["img0", "img1"],
+        "file_name,pixel,distance\n"
+        "img0,0,10\nimg1,100,10\nimg1,100,10\nextra,100,10\n"
+    )
+    
+    report = validate_inputs(
+        folder, csv_path, log_callback=lambda m: None, verbose=False
+    )
+    
+    # The duplicate makes the inputs unusable, so values are not checked
+    assert report['fatal'] == ["Duplicate calibration rows for: ['img1']"]
+    assert report['warnings'] == [
+        "CSV has 1 row(s) without matching images: ['extra']"
+    ]
+
+
+def test_non_verbose_checks_values_when_names_match(tmp_path):
+    folder, csv_path = _make_inputs(
+        tmp_path,
+        ["img0", "img1"],
+        "file_name,pixel,distance\nimg0,0,10\nimg1,100,10\n"
+    )
+    
+    report = validate_inputs(
+        folder, csv_path, log_callback=lambda m: None, verbose=False
+    )
+    
+    assert len(report['fatal']) == 1
+    assert "img0" in report['fatal'][0]
@@ -6,12 +6,24 @@ from .graph_utils import (
     build_graph_from_skeleton,
     simplify_path,
     reconnect_path,
-    find_farthest_nodes
+    path_length,
+    find_farthest_nodes,
+    trace_skeleton_path
+)
+from .skeleton_numba import (
+    longest_skeleton_path,
+    simplify_skeleton_path,
+    NUMBA_AVAILABLE
 )
 
 __all__ = [
     'build_graph_from_skeleton',
     'simplify_path',
     'reconnect_path',
-    'find_farthest_nodes'
+    'path_length',
+    'find_farthest_nodes',
+    'trace_skeleton_path',
+    'longest_skeleton_path',
+    'simplify_skeleton_path',
+    'NUMBA_AVAILABLE'
 ]
@@ -5,6 +5,8 @@ Graph utility functions for skeleton analysis
 import numpy as np
 import networkx as nx
 import logging
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
 from shapely.geometry import LineString
 from typing import List, Tuple
 
@@ -14,15 +16,21 @@ from sproutcv.exceptions import ProcessingError
 logger = logging.getLogger('sproutcv.graph_utils')
 
 
-def build_graph_from_skeleton(skeleton: np.ndarray) -> nx.Graph:
+def _skeleton_edges(
+    skeleton: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Build a NetworkX graph from skeleton image
+    Find the 8-connected edges between skeleton pixels
     
     Args:
         skeleton: Binary skeleton image (255 = skeleton, 0 = background)
     
     Returns:
-        nx.Graph: NetworkX Graph with nodes as (y, x) tuples and edge weights as distances
+        tuple: (coords, src, dst, weights) where coords is an (n, 2) array
+            of (y, x) points in row-major order, and each edge appears once
+            as coords[src] -> coords[dst] with its Euclidean length, in
+            point-then-offset order (the order build_graph_from_skeleton
+            adds them)
     
     Raises:
         ProcessingError: If skeleton is empty or invalid
@@ -32,74 +40,213 @@ def build_graph_from_skeleton(skeleton: np.ndarray) -> nx.Graph:
         raise ProcessingError("Skeleton image is empty")
     
     # Find skeleton points
-    points = np.column_stack(np.where(skeleton > 0))
+    ys, xs = np.nonzero(skeleton > 0)
     
-    if len(points) == 0:
+    if len(ys) == 0:
         logger.error("No skeleton points found")
         raise ProcessingError("No skeleton points found")
     
-    # Create graph
-    G = nx.Graph()
+    # Neighbor coordinates of every point, one column per offset; a padded
+    # copy of the skeleton answers bounds and membership in one lookup
+    offsets = np.array(GraphConfig.NEIGHBORS, dtype=np.intp)
+    pad = int(np.abs(offsets).max())
+    padded = np.pad(skeleton > 0, pad)
+    ny = ys[:, None] + offsets[:, 0]
+    nx_ = xs[:, None] + offsets[:, 1]
+    connected = padded[ny + pad, nx_ + pad]
+    
+    # Neighbors earlier in row-major order already have their edge to
+    # this point; skipping them keeps each edge once
+    connected &= (offsets[:, 0] > 0) | ((offsets[:, 0] == 0) & (offsets[:, 1] > 0))
+    
+    # Edges in point-then-offset order, weighted by Euclidean distance
+    src, k = np.nonzero(connected)
+    weights = np.sqrt((offsets * offsets).sum(axis=1).astype(np.float64))
+    
+    node_ids = np.full(padded.shape, -1, dtype=np.intp)
+    node_ids[ys + pad, xs + pad] = np.arange(len(ys))
+    dst = node_ids[ny[src, k] + pad, nx_[src, k] + pad]
+    
+    return np.column_stack((ys, xs)), src, dst, weights[k]
+
+
+def build_graph_from_skeleton(skeleton: np.ndarray) -> nx.Graph:
+    """
+    Build a NetworkX graph from skeleton image
+    
+    Args:
+        skeleton: Binary skeleton image (255 = skeleton, 0 = background)
+    
+    Returns:
+        nx.Graph: NetworkX Graph with nodes as (y, x) tuples and edge weights
+            as distances
     
-    # Add nodes
-    for y, x in points:
-        G.add_node((y, x))
-    
-    # Add edges to neighbors
-    for y, x in points:
-        for dy, dx in GraphConfig.NEIGHBORS:
-            ny, nx_ = y + dy, x + dx
-            
-            # Check bounds
-            if (0 <= ny < skeleton.shape[0] and 
-                0 <= nx_ < skeleton.shape[1] and
-                skeleton[ny, nx_] > 0):
-                
-                # Calculate Euclidean distance
-                distance = np.sqrt((y - ny)**2 + (x - nx_)**2)
-                G.add_edge((y, x), (ny, nx_), weight=distance)
+    Raises:
+        ProcessingError: If skeleton is empty or invalid
+    """
+    coords, src, dst, weights = _skeleton_edges(skeleton)
+    
+    # Create graph with nodes in row-major order
+    G = nx.Graph()
+    nodes = list(map(tuple, coords.tolist()))
+    G.add_nodes_from(nodes)
+    G.add_weighted_edges_from(zip(
+        [nodes[i] for i in src.tolist()],
+        [nodes[i] for i in dst.tolist()],
+        weights.tolist()
+    ))
     
     logger.debug(f"Built graph with {len(G.nodes)} nodes and {len(G.edges)} edges")
     return G
 
 
-def simplify_path(path: List[Tuple[int, int]], 
-                 tolerance: float = None) -> List[Tuple[float, float]]:
+def trace_skeleton_path(skeleton: np.ndarray) -> np.ndarray:
+    """
+    Trace the longest path through a skeleton without a NetworkX graph
+    
+    Follows build_graph_from_skeleton, find_farthest_nodes and
+    nx.shortest_path: endpoints from two weighted Dijkstra passes, then
+    the path with the fewest hops between them, found by the same
+    bidirectional breadth-first search over neighbors in the same order.
+    Equally distant endpoint candidates go to the first pixel in row-major
+    order, where NetworkX takes whichever it settled first, so on such a
+    tie the path can end at a different, equally distant pixel.
+    
+    Args:
+        skeleton: Binary skeleton image (255 = skeleton, 0 = background)
+    
+    Returns:
+        np.ndarray: Array of shape (m, 2) with (y, x) path points; a single
+            point if the skeleton has only one pixel
+    
+    Raises:
+        ProcessingError: If skeleton is empty or invalid
+        ValueError: If the endpoints are not connected
+    """
+    coords, src, dst, weights = _skeleton_edges(skeleton)
+    n = len(coords)
+    if n < 2:
+        return coords
+    
+    csgraph = csr_matrix((weights, (src, dst)), shape=(n, n))
+    source, target = _farthest_indices(csgraph)
+    
+    # Neighbor lists ordered by edge, as NetworkX's adjacency dicts
+    # record them, flattened with an index of where each node's list starts
+    ends = np.concatenate((src, dst))
+    order = np.lexsort((np.tile(np.arange(len(src)), 2), ends))
+    neighbors = np.concatenate((dst, src))[order].tolist()
+    starts = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(ends, minlength=n), out=starts[1:])
+    starts = starts.tolist()
+    
+    return coords[_bidirectional_path(neighbors, starts, source, target)]
+
+
+def _bidirectional_path(
+    neighbors: List[int],
+    starts: List[int],
+    source: int,
+    target: int,
+) -> List[int]:
+    """
+    Fewest-hop path between two nodes of a flattened adjacency list
+    
+    Follows networkx's bidirectional_shortest_path step for step, so ties
+    between equally short paths resolve the same way.
+    """
+    if source == target:
+        return [source]
+    
+    pred = {source: None}
+    succ = {target: None}
+    forward_fringe = [source]
+    reverse_fringe = [target]
+    meet = None
+    
+    while meet is None and forward_fringe and reverse_fringe:
+        if len(forward_fringe) <= len(reverse_fringe):
+            this_level = forward_fringe
+            forward_fringe = []
+            for v in this_level:
+                for w in neighbors[starts[v]:starts[v + 1]]:
+                    if w not in pred:
+                        forward_fringe.append(w)
+                        pred[w] = v
+                    if w in succ:
+                        meet = w
+                        break
+                if meet is not None:
+                    break
+        else:
+            this_level = reverse_fringe
+            reverse_fringe = []
+            for v in this_level:
+                for w in neighbors[starts[v]:starts[v + 1]]:
+                    if w not in succ:
+                        succ[w] = v
+                        reverse_fringe.append(w)
+                    if w in pred:
+                        meet = w
+                        break
+                if meet is not None:
+                    break
+    
+    if meet is None:
+        raise ValueError(f"No path between nodes {source} and {target}")
+    
+    # Source to the meeting node, then on to the target
+    path = []
+    w = meet
+    while w is not None:
+        path.append(w)
+        w = pred[w]
+    path.reverse()
+    w = succ[meet]
+    while w is not None:
+        path.append(w)
+        w = succ[w]
+    return path
+
+
+def simplify_path(path, tolerance: float = None) -> np.ndarray:
     """
     Simplify a path using Douglas-Peucker algorithm
     
     Args:
-        path: List of (y, x) coordinate tuples
+        path: Sequence or (n, 2) array of (y, x) points
         tolerance: Simplification tolerance (default from config)
     
     Returns:
-        list: Simplified path as list of (y, x) tuples
+        np.ndarray: Simplified path as a float64 array of shape (m, 2)
     """
     if tolerance is None:
         tolerance = GraphConfig.PATH_SIMPLIFICATION_TOLERANCE
     
-    if len(path) < 3:
-        return path
+    # Hand shapely one array rather than a list of point tuples
+    pts = np.asarray(path, dtype=np.float64)
+    if len(pts) < 3:
+        return pts
     
     try:
-        line = LineString(path)
+        line = LineString(pts)
         simplified = line.simplify(tolerance, preserve_topology=False)
-        result = list(simplified.coords)
-        logger.debug(f"Simplified path from {len(path)} to {len(result)} points")
+        result = np.asarray(simplified.coords)
+        logger.debug(f"Simplified path from {len(pts)} to {len(result)} points")
         return result
     except Exception as e:
         logger.warning(f"Path simplification failed: {e}, returning original path")
-        return path
+        return pts
 
 
-def reconnect_path(G: nx.Graph, 
-                  path: List[Tuple[float, float]]) -> float:
+def reconnect_path(G: nx.Graph, path) -> float:
     """
     Reconnect simplified path and calculate total length
     
     Args:
         G: NetworkX graph
-        path: List of (y, x) coordinate tuples
+        path: Sequence or (n, 2) array of (y, x) points, as returned by
+            simplify_path
     
     Returns:
         float: Total path length in pixels
@@ -112,25 +259,45 @@ def reconnect_path(G: nx.Graph,
         raise ProcessingError("Path must have at least 2 points")
     
     total_length = 0.0
+    adj = G.adj  # bound once; the view sees edges added below
     
-    for i in range(len(path) - 1):
+    for (y1, x1), (y2, x2) in zip(path, path[1:]):
         # Convert to integer coordinates
-        p1 = tuple(map(int, path[i]))
-        p2 = tuple(map(int, path[i + 1]))
+        p1 = (int(y1), int(x1))
+        p2 = (int(y2), int(x2))
         
-        # Check if edge exists
-        if p2 not in G[p1]:
+        edge = adj[p1].get(p2)
+        if edge is None:
             # Add missing edge with Euclidean distance
             distance = np.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
             G.add_edge(p1, p2, weight=distance)
+            edge = adj[p1][p2]
         
         # Add edge weight to total
-        total_length += G[p1][p2]['weight']
+        total_length += edge['weight']
     
     logger.debug(f"Path length: {total_length:.2f} pixels")
     return total_length
 
 
+def path_length(path) -> float:
+    """
+    Calculate the length of a polyline
+    
+    Args:
+        path: Sequence of (y, x) points
+    
+    Returns:
+        float: Sum of Euclidean distances between consecutive points
+    """
+    pts = np.asarray(path, dtype=np.float64)
+    if len(pts) < 2:
+        return 0.0
+    
+    diffs = np.diff(pts, axis=0)
+    return float(np.sqrt((diffs * diffs).sum(axis=1)).sum())
+
+
 def find_farthest_nodes(G: nx.Graph) -> Tuple[Tuple[int, int], Tuple[int, int]]:
     """
     Find the two farthest nodes in the graph (approximate endpoints)
@@ -159,7 +326,7 @@ def find_farthest_nodes(G: nx.Graph) -> Tuple[Tuple[int, int], Tuple[int, int]]:
         return node, node
     
     # First pass: find farthest from arbitrary start
-    start_node = list(G.nodes)[0]
+    start_node = next(iter(G.nodes))
     
     try:
         distances = nx.single_source_dijkstra_path_length(G, start_node)
@@ -174,4 +341,32 @@ def find_farthest_nodes(G: nx.Graph) -> Tuple[Tuple[int, int], Tuple[int, int]]:
     
     except nx.NetworkXError as e:
         logger.error(f"Graph analysis failed: {str(e)}")
-        raise ProcessingError(f"Graph analysis failed: {str(e)}")
\ No newline at end of file
+        raise ProcessingError(f"Graph analysis failed: {str(e)}")
+
+
+def _farthest_indices(csgraph: csr_matrix) -> Tuple[int, int]:
+    """
+    Find the two farthest nodes of a CSR graph, starting from node 0
+    
+    Distances within GraphConfig.DISTANCE_TIE_TOLERANCE of the largest
+    count as ties and go to the lowest index, so the numba walk in
+    utils.skeleton_numba picks the same endpoints.
+    
+    Returns:
+        tuple: (index1, index2) of the approximate endpoints
+    """
+    i1 = _farthest_from(csgraph, 0)
+    
+    # Second pass: find farthest from the first
+    i2 = _farthest_from(csgraph, i1)
+    
+    return i1, i2
+
+
+def _farthest_from(csgraph: csr_matrix, source: int) -> int:
+    """Index of the node farthest from source, lowest index on ties"""
+    # Unreachable nodes come back as inf; never pick them
+    distances = dijkstra(csgraph, directed=False, indices=source)
+    distances[np.isinf(distances)] = -1.0
+    farthest = distances >= distances.max() - GraphConfig.DISTANCE_TIE_TOLERANCE
+    return int(np.argmax(farthest))
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Numba-accelerated overlay painting for the results viewer
+"""
+
+import numpy as np
+
+from sproutcv.utils.skeleton_numba import NUMBA_AVAILABLE, njit
+
+if NUMBA_AVAILABLE:
+    from numba import prange
+else:
+    prange = range
+
+# Kernels are compiled for these signatures when the module is imported
+# (or loaded from numba's on-disk cache), so the first render doesn't wait
+# for the JIT. 'A' layouts accept both contiguous arrays and views.
+_PAINT_LUT_SIGNATURE = 'void(uint8[:, :, :], uint8[:, :], uint8[:, :], boolean[:])'
+_PAINT_LUT_WORDS_SIGNATURE = (
+    'void(uint8[:, ::1], uint8[::1], uint64[::1], uint8[:, :], boolean[:])'
+)
+
+
+@njit(_PAINT_LUT_SIGNATURE, parallel=True, cache=True, nogil=True)
+def _paint_lut_kernel(image, index, lut, enabled):
+    """Write lut[k] into every image pixel whose index k is enabled"""
+    h, w = index.shape
+    for y in prange(h):
+        for x in range(w):
+            k = index[y, x]
+            if enabled[k]:
+                image[y, x, 0] = lut[k, 0]
+                image[y, x, 1] = lut[k, 1]
+                image[y, x, 2] = lut[k, 2]
+
+
+@njit(_PAINT_LUT_WORDS_SIGNATURE, parallel=True, cache=True, nogil=True)
+def _paint_lut_words_kernel(pixels, flat_index, words, lut, enabled):
+    """
+    Same as _paint_lut_kernel on flattened arrays, 8 pixels per word
+
+    words views flat_index as uint64, so runs of 8 unpainted (index 0)
+    pixels are skipped with a single comparison.
+    """
+    n = words.shape[0]
+    for i in prange(n):
+        if words[i] == 0:
+            continue
+        for p in range(i * 8, i * 8 + 8):
+            k = flat_index[p]
+            if enabled[k]:
+                pixels[p, 0] = lut[k, 0]
+                pixels[p, 1] = lut[k, 1]
+                pixels[p, 2] = lut[k, 2]
+
+    # Pixels past the last whole word
+    for p in range(n * 8, flat_index.shape[0]):
+        k = flat_index[p]
+        if enabled[k]:
+            pixels[p, 0] = lut[k, 0]
+            pixels[p, 1] = lut[k, 1]
+            pixels[p, 2] = lut[k, 2]
+
+
+def paint_lut(image, index, lut, enabled):
+    """
+    Paint colors from a lookup table into an image by per-pixel index, in place
+    
+    Lets several precomputed layers, packed into one index image, be
+    painted in a single pass. When index 0 is disabled, as for sparse
+    overlays, the index is scanned 8 pixels at a time and empty runs are
+    skipped.
+    
+    Args:
+        image: BGR uint8 image of shape (h, w, 3), modified in place
+        index: uint8 index image of shape (h, w)
+        lut: uint8 array of shape (n, 3) with the BGR color for each index
+        enabled: Boolean array of shape (n,); pixels whose index is not
+            enabled are left unchanged
+    """
+    if NUMBA_AVAILABLE:
+        if enabled[0] or not (image.flags.c_contiguous and index.flags.c_contiguous):
+            _paint_lut_kernel(image, index, lut, enabled)
+        else:
+            # Flat views share memory with the contiguous inputs
+            flat_index = index.reshape(-1)
+            words = flat_index[:flat_index.size // 8 * 8].view(np.uint64)
+            _paint_lut_words_kernel(image.reshape(-1, 3), flat_index, words, lut, enabled)
+    else:
+        selected = enabled[index]
+        image[selected] = lut[index[selected]]
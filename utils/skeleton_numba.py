@@ -0,0 +1,397 @@
+"""
+Numba-accelerated skeleton path tracing
+"""
+
+import logging
+import numpy as np
+
+from sproutcv.config import GraphConfig
+
+logger = logging.getLogger('sproutcv.skeleton_numba')
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# 8-connected neighborhood offsets (same order as GraphConfig.NEIGHBORS)
+_DY = np.array([-1, 1, 0, 0, -1, -1, 1, 1], dtype=np.int64)
+_DX = np.array([0, 0, -1, 1, -1, 1, -1, 1], dtype=np.int64)
+
+# The same offsets in the order a pixel's neighbors appear in the graph
+# from utils.graph_utils: earlier pixels in row-major order first, then
+# the later ones in GraphConfig.NEIGHBORS order. Walking them in this
+# order makes the path search break ties like the graph fallback.
+_PATH_DY = np.array([-1, -1, -1, 0, 1, 0, 1, 1], dtype=np.int64)
+_PATH_DX = np.array([-1, 0, 1, -1, 0, 1, -1, 1], dtype=np.int64)
+
+_SQRT2 = np.sqrt(2.0)
+
+_UNSEEN = -2
+
+
+@njit(cache=True, nogil=True)
+def _heap_push(keys, items, size, key, item):
+    """Add an entry to a binary min-heap and return the new size"""
+    i = size
+    keys[i] = key
+    items[i] = item
+    while i > 0:
+        parent = (i - 1) >> 1
+        if keys[parent] <= keys[i]:
+            break
+        keys[parent], keys[i] = keys[i], keys[parent]
+        items[parent], items[i] = items[i], items[parent]
+        i = parent
+    return size + 1
+
+
+@njit(cache=True, nogil=True)
+def _heap_pop(keys, items, size):
+    """
+    Remove the smallest entry of a binary min-heap
+    
+    Returns the new size; the removed entry is left at keys[size] and
+    items[size].
+    """
+    size -= 1
+    key = keys[0]
+    item = items[0]
+    keys[0] = keys[size]
+    items[0] = items[size]
+    
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= size:
+            break
+        child = left
+        if left + 1 < size and keys[left + 1] < keys[left]:
+            child = left + 1
+        if keys[i] <= keys[child]:
+            break
+        keys[child], keys[i] = keys[i], keys[child]
+        items[child], items[i] = items[i], items[child]
+        i = child
+    
+    keys[size] = key
+    items[size] = item
+    return size
+
+
+@njit(cache=True, nogil=True)
+def _dijkstra_farthest(skel, start, dist, keys, items, tie_tolerance):
+    """
+    Find the skeleton pixel farthest from a flat start index
+    
+    Edges have the graph's weights (1 straight, sqrt(2) diagonal). Among
+    pixels within tie_tolerance of the largest distance, the first in
+    row-major order wins, as in graph_utils._farthest_indices.
+    """
+    h, w = skel.shape
+    dist[:] = np.inf
+    dist[start] = 0.0
+    size = _heap_push(keys, items, 0, 0.0, start)
+    
+    while size > 0:
+        size = _heap_pop(keys, items, size)
+        d = keys[size]
+        cur = items[size]
+        if d > dist[cur]:
+            continue
+        cy = cur // w
+        cx = cur - cy * w
+        
+        for k in range(8):
+            ny = cy + _DY[k]
+            nx_ = cx + _DX[k]
+            if ny < 0 or ny >= h or nx_ < 0 or nx_ >= w:
+                continue
+            if skel[ny, nx_] == 0:
+                continue
+            nxt = ny * w + nx_
+            step = 1.0 if _DY[k] == 0 or _DX[k] == 0 else _SQRT2
+            if d + step < dist[nxt]:
+                dist[nxt] = d + step
+                size = _heap_push(keys, items, size, d + step, nxt)
+    
+    farthest = 0.0
+    for i in range(dist.shape[0]):
+        if dist[i] != np.inf and dist[i] > farthest:
+            farthest = dist[i]
+    for i in range(dist.shape[0]):
+        if dist[i] != np.inf and dist[i] >= farthest - tie_tolerance:
+            return i
+    return start
+
+
+@njit(cache=True, nogil=True)
+def _bidirectional_path(skel, source, target, pred, succ, fringe_a, fringe_b,
+                        fringe_c, fringe_d):
+    """
+    Fewest-hop path between two flat pixel indices
+    
+    Same search as networkx's bidirectional_shortest_path, with neighbors
+    visited in _PATH_DY/_PATH_DX order.
+    
+    Returns:
+        np.ndarray: int32 array of shape (n, 2) with (y, x) path points,
+            empty if source and target are not connected
+    """
+    h, w = skel.shape
+    pred[:] = _UNSEEN
+    succ[:] = _UNSEEN
+    pred[source] = -1
+    succ[target] = -1
+    meet = source if source == target else -1
+    
+    forward, forward_next = fringe_a, fringe_b
+    reverse, reverse_next = fringe_c, fringe_d
+    forward[0] = source
+    reverse[0] = target
+    n_forward = 1
+    n_reverse = 1
+    
+    while meet < 0 and n_forward > 0 and n_reverse > 0:
+        if n_forward <= n_reverse:
+            n_next = 0
+            for i in range(n_forward):
+                v = forward[i]
+                vy = v // w
+                vx = v - vy * w
+                for k in range(8):
+                    ny = vy + _PATH_DY[k]
+                    nx_ = vx + _PATH_DX[k]
+                    if ny < 0 or ny >= h or nx_ < 0 or nx_ >= w:
+                        continue
+                    if skel[ny, nx_] == 0:
+                        continue
+                    nxt = ny * w + nx_
+                    if pred[nxt] == _UNSEEN:
+                        forward_next[n_next] = nxt
+                        n_next += 1
+                        pred[nxt] = v
+                    if succ[nxt] != _UNSEEN:
+                        meet = nxt
+                        break
+                if meet >= 0:
+                    break
+            forward, forward_next = forward_next, forward
+            n_forward = n_next
+        else:
+            n_next = 0
+            for i in range(n_reverse):
+                v = reverse[i]
+                vy = v // w
+                vx = v - vy * w
+                for k in range(8):
+                    ny = vy + _PATH_DY[k]
+                    nx_ = vx + _PATH_DX[k]
+                    if ny < 0 or ny >= h or nx_ < 0 or nx_ >= w:
+                        continue
+                    if skel[ny, nx_] == 0:
+                        continue
+                    nxt = ny * w + nx_
+                    if succ[nxt] == _UNSEEN:
+                        succ[nxt] = v
+                        reverse_next[n_next] = nxt
+                        n_next += 1
+                    if pred[nxt] != _UNSEEN:
+                        meet = nxt
+                        break
+                if meet >= 0:
+                    break
+            reverse, reverse_next = reverse_next, reverse
+            n_reverse = n_next
+    
+    if meet < 0:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    # Source to the meeting pixel, then on to the target
+    length = 0
+    cur = meet
+    while cur >= 0:
+        length += 1
+        cur = pred[cur]
+    cur = succ[meet]
+    while cur >= 0:
+        length += 1
+        cur = succ[cur]
+    
+    path = np.empty((length, 2), dtype=np.int32)
+    i = 0
+    cur = meet
+    while cur >= 0:
+        path[i, 0] = cur // w
+        path[i, 1] = cur - (cur // w) * w
+        i += 1
+        cur = pred[cur]
+    path[:i] = path[:i][::-1].copy()
+    cur = succ[meet]
+    while cur >= 0:
+        path[i, 0] = cur // w
+        path[i, 1] = cur - (cur // w) * w
+        i += 1
+        cur = succ[cur]
+    
+    return path
+
+
+@njit(cache=True, nogil=True)
+def _longest_path(skel, tie_tolerance):
+    """Jitted body of longest_skeleton_path"""
+    h, w = skel.shape
+    
+    # Start from the first pixel in row-major order, like the graph
+    # fallback's first node
+    start = -1
+    count = 0
+    for y in range(h):
+        for x in range(w):
+            if skel[y, x] != 0:
+                if start < 0:
+                    start = y * w + x
+                count += 1
+    
+    if start < 0:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    n = h * w
+    dist = np.empty(n, dtype=np.float64)
+    # Each pixel is settled once and pushes at most 8 entries
+    keys = np.empty(8 * count + 1, dtype=np.float64)
+    items = np.empty(8 * count + 1, dtype=np.int64)
+    
+    # Two sweeps: farthest from start, then farthest from that
+    n1 = _dijkstra_farthest(skel, start, dist, keys, items, tie_tolerance)
+    n2 = _dijkstra_farthest(skel, n1, dist, keys, items, tie_tolerance)
+    
+    pred = np.empty(n, dtype=np.int64)
+    succ = np.empty(n, dtype=np.int64)
+    fringes = np.empty((4, count), dtype=np.int64)
+    return _bidirectional_path(
+        skel, n1, n2, pred, succ, fringes[0], fringes[1], fringes[2], fringes[3]
+    )
+
+
+def longest_skeleton_path(skel):
+    """
+    Find the longest path through a skeleton by walking its pixels
+    
+    Gives the same path as graph_utils.trace_skeleton_path: endpoints
+    from two weighted shortest-distance sweeps starting at the first
+    pixel in row-major order, then the path with the fewest hops between
+    them, with ties broken the same way.
+    
+    Args:
+        skel: 2D skeleton image (non-zero = skeleton)
+    
+    Returns:
+        np.ndarray: int32 array of shape (n, 2) with (y, x) path points,
+            empty if the skeleton has no pixels
+    """
+    return _longest_path(skel, GraphConfig.DISTANCE_TIE_TOLERANCE)
+
+
+@njit(cache=True, nogil=True)
+def _segment_distance(path, i, a, b):
+    """
+    Distance from path[i] to the segment path[a] -> path[b]
+
+    Evaluated the same way as GEOS so that ties between equally distant
+    points resolve like shapely's simplify.
+    """
+    py = float(path[i, 0])
+    px = float(path[i, 1])
+    ay = float(path[a, 0])
+    ax = float(path[a, 1])
+    by = float(path[b, 0])
+    bx = float(path[b, 1])
+
+    len2 = (bx - ax) * (bx - ax) + (by - ay) * (by - ay)
+    if len2 == 0.0:
+        return np.sqrt((px - ax) ** 2 + (py - ay) ** 2)
+
+    r = ((px - ax) * (bx - ax) + (py - ay) * (by - ay)) / len2
+    if r <= 0.0:
+        return np.sqrt((px - ax) ** 2 + (py - ay) ** 2)
+    if r >= 1.0:
+        return np.sqrt((px - bx) ** 2 + (py - by) ** 2)
+
+    s = ((ay - py) * (bx - ax) - (ax - px) * (by - ay)) / len2
+    return abs(s) * np.sqrt(len2)
+
+
+@njit(cache=True, nogil=True)
+def simplify_skeleton_path(path, tolerance):
+    """
+    Simplify a traced path with the Douglas-Peucker algorithm
+
+    Keeps the same points as shapely's simplify(preserve_topology=False)
+    for an open line, without the LineString round trip.
+
+    Args:
+        path: int32 array of shape (n, 2) with (y, x) path points
+        tolerance: Maximum distance of dropped points from the simplified line
+
+    Returns:
+        np.ndarray: int32 array of shape (m, 2) with the kept points
+    """
+    n = path.shape[0]
+    if n < 3:
+        return path.copy()
+
+    keep = np.zeros(n, dtype=np.bool_)
+    keep[0] = True
+    keep[n - 1] = True
+
+    # Explicit stack of (first, last) index spans still to be checked
+    stack = np.empty((n, 2), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = n - 1
+    top = 1
+
+    while top > 0:
+        top -= 1
+        first = stack[top, 0]
+        last = stack[top, 1]
+        if last - first < 2:
+            continue
+
+        # Farthest point from the segment first -> last
+        max_dist = -1.0
+        index = first
+        for i in range(first + 1, last):
+            dist = _segment_distance(path, i, first, last)
+            if dist > max_dist:
+                max_dist = dist
+                index = i
+
+        if max_dist > tolerance:
+            keep[index] = True
+            stack[top, 0] = first
+            stack[top, 1] = index
+            stack[top + 1, 0] = index
+            stack[top + 1, 1] = last
+            top += 2
+
+    return path[keep]
+
+
+def _warm_up():
+    """Compile (or load from cache) the jitted functions ahead of first use"""
+    skel = np.zeros((3, 3), dtype=np.uint8)
+    skel[1, :] = 255
+    simplify_skeleton_path(longest_skeleton_path(skel), 1.0)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
\ No newline at end of file